@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""Response deserialization benchmark
+
+Deserializes a page of execution logs (the largest responses of the API)
+with the validating default path and with `trusted_responses`.
+
+Usage: python benchmarks/deserialization.py [rows] [repeats]
+
+"""
+
+import json
+import sys
+import timeit
+
+from scorable.api_client import ApiClient
+from scorable.generated.openapi_client.configuration import Configuration
+from scorable.serialization import JSON_BACKEND
+
+
+def execution_log(i: int) -> dict:
+    return {
+        "cost": 0.001 * i,
+        "created_at": "2024-01-02T03:04:05.123456Z",
+        "evaluation_context": {"request": "What is the capital of France?", "contexts": ["Paris is the capital."] * 3},
+        "executed_item_id": f"evaluator-{i}",
+        "executed_item_name": "Politeness",
+        "executed_item_version_id": f"version-{i}",
+        "execution_type": "skill",
+        "id": f"log-{i}",
+        "llm_output": "The response is polite. " * 20,
+        "owner": {"email": "owner@example.com", "full_name": "Owner"},
+        "parent_execution_log_id": None,
+        "score": 0.5,
+        "tags": ["production", "v2"],
+        "variables": {"response": "Hello there"},
+    }
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    body = json.dumps({"next": None, "previous": None, "results": [execution_log(i) for i in range(rows)]}).encode()
+
+    print(f"{rows} execution logs ({len(body) // 1024} KiB), JSON backend: {JSON_BACKEND}")
+    for trusted_responses in (False, True):
+        client = ApiClient(Configuration(), trusted_responses=trusted_responses)
+        seconds = min(
+            timeit.repeat(
+                lambda: client.deserialize(body, "PaginatedExecutionLogListList"),  # noqa: B023
+                number=1,
+                repeat=repeats,
+            )
+        )
+        print(f"trusted_responses={trusted_responses!s:5}: {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
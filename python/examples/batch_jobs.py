@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from scorable import Scorable
+from scorable.batch_jobs import iter_parquet
+
+# Connect to the Scorable API
+client = Scorable()
+
+
+def main():
+    # One JSON object per line, e.g. {"original_input": "...", "original_response": "..."}
+    samples = Path("samples.jsonl")
+
+    # Submits jobs of up to 10 000 samples, waits for them and streams their files to results/
+    for job in client.beta.batch_jobs.run(samples, "results", job_name="Nightly", timeout=3600):
+        # Reads the memory-mapped file batch by batch (requires the parquet extra)
+        for batch in iter_parquet(job.results):
+            print(f"{job.job.job_id}: {batch.num_rows} results")
+
+        if job.failures:
+            print(f"{job.job.job_id}: failures in {job.failures}")
@@ -0,0 +1,19 @@
+from scorable import Scorable
+
+# Connect to the Scorable API
+client = Scorable()
+
+
+def load_dataset():
+    # E.g. rows read lazily from a file or a database
+    yield {"request": "What is the capital of France?", "response": "Paris is the capital of France."}
+    yield {"request": "Summarize the report.", "response": "The report says revenue grew 10%.", "tags": ["nightly"]}
+
+
+def main():
+    # Runs the executions in parallel, adapting the parallelism to the load of the API
+    for run in client.evaluators.run_many(client.evaluators.Clarity, load_dataset()):
+        if run.ok:
+            print(f"Row {run.position}: {run.result.score}")
+        else:
+            print(f"Row {run.position} failed: {run.error}")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""Make the generated models package import its models on first use.
+
+The generated models/__init__.py imports every model, which takes most
+of the time of importing anything from the generated client. This
+rewrites it to a module __getattr__ (PEP 562) that imports the module of
+a model when the model is first accessed; type checkers still see the
+eager imports.
+
+Usage: lazy_models.py path/to/models/__init__.py
+"""
+
+import ast
+import sys
+
+TEMPLATE = """{header}
+# Models are imported on first access (see scripts/lazy_models.py)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+{imports}
+
+_MODULES = {{
+{modules}
+}}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(f"{{__name__}}.{{module}}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({{*globals(), *_MODULES}})
+"""
+
+
+def rewrite(source: str) -> str:
+    tree = ast.parse(source)
+    imports = [node for node in tree.body if isinstance(node, ast.ImportFrom)]
+    if not imports:
+        # Already rewritten
+        return source
+    lines = source.splitlines()
+    header = "\n".join(lines[: imports[0].lineno - 1]).replace("# import models into model package", "").rstrip()
+    modules = {alias.name: node.module.rsplit(".", 1)[-1] for node in imports for alias in node.names if node.module}
+    return TEMPLATE.format(
+        header=header + "\n",
+        imports="\n".join(f"    {ast.unparse(node)}" for node in imports),
+        modules="\n".join(f'    "{name}": "{module}",' for name, module in modules.items()),
+    )
+
+
+def main() -> None:
+    (path,) = sys.argv[1:]
+    with open(path) as f:
+        source = f.read()
+    with open(path, "w") as f:
+        f.write(rewrite(source))
+
+
+if __name__ == "__main__":
+    main()
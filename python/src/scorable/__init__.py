@@ -9,9 +9,23 @@ Example::
 
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __version__
-from .client import Scorable
+
+if TYPE_CHECKING:
+    from .client import Scorable
 
 # Note: PEP-396 was rejected but we provide __version__ anyway
 # ( https://peps.python.org/pep-0396/ )
 __all__ = ["__version__", "Scorable"]
+
+
+def __getattr__(name: str) -> Any:
+    # The client (and the HTTP stacks and generated code it uses) is only
+    # imported when used, so that `import scorable` stays cheap (PEP 562)
+    if name == "Scorable":
+        from .client import Scorable
+
+        return Scorable
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
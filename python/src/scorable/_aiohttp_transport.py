@@ -0,0 +1,91 @@
+"""aiohttp based transport of the asynchronous client.
+
+Imported on first use through :mod:`scorable.transport`, as importing
+aiohttp takes a while.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+import aiohttp_retry
+
+from .generated.openapi_aclient import rest as arest
+from .transport import RequestTimeout, _encode_json_body, _is_json_body, get_ssl_context
+
+
+class _FullJitterRetry(aiohttp_retry.ExponentialRetry):
+    """Exponential backoff with full jitter."""
+
+    def get_timeout(self, attempt: int, response: Optional[aiohttp.ClientResponse] = None) -> float:
+        return random.uniform(0, super().get_timeout(attempt, response))  # noqa: S311
+
+
+class AiohttpTransport(arest.RESTClientObject):
+    """aiohttp based transport of the asynchronous client.
+
+    Identical to the generated REST client, except that the SSL context
+    comes from :func:`get_ssl_context`, and that the retries of
+    `configuration.retries` back off (the generated client retries
+    immediately). See :mod:`scorable.retry` for the retry policy of the
+    Scorable client.
+    """
+
+    def __init__(self, configuration: Any) -> None:
+        ssl_context = get_ssl_context(
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            configuration.verify_ssl,
+        )
+        # maxsize is number of requests to host that are allowed in parallel
+        connector = aiohttp.TCPConnector(limit=configuration.connection_pool_maxsize, ssl=ssl_context)
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+        self.pool_manager = aiohttp.ClientSession(connector=connector, trust_env=True)
+
+        retries = configuration.retries
+        self.retry_client: Optional[aiohttp_retry.RetryClient]
+        if retries is not None:
+            self.retry_client = aiohttp_retry.RetryClient(
+                client_session=self.pool_manager,
+                retry_options=_FullJitterRetry(attempts=retries, start_timeout=0.25, factor=2.0, max_timeout=30.0),
+            )
+        else:
+            self.retry_client = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> arest.RESTResponse:
+        headers = headers or {}
+        if not _is_json_body(method, headers.get("Content-Type", "application/json"), body):
+            return await super().request(method, url, headers, body, post_params, _request_timeout)
+
+        method = method.upper()
+        if "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json"
+        args: Dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "timeout": _request_timeout or 5 * 60,
+            "headers": headers,
+            "data": _encode_json_body(body),
+        }
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+
+        pool_manager: Union[aiohttp.ClientSession, aiohttp_retry.RetryClient] = self.pool_manager
+        if self.retry_client is not None and method in arest.ALLOW_RETRY_METHODS:
+            pool_manager = self.retry_client
+        return arest.RESTResponse(await pool_manager.request(**args))
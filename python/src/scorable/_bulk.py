@@ -0,0 +1,143 @@
+"""Bounded fan-out of the bulk helpers.
+
+:func:`bounded_map` and :func:`abounded_map` call a function on every item
+of a (possibly unbounded) iterable in the slots of a concurrency limiter,
+and yield the outcomes in input order or as they complete. An error only
+fails its own item. At most twice the limiter's `max_limit` items are in
+progress, so that inputs are consumed as results are.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .concurrency import AdaptiveConcurrencyLimiter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Outcome(NamedTuple):
+    position: int
+    item: Any
+    result: Any
+    error: Optional[Exception]
+
+
+def _ready(pending: List[Any], ordered: bool) -> List[Any]:
+    """Remove and return the done futures of `pending`; in order, only those before the first pending one."""
+    if ordered:
+        count = next((i for i, future in enumerate(pending) if not future.done()), len(pending))
+        ready = pending[:count]
+    else:
+        ready = [future for future in pending if future.done()]
+    for future in ready:
+        pending.remove(future)
+    return ready
+
+
+def call_in_slot(func: Callable[[T], R], position: int, item: T, limiter: AdaptiveConcurrencyLimiter) -> Outcome:
+    """Call `func` on `item` in a slot of `limiter`, catching its error in the outcome."""
+    try:
+        with limiter.slot():
+            return Outcome(position, item, func(item), None)
+    except Exception as exc:
+        return Outcome(position, item, None, exc)
+
+
+def _take(pending: List[Future[Outcome]], ordered: bool, block: bool) -> List[Future[Outcome]]:
+    if block:
+        wait(pending[:1] if ordered else pending, return_when=FIRST_COMPLETED)
+    return _ready(pending, ordered)
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    limiter: AdaptiveConcurrencyLimiter,
+    *,
+    ordered: bool = True,
+) -> Iterator[Outcome]:
+    """Call `func` on `items` from threads, in the slots of `limiter`."""
+    window = 2 * limiter.max_limit
+    pending: List[Future[Outcome]] = []
+    with ThreadPoolExecutor(max_workers=limiter.max_limit) as executor:
+        try:
+            for position, item in enumerate(items):
+                pending.append(executor.submit(call_in_slot, func, position, item, limiter))
+                for future in _take(pending, ordered, block=len(pending) >= window):
+                    yield future.result()
+            while pending:
+                for future in _take(pending, ordered, block=True):
+                    yield future.result()
+        finally:
+            # The consumer stopped early
+            for future in pending:
+                future.cancel()
+
+
+async def acall_in_slot(
+    func: Callable[[T], Awaitable[R]], position: int, item: T, limiter: AdaptiveConcurrencyLimiter
+) -> Outcome:
+    """Await `func` on `item` in a slot of `limiter`, catching its error in the outcome."""
+    try:
+        async with limiter.aslot():
+            return Outcome(position, item, await func(item), None)
+    except Exception as exc:
+        return Outcome(position, item, None, exc)
+
+
+async def _atake(pending: List[asyncio.Task[Outcome]], ordered: bool, block: bool) -> List[asyncio.Task[Outcome]]:
+    if block:
+        await asyncio.wait(pending[:1] if ordered else pending, return_when=asyncio.FIRST_COMPLETED)
+    return _ready(pending, ordered)
+
+
+async def _aenumerate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[Tuple[int, T]]:
+    position = 0
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield position, item
+            position += 1
+    else:
+        for position, item in enumerate(items):
+            yield position, item
+
+
+async def abounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    limiter: AdaptiveConcurrencyLimiter,
+    *,
+    ordered: bool = True,
+) -> AsyncIterator[Outcome]:
+    """Await `func` on `items` (an iterable or async iterable) from tasks, in the slots of `limiter`."""
+    window = 2 * limiter.max_limit
+    pending: List[asyncio.Task[Outcome]] = []
+    try:
+        async for position, item in _aenumerate(items):
+            pending.append(asyncio.ensure_future(acall_in_slot(func, position, item, limiter)))
+            for task in await _atake(pending, ordered, block=len(pending) >= window):
+                yield task.result()
+        while pending:
+            for task in await _atake(pending, ordered, block=True):
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
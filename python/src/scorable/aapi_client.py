@@ -0,0 +1,44 @@
+"""Scorable specific subclass of the generated asynchronous API client."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .__about__ import __version__
+from ._aiohttp_transport import AiohttpTransport
+from .api_client import _SerializationMixin
+from .generated import openapi_aclient
+from .generated.openapi_aclient import exceptions as _async_exceptions
+from .generated.openapi_aclient.api_response import ApiResponse as _AApiResponse
+from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+from .transport import AsyncTransport
+
+
+class AApiClient(_SerializationMixin, openapi_aclient.ApiClient):
+    """Asynchronous API client.
+
+    Unlike the generated client, the transport is not hardwired: it
+    defaults to :class:`scorable.transport.AiohttpTransport`. With
+    `trusted_responses`, the response models are not validated.
+    """
+
+    rest_client: AsyncTransport  # type: ignore[assignment]
+    _api_response_cls = _AApiResponse
+    _exceptions = _async_exceptions
+
+    def __init__(
+        self,
+        configuration: _AConfiguration,
+        *,
+        transport: Optional[AsyncTransport] = None,
+        trusted_responses: bool = False,
+    ) -> None:
+        # Mirrors the generated constructor, minus building the generated
+        # REST client (which would open an aiohttp session of its own).
+        self.configuration = configuration
+        self.rest_client = transport if transport is not None else AiohttpTransport(configuration)
+        self.default_headers = {}
+        self.cookie = None
+        self.user_agent = f"rs-python-sdk/{__version__}"
+        self.client_side_validation = configuration.client_side_validation
+        self.trusted_responses = trusted_responses
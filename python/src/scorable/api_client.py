@@ -0,0 +1,237 @@
+"""Scorable specific subclass of the generated synchronous API client.
+
+The asynchronous one is in :mod:`scorable.aapi_client`, so that aiohttp is
+only imported when it is used.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from enum import Enum
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .__about__ import __version__
+from .generated import openapi_client
+from .generated.openapi_client import exceptions as _sync_exceptions
+from .generated.openapi_client import models as _models
+from .generated.openapi_client.api_response import ApiResponse as _ApiResponse
+from .generated.openapi_client.configuration import Configuration as _Configuration
+from .retry import with_idempotency_key
+from .serialization import encode_body, json_loads, model_converter
+from .transport import Transport, URLLib3Transport, _is_json_content_type
+
+_CHARSET_RE = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+_LIST_RE = re.compile(r"List\[(.*)]")
+_DICT_RE = re.compile(r"Dict\[([^,]*), (.*)]")
+
+Deserializer = Callable[[Any], Any]
+
+
+class _SerializationMixin:
+    """Request serialization and response deserialization of the API clients.
+
+    JSON request bodies are encoded to bytes by
+    :func:`scorable.serialization.encode_body`, in one pass, instead of
+    the generated `to_dict`, `sanitize_for_serialization` and transport
+    `json.dumps` passes.
+
+    The generated clients decode the response body to `str` before
+    parsing it; successful UTF-8 responses are parsed straight from the
+    body bytes instead, with the fast JSON backend. Everything else
+    (errors, files, other charsets) is left to the generated code.
+
+    The generated clients also interpret the response type string (e.g.
+    ``"List[EvaluatorResult]"``) again for every value of every response.
+    Each type string is instead compiled once into a tree of deserializer
+    functions (see :func:`_compile_deserializer`).
+
+    With `trusted_responses`, the response models are constructed without
+    pydantic validation (see :func:`scorable.serialization.construct_model`).
+
+    Executions and batch job creations get an idempotency key when the
+    caller did not provide one (see :func:`scorable.retry.with_idempotency_key`).
+    """
+
+    _api_response_cls: Any
+    _exceptions: ModuleType
+    trusted_responses: bool
+
+    def param_serialize(
+        self,
+        method: str,
+        resource_path: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[List[Tuple[str, Any]]] = None,
+        header_params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        auth_settings: Optional[List[str]] = None,
+        collection_formats: Optional[Dict[str, str]] = None,
+        _host: Optional[str] = None,
+        _request_auth: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        header_params = with_idempotency_key(method, resource_path, header_params)
+        # Same condition as in the generated code, and the transports send bytes as is
+        if body and _is_json_content_type((header_params or {}).get("Content-Type")):
+            body = encode_body(body)
+        return super().param_serialize(  # type: ignore[misc]
+            method,
+            resource_path,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=body,
+            post_params=post_params,
+            files=files,
+            auth_settings=auth_settings,
+            collection_formats=collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
+    def response_deserialize(self, response_data: Any, response_types_map: Optional[Dict[str, Any]] = None) -> Any:
+        status = response_data.status
+        response_type = (response_types_map or {}).get(str(status))
+        if (
+            response_data.data is None
+            or response_type in (None, "bytearray", "file")
+            or not 200 <= status <= 299
+            or _response_charset(response_data).lower() not in ("utf-8", "utf8")
+        ):
+            return super().response_deserialize(response_data, response_types_map)  # type: ignore[misc]
+
+        return self._api_response_cls(
+            status_code=status,
+            data=self.deserialize(response_data.data, response_type),
+            headers=response_data.getheaders(),
+            raw_data=response_data.data,
+        )
+
+    def deserialize(self, response_text: Any, response_type: Any) -> Any:
+        try:
+            data = json_loads(response_text)
+        except ValueError:
+            data = response_text.decode("utf-8") if isinstance(response_text, bytes) else response_text
+        return _compile_deserializer(response_type, self._exceptions, self.trusted_responses)(data)
+
+
+@lru_cache(maxsize=None)
+def _compile_deserializer(klass: Any, exceptions: ModuleType, trusted: bool) -> Deserializer:
+    """Compile the deserializer of `klass`, a type string or class.
+
+    The deserializers do what the private __deserialize of the generated
+    clients does, minus the type string interpretation.
+    """
+    if isinstance(klass, str):
+        if klass.startswith("List["):
+            m = _LIST_RE.match(klass)
+            assert m is not None, "Malformed List type definition"
+            item = _compile_deserializer(m.group(1), exceptions, trusted)
+            return lambda data: [item(v) for v in data] if data is not None else None
+
+        if klass.startswith("Dict["):
+            m = _DICT_RE.match(klass)
+            assert m is not None, "Malformed Dict type definition"
+            value = _compile_deserializer(m.group(2), exceptions, trusted)
+            return lambda data: {k: value(v) for k, v in data.items()} if data is not None else None
+
+        if klass in openapi_client.ApiClient.NATIVE_TYPES_MAPPING:
+            klass = openapi_client.ApiClient.NATIVE_TYPES_MAPPING[klass]
+        else:
+            # The models are shared by both clients
+            klass = getattr(_models, klass)
+
+    if klass in openapi_client.ApiClient.PRIMITIVE_TYPES:
+        return _primitive_deserializer(klass)
+    if klass is object:
+        return lambda data: data
+    if klass is datetime.date or klass is datetime.datetime:
+        return _date_deserializer(klass, exceptions)
+    if issubclass(klass, Enum):
+        return _enum_deserializer(klass, exceptions)
+    if trusted:
+        return model_converter(klass)
+    from_dict = klass.from_dict
+    return lambda data: from_dict(data) if data is not None else None
+
+
+def _primitive_deserializer(klass: type) -> Deserializer:
+    def deserialize(data: Any) -> Any:
+        if data is None:
+            return None
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return str(data)
+        except TypeError:
+            return data
+
+    return deserialize
+
+
+def _date_deserializer(klass: type, exceptions: ModuleType) -> Deserializer:
+    from dateutil.parser import parse
+
+    def deserialize(data: Any) -> Any:
+        if data is None:
+            return None
+        try:
+            value = parse(data)
+        except ValueError:
+            raise exceptions.ApiException(
+                status=0, reason=f"Failed to parse `{data}` as {klass.__name__} object"
+            ) from None
+        return value.date() if klass is datetime.date else value
+
+    return deserialize
+
+
+def _enum_deserializer(klass: type, exceptions: ModuleType) -> Deserializer:
+    def deserialize(data: Any) -> Any:
+        if data is None:
+            return None
+        try:
+            return klass(data)
+        except ValueError:
+            raise exceptions.ApiException(status=0, reason=f"Failed to parse `{data}` as `{klass}`") from None
+
+    return deserialize
+
+
+def _response_charset(response_data: Any) -> str:
+    content_type = response_data.getheader("content-type")
+    match = _CHARSET_RE.search(content_type) if content_type is not None else None
+    return match.group(1) if match else "utf-8"
+
+
+class ApiClient(_SerializationMixin, openapi_client.ApiClient):
+    """Synchronous API client.
+
+    Unlike the generated client, the transport is not hardwired: it
+    defaults to :class:`scorable.transport.URLLib3Transport`. With
+    `trusted_responses`, the response models are not validated.
+    """
+
+    rest_client: Transport  # type: ignore[assignment]
+    _api_response_cls = _ApiResponse
+    _exceptions = _sync_exceptions
+
+    def __init__(
+        self, configuration: _Configuration, *, transport: Optional[Transport] = None, trusted_responses: bool = False
+    ) -> None:
+        # Mirrors the generated constructor, minus building the generated
+        # REST client.
+        self.configuration = configuration
+        self.rest_client = transport if transport is not None else URLLib3Transport(configuration)
+        self.default_headers = {}
+        self.cookie = None
+        self.user_agent = f"rs-python-sdk/{__version__}"
+        self.client_side_validation = configuration.client_side_validation
+        self.trusted_responses = trusted_responses
+
+    def close(self) -> None:
+        self.rest_client.close()
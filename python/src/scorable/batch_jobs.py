@@ -0,0 +1,789 @@
+"""Batch evaluation jobs (beta).
+
+A batch evaluation job scores many samples offline: the samples are
+submitted in one request, queued and evaluated by the API, and the
+results (and failures) are then downloaded as Parquet files::
+
+  for job in client.beta.batch_jobs.run("samples.jsonl", "results", job_name="Nightly"):
+      for batch in iter_parquet(job.results):
+          ...
+
+Inputs larger than `samples_per_job` samples are split across several
+jobs, which the API processes concurrently.
+
+The files of large jobs do not fit in memory: :meth:`BatchJobs.run` and
+:meth:`BatchJobs.download` stream them to disk, and :func:`read_parquet`
+and :func:`iter_parquet` read them memory-mapped with pyarrow (the
+`parquet` extra, ``pip install 'scorable[parquet]'``). :meth:`BatchJobs.results`
+reads a file into memory instead, for small jobs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextlib import AbstractAsyncContextManager
+from functools import partial
+from itertools import chain, islice
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel, StrictStr
+
+from .generated.openapi_client import ApiClient
+from .generated.openapi_client.exceptions import NotFoundException
+from .generated.openapi_client.models.evaluation_batch_job_serializer import EvaluationBatchJobSerializer
+from .generated.openapi_client.models.evaluation_job_request_request import EvaluationJobRequestRequest
+from .generated.openapi_client.models.evaluation_job_response import EvaluationJobResponse
+from .generated.openapi_client.models.input_output_pair_input_request import InputOutputPairInputRequest
+from .generated.openapi_client.models.job_status import JobStatus
+from .generated.openapi_client.models.kind_enum import KindEnum
+from .generated.openapi_client.models.paginated_evaluation_batch_job_serializer_list import (
+    PaginatedEvaluationBatchJobSerializerList,
+)
+from .serialization import json_loads
+from .transport import aiter_body, iter_body
+from .utils import (
+    ClientContextCallable,
+    Poller,
+    deadline_after,
+    iterate_cursor_list,
+    lazy_import,
+    with_async_client,
+    with_sync_client,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.beta_api import BetaApi as ABetaApi
+    from .generated.openapi_client.api.beta_api import BetaApi
+    from .generated.openapi_client.api_client import RequestSerialized
+else:
+    # Imported on first use
+    ABetaApi = lazy_import("scorable.generated.openapi_aclient.api.beta_api", "BetaApi")
+    BetaApi = lazy_import("scorable.generated.openapi_client.api.beta_api", "BetaApi")
+
+BATCH_JOB_SIZE = 10_000
+"""Default maximum number of samples of a batch evaluation job."""
+
+BatchJobSample = Union[InputOutputPairInputRequest, Mapping[str, Any]]
+"""Sample of a batch evaluation job, as an `InputOutputPairInputRequest` or a dict of its fields."""
+
+BatchJobSamples = Union[Iterable[BatchJobSample], str, "os.PathLike[str]"]
+
+FileType = Literal["results", "failures"]
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+"""Size of the chunks of the downloaded files written at once, in bytes."""
+
+BATCH_JOB_TIMEOUT = 6 * 60 * 60.0
+"""Default time for batch evaluation jobs to finish, in seconds.
+
+The files of a job that failed are never found, so that waiting for them
+is given up after this time.
+"""
+
+
+class BatchJobError(Exception):
+    """Batch evaluation jobs were submitted, but could not all be submitted or processed.
+
+    Attributes:
+        jobs: The jobs submitted so far, which are processed (and billed) anyway.
+    """
+
+    def __init__(self, message: str, jobs: List[EvaluationJobResponse]) -> None:
+        super().__init__(message)
+        self.jobs = jobs
+
+
+class BatchJobResult(BaseModel):
+    """The files of a finished batch evaluation job."""
+
+    job: EvaluationJobResponse
+    results: Path
+    """Path of the Parquet file of the successful evaluations."""
+    failures: Optional[Path] = None
+    """Path of the Parquet file of the failed evaluations, if any."""
+
+
+def read_samples(path: Union[str, os.PathLike[str]]) -> Iterator[BatchJobSample]:
+    """Iterate through the samples of a JSON Lines file, one JSON object per line."""
+    with open(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                yield json_loads(line)
+
+
+def _import_pyarrow() -> ModuleType:
+    try:
+        # Also imports the `pyarrow.parquet` submodule
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires the parquet extra: pip install 'scorable[parquet]'") from e
+    return pyarrow
+
+
+def read_parquet(path: Union[str, os.PathLike[str]]) -> pyarrow.Table:
+    """Open a downloaded Parquet file as a memory-mapped `pyarrow.Table`.
+
+    Its columns are paged in from the file as they are used, instead of
+    being read into memory.
+    """
+    return _import_pyarrow().parquet.read_table(path, memory_map=True)
+
+
+def iter_parquet(path: Union[str, os.PathLike[str]], *, batch_size: int = 65_536) -> pyarrow.RecordBatchReader:
+    """Open a downloaded Parquet file as a `pyarrow.RecordBatchReader`, reading `batch_size` rows at a time."""
+    pa = _import_pyarrow()
+    file = pa.parquet.ParquetFile(path, memory_map=True)
+    return pa.RecordBatchReader.from_batches(file.schema_arrow, file.iter_batches(batch_size=batch_size))
+
+
+def _partial_path(path: Path) -> Path:
+    # Renamed once complete, so that an interrupted download is not taken for a file
+    return path.with_name(f"{path.name}.part")
+
+
+def _sample(item: BatchJobSample) -> InputOutputPairInputRequest:
+    if isinstance(item, InputOutputPairInputRequest):
+        return item
+    fields = dict(item)
+    fields.setdefault("kind", KindEnum.INPUT_OUTPUT_PAIR if "original_response" in fields else KindEnum.SINGLE_CONTENT)
+    return InputOutputPairInputRequest.model_validate(fields)
+
+
+def _chunks(samples: BatchJobSamples, size: int) -> Iterator[List[InputOutputPairInputRequest]]:
+    """Split the samples (or the samples of a file) into chunks of at most `size` samples."""
+    if isinstance(samples, (str, os.PathLike)):
+        samples = read_samples(samples)
+    iterator = map(_sample, samples)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _job_requests(
+    samples: BatchJobSamples,
+    size: int,
+    *,
+    job_name: Optional[str],
+    dataset_name: Optional[str],
+    drop_hints: bool,
+    fast_mode: bool,
+) -> Iterator[EvaluationJobRequestRequest]:
+    """Return the requests of the jobs of `samples`, numbering their names when there are several."""
+    chunks = _chunks(samples, size)
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError("No samples to evaluate")
+    second = next(chunks, None)
+    numbered = second is not None
+    parts = [first] if second is None else chain((first, second), chunks)
+    for number, chunk in enumerate(parts, 1):
+        yield EvaluationJobRequestRequest(
+            samples=chunk,
+            job_name=f"{job_name} ({number})" if job_name and numbered else job_name,
+            dataset_name=f"{dataset_name}-{number}" if dataset_name and numbered else dataset_name,
+            drop_hints=drop_hints,
+            fast_mode=fast_mode,
+        )
+
+
+def _results_request(api_instance: Union[BetaApi, ABetaApi], job_id: str, file_type: FileType) -> RequestSerialized:
+    # The generated *_without_preload_content methods return the response of
+    # the HTTP library instead of the one of the client transport
+    return api_instance._get_evaluation_batch_job_results_serialize(
+        job_id=job_id,
+        file_type=file_type,
+        _request_auth=None,
+        _content_type=None,
+        _headers=None,
+        _host_index=0,
+    )
+
+
+def _write(path: Path, chunks: Iterator[bytes]) -> Path:
+    partial_path = _partial_path(path)
+    try:
+        with open(partial_path, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(partial_path, path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+    return path
+
+
+async def _awrite(path: Path, chunks: AsyncIterator[bytes]) -> Path:
+    partial_path = _partial_path(path)
+    try:
+        with open(partial_path, "wb") as file:
+            async for chunk in chunks:
+                file.write(chunk)
+        os.replace(partial_path, path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+    return path
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _is_listed(api_instance: BetaApi, job_id: str, _request_timeout: Optional[int]) -> bool:
+    # The files of a job are not found until it is done, nor those of a job that does not exist
+    cursor: Optional[StrictStr] = None
+    while True:
+        result = api_instance.list_batch_evaluation_jobs(cursor=cursor, _request_timeout=_request_timeout)
+        if any(job.job_id == job_id for job in result.results):
+            return True
+        if not (cursor := result.next):
+            return False
+
+
+async def _ais_listed(api_instance: ABetaApi, job_id: str, _request_timeout: Optional[int]) -> bool:
+    cursor: Optional[StrictStr] = None
+    while True:
+        result: PaginatedEvaluationBatchJobSerializerList = await api_instance.list_batch_evaluation_jobs(
+            cursor=cursor, _request_timeout=_request_timeout
+        )
+        if any(job.job_id == job_id for job in result.results):
+            return True
+        if not (cursor := result.next):
+            return False
+
+
+def _raise_for_failed(jobs: List[EvaluationJobResponse]) -> None:
+    for job in jobs:
+        if job.status in (JobStatus.FAILED, JobStatus.CANCELLED):
+            raise BatchJobError(f"Batch evaluation job {job.job_id} {job.status.value}: {job.message}", jobs)
+
+
+class BatchJobs:
+    """
+    Batch evaluation jobs (sub) API (Beta)
+
+    Note:
+
+      The construction of the API instance should be handled by
+      accessing an attribute of a :class:`root.client.Scorable` instance.
+    """
+
+    def __init__(self, client_context: ClientContextCallable):
+        self.client_context = client_context
+
+    @with_sync_client
+    def create(
+        self,
+        samples: BatchJobSamples,
+        *,
+        job_name: Optional[str] = None,
+        dataset_name: Optional[str] = None,
+        drop_hints: bool = False,
+        fast_mode: bool = False,
+        samples_per_job: int = BATCH_JOB_SIZE,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> List[EvaluationJobResponse]:
+        """
+        Submit batch evaluation jobs.
+
+        The samples are split into jobs of at most `samples_per_job` samples;
+        when there are several jobs, their names are numbered. When a job
+        cannot be submitted after others were, BatchJobError is raised with
+        the jobs submitted so far.
+
+        Args:
+          samples: The samples, as `InputOutputPairInputRequest` or dicts of their fields (`kind`
+            defaults to `input_output_pair` when there is an `original_response`), or the path of
+            a JSON Lines file of samples.
+          job_name: Optional name of the jobs
+          dataset_name: Optional dataset name to set for the samples. Should be unique.
+          drop_hints: Whether to drop existing preference hints during evaluation
+          fast_mode: Whether to use fast agents for evaluation
+          samples_per_job: Maximum number of samples of a job
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = BetaApi(_client)
+        jobs: List[EvaluationJobResponse] = []
+        requests = _job_requests(
+            samples,
+            samples_per_job,
+            job_name=job_name,
+            dataset_name=dataset_name,
+            drop_hints=drop_hints,
+            fast_mode=fast_mode,
+        )
+        try:
+            for request in requests:
+                jobs.append(
+                    api_instance.create_batch_evaluation_job(
+                        evaluation_job_request_request=request, _request_timeout=_request_timeout
+                    )
+                )
+        except Exception as e:
+            if not jobs:
+                raise
+            raise BatchJobError(f"Submitted only {len(jobs)} batch evaluation jobs: {e}", jobs) from e
+        return jobs
+
+    @with_async_client
+    async def acreate(
+        self,
+        samples: BatchJobSamples,
+        *,
+        job_name: Optional[str] = None,
+        dataset_name: Optional[str] = None,
+        drop_hints: bool = False,
+        fast_mode: bool = False,
+        samples_per_job: int = BATCH_JOB_SIZE,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> List[EvaluationJobResponse]:
+        """
+        Asynchronously submit batch evaluation jobs.
+
+        The samples are split into jobs of at most `samples_per_job` samples;
+        when there are several jobs, their names are numbered. When a job
+        cannot be submitted after others were, BatchJobError is raised with
+        the jobs submitted so far.
+
+        Args:
+          samples: The samples, as `InputOutputPairInputRequest` or dicts of their fields (`kind`
+            defaults to `input_output_pair` when there is an `original_response`), or the path of
+            a JSON Lines file of samples.
+          job_name: Optional name of the jobs
+          dataset_name: Optional dataset name to set for the samples. Should be unique.
+          drop_hints: Whether to drop existing preference hints during evaluation
+          fast_mode: Whether to use fast agents for evaluation
+          samples_per_job: Maximum number of samples of a job
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = ABetaApi(_client)
+        jobs: List[EvaluationJobResponse] = []
+        requests = _job_requests(
+            samples,
+            samples_per_job,
+            job_name=job_name,
+            dataset_name=dataset_name,
+            drop_hints=drop_hints,
+            fast_mode=fast_mode,
+        )
+        try:
+            for request in requests:
+                jobs.append(
+                    await api_instance.create_batch_evaluation_job(
+                        evaluation_job_request_request=request, _request_timeout=_request_timeout
+                    )
+                )
+        except Exception as e:
+            if not jobs:
+                raise
+            raise BatchJobError(f"Submitted only {len(jobs)} batch evaluation jobs: {e}", jobs) from e
+        return jobs
+
+    @with_sync_client
+    def list(
+        self, *, limit: int = 100, _request_timeout: Optional[int] = None, _client: ApiClient
+    ) -> Iterator[EvaluationBatchJobSerializer]:
+        """
+        Iterate through the batch evaluation jobs.
+
+        Args:
+          limit: Number of entries to iterate through at most.
+        """
+        api_instance = BetaApi(_client)
+        yield from iterate_cursor_list(
+            partial(api_instance.list_batch_evaluation_jobs, _request_timeout=_request_timeout), limit=limit
+        )
+
+    async def alist(
+        self, *, limit: int = 100, _request_timeout: Optional[int] = None
+    ) -> AsyncIterator[EvaluationBatchJobSerializer]:
+        """
+        Asynchronously iterate through the batch evaluation jobs.
+
+        Args:
+          limit: Number of entries to iterate through at most.
+        """
+        context = self.client_context()
+        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
+        async with context as client:
+            api_instance = ABetaApi(client)
+            cursor: Optional[StrictStr] = None
+            while limit > 0:
+                result: PaginatedEvaluationBatchJobSerializerList = await api_instance.list_batch_evaluation_jobs(
+                    page_size=limit, cursor=cursor, _request_timeout=_request_timeout
+                )
+                if not result.results:
+                    return
+
+                used_results = result.results[:limit]
+                limit -= len(used_results)
+                for job in used_results:
+                    yield job
+
+                if not (cursor := result.next):
+                    return
+
+    @with_sync_client
+    def results(
+        self,
+        job_id: str,
+        *,
+        file_type: FileType = "results",
+        wait: bool = True,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> bytes:
+        """
+        Download a file of a batch evaluation job, as Parquet.
+
+        Args:
+          job_id: ID of the job
+          file_type: `results` for the successful evaluations, `failures` for the failed ones
+          wait: Whether to poll the file until the job is done, instead of raising NotFoundException
+            (which is raised anyway for unknown jobs)
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for the job to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = BetaApi(_client)
+        poller = Poller(f"Batch evaluation job {job_id}", poll_interval, max_poll_interval, deadline_after(timeout))
+        listed = False
+        while True:
+            try:
+                return api_instance.get_evaluation_batch_job_results(
+                    job_id=job_id, file_type=file_type, _request_timeout=_request_timeout
+                )
+            except NotFoundException:
+                if not wait or not (listed or _is_listed(api_instance, job_id, _request_timeout)):
+                    raise
+                listed = True
+            time.sleep(poller.delay())
+
+    @with_async_client
+    async def aresults(
+        self,
+        job_id: str,
+        *,
+        file_type: FileType = "results",
+        wait: bool = True,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> bytes:
+        """
+        Asynchronously download a file of a batch evaluation job, as Parquet.
+
+        Args:
+          job_id: ID of the job
+          file_type: `results` for the successful evaluations, `failures` for the failed ones
+          wait: Whether to poll the file until the job is done, instead of raising NotFoundException
+            (which is raised anyway for unknown jobs)
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for the job to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          _request_timeout: Optional timeout for each request
+        """
+        from .generated.openapi_aclient.exceptions import NotFoundException as ANotFoundException
+
+        api_instance = ABetaApi(_client)
+        poller = Poller(f"Batch evaluation job {job_id}", poll_interval, max_poll_interval, deadline_after(timeout))
+        listed = False
+        while True:
+            try:
+                return await api_instance.get_evaluation_batch_job_results(
+                    job_id=job_id, file_type=file_type, _request_timeout=_request_timeout
+                )
+            except ANotFoundException:
+                if not wait or not (listed or await _ais_listed(api_instance, job_id, _request_timeout)):
+                    raise
+                listed = True
+            await asyncio.sleep(poller.delay())
+
+    @with_sync_client
+    def download(
+        self,
+        job_id: str,
+        path: Union[str, os.PathLike[str]],
+        *,
+        file_type: FileType = "results",
+        wait: bool = True,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> Path:
+        """
+        Download a file of a batch evaluation job to `path`, as Parquet.
+
+        Unlike :meth:`results`, the file is streamed to disk in chunks instead
+        of being read into memory. Open it with :func:`read_parquet` or
+        :func:`iter_parquet`.
+
+        Args:
+          job_id: ID of the job
+          path: Path of the downloaded file, replaced once the download is complete
+          file_type: `results` for the successful evaluations, `failures` for the failed ones
+          wait: Whether to poll the file until the job is done, instead of raising NotFoundException
+            (which is raised anyway for unknown jobs)
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for the job to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          chunk_size: Size of the chunks written at once, in bytes
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = BetaApi(_client)
+        request = _results_request(api_instance, job_id, file_type)
+        poller = Poller(f"Batch evaluation job {job_id}", poll_interval, max_poll_interval, deadline_after(timeout))
+        listed = False
+        while True:
+            response = _client.call_api(*request, _request_timeout=_request_timeout)
+            if 200 <= response.status <= 299:
+                return _write(Path(path), iter_body(response, chunk_size))
+            response.read()
+            try:
+                # Raises the ApiException of the status
+                _client.response_deserialize(response_data=response, response_types_map={})
+            except NotFoundException:
+                if not wait or not (listed or _is_listed(api_instance, job_id, _request_timeout)):
+                    raise
+                listed = True
+            time.sleep(poller.delay())
+
+    @with_async_client
+    async def adownload(
+        self,
+        job_id: str,
+        path: Union[str, os.PathLike[str]],
+        *,
+        file_type: FileType = "results",
+        wait: bool = True,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> Path:
+        """
+        Asynchronously download a file of a batch evaluation job to `path`, as Parquet.
+
+        Unlike :meth:`results`, the file is streamed to disk in chunks instead
+        of being read into memory. Open it with :func:`read_parquet` or
+        :func:`iter_parquet`.
+
+        Args:
+          job_id: ID of the job
+          path: Path of the downloaded file, replaced once the download is complete
+          file_type: `results` for the successful evaluations, `failures` for the failed ones
+          wait: Whether to poll the file until the job is done, instead of raising NotFoundException
+            (which is raised anyway for unknown jobs)
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for the job to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          chunk_size: Size of the chunks written at once, in bytes
+          _request_timeout: Optional timeout for each request
+        """
+        from .generated.openapi_aclient.exceptions import NotFoundException as ANotFoundException
+
+        api_instance = ABetaApi(_client)
+        request = _results_request(api_instance, job_id, file_type)
+        poller = Poller(f"Batch evaluation job {job_id}", poll_interval, max_poll_interval, deadline_after(timeout))
+        listed = False
+        while True:
+            response = await _client.call_api(*request, _request_timeout=_request_timeout)
+            if 200 <= response.status <= 299:
+                return await _awrite(Path(path), aiter_body(response, chunk_size))
+            await response.read()
+            try:
+                # Raises the ApiException of the status
+                _client.response_deserialize(response_data=response, response_types_map={})
+            except ANotFoundException:
+                if not wait or not (listed or await _ais_listed(api_instance, job_id, _request_timeout)):
+                    raise
+                listed = True
+            await asyncio.sleep(poller.delay())
+
+    def run(
+        self,
+        samples: BatchJobSamples,
+        directory: Union[str, os.PathLike[str]],
+        *,
+        job_name: Optional[str] = None,
+        dataset_name: Optional[str] = None,
+        drop_hints: bool = False,
+        fast_mode: bool = False,
+        samples_per_job: int = BATCH_JOB_SIZE,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        _request_timeout: Optional[int] = None,
+    ) -> Iterator[BatchJobResult]:
+        """
+        Submit batch evaluation jobs, wait for them and download their files.
+
+        All the jobs are submitted first (see :meth:`create`), then the files
+        of each job are downloaded to `directory` once it is done, in order, as
+        `<job_id>.parquet` and `<job_id>-failures.parquet` (see :meth:`download`).
+        BatchJobError is raised, with all the jobs, when one of them failed.
+
+        Args:
+          samples: The samples, as `InputOutputPairInputRequest` or dicts of their fields (`kind`
+            defaults to `input_output_pair` when there is an `original_response`), or the path of
+            a JSON Lines file of samples.
+          directory: Directory of the downloaded files, created if needed
+          job_name: Optional name of the jobs
+          dataset_name: Optional dataset name to set for the samples. Should be unique.
+          drop_hints: Whether to drop existing preference hints during evaluation
+          fast_mode: Whether to use fast agents for evaluation
+          samples_per_job: Maximum number of samples of a job
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for all the jobs to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          chunk_size: Size of the chunks written at once, in bytes
+          _request_timeout: Optional timeout for each request
+        """
+        jobs = self.create(
+            samples,
+            job_name=job_name,
+            dataset_name=dataset_name,
+            drop_hints=drop_hints,
+            fast_mode=fast_mode,
+            samples_per_job=samples_per_job,
+            _request_timeout=_request_timeout,
+        )
+        _raise_for_failed(jobs)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        deadline = deadline_after(timeout)
+        for job in jobs:
+            results = self.download(
+                job.job_id,
+                directory / f"{job.job_id}.parquet",
+                poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
+                timeout=_remaining(deadline),
+                chunk_size=chunk_size,
+                _request_timeout=_request_timeout,
+            )
+            try:
+                failures: Optional[Path] = self.download(
+                    job.job_id,
+                    directory / f"{job.job_id}-failures.parquet",
+                    file_type="failures",
+                    wait=False,
+                    chunk_size=chunk_size,
+                    _request_timeout=_request_timeout,
+                )
+            except NotFoundException:
+                failures = None
+            yield BatchJobResult(job=job, results=results, failures=failures)
+
+    async def arun(
+        self,
+        samples: BatchJobSamples,
+        directory: Union[str, os.PathLike[str]],
+        *,
+        job_name: Optional[str] = None,
+        dataset_name: Optional[str] = None,
+        drop_hints: bool = False,
+        fast_mode: bool = False,
+        samples_per_job: int = BATCH_JOB_SIZE,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_JOB_TIMEOUT,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[BatchJobResult]:
+        """
+        Asynchronously submit batch evaluation jobs, wait for them and download their files.
+
+        All the jobs are submitted first (see :meth:`create`), then the files
+        of each job are downloaded to `directory` once it is done, in order, as
+        `<job_id>.parquet` and `<job_id>-failures.parquet` (see :meth:`download`).
+        BatchJobError is raised, with all the jobs, when one of them failed.
+
+        Args:
+          samples: The samples, as `InputOutputPairInputRequest` or dicts of their fields (`kind`
+            defaults to `input_output_pair` when there is an `original_response`), or the path of
+            a JSON Lines file of samples.
+          directory: Directory of the downloaded files, created if needed
+          job_name: Optional name of the jobs
+          dataset_name: Optional dataset name to set for the samples. Should be unique.
+          drop_hints: Whether to drop existing preference hints during evaluation
+          fast_mode: Whether to use fast agents for evaluation
+          samples_per_job: Maximum number of samples of a job
+          poll_interval: Delay before the first poll, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls, in seconds
+          timeout: Time for all the jobs to finish, in seconds, after which TimeoutError is raised
+            (None to wait indefinitely)
+          chunk_size: Size of the chunks written at once, in bytes
+          _request_timeout: Optional timeout for each request
+        """
+        from .generated.openapi_aclient.exceptions import NotFoundException as ANotFoundException
+
+        jobs = await self.acreate(
+            samples,
+            job_name=job_name,
+            dataset_name=dataset_name,
+            drop_hints=drop_hints,
+            fast_mode=fast_mode,
+            samples_per_job=samples_per_job,
+            _request_timeout=_request_timeout,
+        )
+        _raise_for_failed(jobs)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        deadline = deadline_after(timeout)
+        for job in jobs:
+            results = await self.adownload(
+                job.job_id,
+                directory / f"{job.job_id}.parquet",
+                poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
+                timeout=_remaining(deadline),
+                chunk_size=chunk_size,
+                _request_timeout=_request_timeout,
+            )
+            try:
+                failures: Optional[Path] = await self.adownload(
+                    job.job_id,
+                    directory / f"{job.job_id}-failures.parquet",
+                    file_type="failures",
+                    wait=False,
+                    chunk_size=chunk_size,
+                    _request_timeout=_request_timeout,
+                )
+            except ANotFoundException:
+                failures = None
+            yield BatchJobResult(job=job, results=results, failures=failures)
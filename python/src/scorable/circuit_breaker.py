@@ -0,0 +1,245 @@
+"""Per-endpoint circuit breaking.
+
+A :class:`CircuitBreaker` passed to the client stops sending requests to
+an endpoint that keeps failing, so that callers fail fast with
+:class:`CircuitOpenError` instead of tying up their workers until the
+request times out::
+
+  client = Scorable(circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_time=30))
+
+The requests are grouped by endpoint (see :func:`endpoint_of`): the
+executions (``"execute"``), the listings (``"list"``), the retrievals of
+one object (``"retrieve"``), the datasets (``"datasets"``, including their
+uploads) and the others (``"other"``). Each endpoint has a circuit:
+
+- closed: requests are sent; `failure_threshold` consecutive failures
+  (connection errors, timeouts and 5xx responses) open it,
+- open: requests fail with :class:`CircuitOpenError`; after `recovery_time`
+  seconds the circuit is half-open,
+- half-open: up to `half_open_requests` requests are sent to probe the
+  endpoint; a success closes the circuit, and a failure opens it again.
+
+A request that hangs would neither succeed nor fail, so the requests sent
+without a `_request_timeout` time out after the `request_timeout` of the
+breaker instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Literal, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .retry import _sync_errors
+from .transport import AsyncTransport, AsyncTransportResponse, RequestTimeout, Transport, TransportResponse
+
+State = Literal["closed", "open", "half_open"]
+
+# UUIDs and numeric IDs
+_ID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|\d+")
+
+
+class CircuitOpenError(Exception):
+    """The circuit of the endpoint is open: the request was not sent.
+
+    Attributes:
+        endpoint: Endpoint of the request (see :func:`endpoint_of`).
+        retry_after: Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(f"Circuit of the {endpoint} endpoint is open, retry after {retry_after:.3f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def endpoint_of(method: str, url: str) -> str:
+    """Return the endpoint of a request: ``"datasets"``, ``"execute"``, ``"list"``, ``"retrieve"`` or ``"other"``."""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if "datasets" in segments:
+        return "datasets"
+    if any("execute" in segment for segment in segments):
+        return "execute"
+    if method.upper() in ("GET", "HEAD"):
+        return "retrieve" if segments and _ID_RE.fullmatch(segments[-1]) else "list"
+    return "other"
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state: State = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker of the endpoints of a client. Thread-safe.
+
+    Args:
+        failure_threshold: Consecutive failures opening the circuit of an endpoint.
+        recovery_time: Seconds an open circuit waits before letting probe requests through.
+        half_open_requests: Probe requests sent at a time by a half-open circuit.
+        thresholds: Failure thresholds of specific endpoints, e.g. ``{"execute": 3}``.
+        request_timeout: Timeout of the requests sent without a `_request_timeout`, in seconds,
+          so that hung requests count as failures; None to wait for them indefinitely.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        *,
+        recovery_time: float = 30.0,
+        half_open_requests: int = 1,
+        thresholds: Optional[Mapping[str, int]] = None,
+        request_timeout: Optional[float] = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1 or half_open_requests < 1:
+            raise ValueError("failure_threshold and half_open_requests must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_requests = half_open_requests
+        self.thresholds = dict(thresholds or {})
+        self.request_timeout = request_timeout
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+        if circuit.state == "open" and self._clock() - circuit.opened_at >= self.recovery_time:
+            circuit.state = "half_open"
+            circuit.probes = 0
+        return circuit
+
+    def state(self, endpoint: str) -> State:
+        """Return the state of the circuit of `endpoint`."""
+        with self._lock:
+            return self._circuit(endpoint).state
+
+    def before_request(self, endpoint: str) -> None:
+        """Let a request to `endpoint` through, or raise :class:`CircuitOpenError`."""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == "closed":
+                return
+            if circuit.state == "half_open" and circuit.probes < self.half_open_requests:
+                circuit.probes += 1
+                return
+            retry_after = max(0.0, circuit.opened_at + self.recovery_time - self._clock())
+        raise CircuitOpenError(endpoint, retry_after)
+
+    def after_request(self, endpoint: str, failed: Optional[bool]) -> None:
+        """Record the outcome of a request let through by :meth:`before_request`.
+
+        `failed` is None when the outcome says nothing of the endpoint (e.g.
+        the request was not sent).
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == "half_open":
+                circuit.probes = max(0, circuit.probes - 1)
+            if failed is None:
+                return
+            if not failed:
+                circuit.state = "closed"
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            threshold = self.thresholds.get(endpoint, self.failure_threshold)
+            if circuit.state == "half_open" or circuit.failures >= threshold:
+                circuit.state = "open"
+                circuit.opened_at = self._clock()
+
+    @contextmanager
+    def guard(self, endpoint: str) -> Iterator[Callable[[int], None]]:
+        """Send the request to `endpoint` of the block through the breaker.
+
+        The block calls the yielded function with the response status;
+        connection errors and timeouts raised by it count as failures.
+        """
+        self.before_request(endpoint)
+        recorded = False
+
+        def record(status: int) -> None:
+            nonlocal recorded
+            recorded = True
+            self.after_request(endpoint, status >= 500)
+
+        try:
+            yield record
+        except BaseException as exc:
+            if not recorded:
+                self.after_request(endpoint, True if is_connection_error(exc) else None)
+            raise
+        if not recorded:
+            self.after_request(endpoint, None)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """Whether `exc` is a connection error or timeout of one of the HTTP stacks."""
+    errors = (*_sync_errors(), asyncio.TimeoutError)
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        errors += (aiohttp.ClientConnectionError,)
+    return isinstance(exc, errors)
+
+
+class CircuitBreakerTransport:
+    """Synchronous transport sending the requests of `transport` through `breaker`."""
+
+    def __init__(self, transport: Transport, breaker: CircuitBreaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> TransportResponse:
+        with self.breaker.guard(endpoint_of(method, url)) as record:
+            timeout = _request_timeout or self.breaker.request_timeout
+            response = self.transport.request(method, url, headers, body, post_params, timeout)
+            record(response.status)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCircuitBreakerTransport:
+    """Asynchronous transport sending the requests of `transport` through `breaker`."""
+
+    def __init__(self, transport: AsyncTransport, breaker: CircuitBreaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncTransportResponse:
+        with self.breaker.guard(endpoint_of(method, url)) as record:
+            timeout = _request_timeout or self.breaker.request_timeout
+            response = await self.transport.request(method, url, headers, body, post_params, timeout)
+            record(response.status)
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
@@ -1,34 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import textwrap
+import threading
 from contextlib import asynccontextmanager, contextmanager
-from functools import cached_property
+from functools import cached_property, partial
 from typing import (
     TYPE_CHECKING,
     AsyncContextManager,
     AsyncGenerator,
     Callable,
     ContextManager,
+    Dict,
     Generator,
     Optional,
+    Tuple,
     Type,
     Union,
+    cast,
 )
 
-from .__about__ import __version__
-from .generated import openapi_aclient, openapi_client
-from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
-from .generated.openapi_client.configuration import Configuration as _Configuration
-
 if TYPE_CHECKING:
+    from .aapi_client import AApiClient
+    from .api_client import ApiClient
+    from .batch_jobs import BatchJobs
+    from .circuit_breaker import CircuitBreaker
+    from .concurrency import AdaptiveConcurrencyLimiter
     from .datasets import DataSets
     from .execution_logs import ExecutionLogs
+    from .generated import openapi_aclient, openapi_client
+    from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+    from .generated.openapi_client.configuration import Configuration as _Configuration
+    from .hedging import HedgingPolicy
     from .judges import Judges
     from .models import Models
     from .objectives import Objectives
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
     from .skills import Evaluators
+    from .transport import AsyncTransport, Transport, TransportFactory
+
+
+# Incremented in forked child processes, so that connection pools
+# inherited from the parent process get replaced instead of shared with it.
+_fork_generation = 0
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
 
 
 def _get_api_key(*, dot_env: str = ".env") -> str:
@@ -49,6 +75,65 @@ def _get_api_key(*, dot_env: str = ".env") -> str:
     )
 
 
+class _AsyncClientRegistry:
+    """Asynchronous API clients of a Scorable instance, one per event loop.
+
+    aiohttp sessions are bound to the event loop they were created in, so a
+    client shared between loops (e.g. per-test loops, or worker threads each
+    calling `asyncio.run`) keeps a separate pooled session for each of them.
+
+    The sessions are created lazily, and closed when their loop shuts down
+    its asynchronous generators (as `asyncio.run` does on exit).
+
+    The clients are keyed by `id(loop)` rather than by the loop itself:
+    they hold references to their loop, so a weak key would never expire.
+    An entry is removed instead when its session is closed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[
+            int,
+            Tuple[asyncio.AbstractEventLoop, AApiClient, AsyncGenerator[None, None]],
+        ] = {}
+
+    async def _close_at_shutdown(self, key: int, client: AApiClient) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                # Unless already replaced by a new client of a reused id
+                if key in self._clients and self._clients[key][1] is client:
+                    del self._clients[key]
+            await client.close()
+
+    async def get(self, factory: Callable[[], AApiClient]) -> AApiClient:
+        loop = asyncio.get_running_loop()
+        key = id(loop)
+        entry = self._clients.get(key)
+        if entry is None:
+            client = factory()
+            closer = self._close_at_shutdown(key, client)
+            # Starting the generator registers it with the running loop, so
+            # that loop.shutdown_asyncgens() finalizes it (and the session).
+            await closer.asend(None)
+            entry = (loop, client, closer)
+            with self._lock:
+                self._clients[key] = entry
+        return entry[1]
+
+    async def aclose(self) -> None:
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        current_loop = asyncio.get_running_loop()
+        for loop, _, closer in entries:
+            if loop is current_loop:
+                await closer.aclose()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(loop.create_task, closer.aclose())
+
+
 class Beta:
     """Beta API features namespace"""
 
@@ -68,6 +153,13 @@ class Beta:
 
         return Judges(self._get_client_context)
 
+    @cached_property
+    def batch_jobs(self) -> BatchJobs:
+        """Get batch evaluation jobs API (Beta)"""
+        from .batch_jobs import BatchJobs
+
+        return BatchJobs(self._get_client_context)
+
 
 class Scorable:
     """Scorable API Python client.
@@ -78,9 +170,47 @@ class Scorable:
     2. environment variable `SCORABLE_API_KEY`, or
     3. .env file containing `SCORABLE_API_KEY=`
 
+    The client keeps one connection pool for its whole lifetime, so that
+    consecutive calls reuse keep-alive connections. The synchronous pool is
+    thread-safe and is released with :meth:`close`, or by using the client as a
+    context manager::
+
+      with Scorable() as client:
+          client.evaluators.Politeness(response="...")
+
+    The asynchronous client shares one aiohttp session (and connector) between
+    all sub-APIs, released with :meth:`aclose` or ``async with``::
+
+      async with Scorable(run_async=True) as client:
+          await client.evaluators.Politeness(response="...")
+
+    The pools are rebuilt transparently in forked child processes, so a
+    client created before forking (e.g. gunicorn ``preload_app``) can be
+    used by the workers as is.
+
     Args:
         api_key: Scorable API Key (if not provided from environment)
         run_async: Whether to run the API client asynchronously
+        http2: Whether to use HTTP/2, which multiplexes concurrent requests over
+          a few connections. Requires the `http2` extra (``pip install 'scorable[http2]'``).
+        transport: Factory of the HTTP transport, called with the configuration of the
+          generated client. It must return a :class:`scorable.transport.Transport`, or a
+          :class:`scorable.transport.AsyncTransport` when `run_async` is set. The client
+          closes the transports it creates.
+        trusted_responses: Whether to build the response models without validating them,
+          which is considerably faster for large responses (e.g. execution log listings).
+          Invalid responses are not detected.
+        rate_limit: Client-side rate limiter, shared by all the sub-APIs, threads and
+          event loops using the client (see :mod:`scorable.rate_limit`).
+        retry: Retry policy of the requests that fail transiently (see :mod:`scorable.retry`);
+          requests are not retried by default.
+        concurrency: Concurrency limiter of the bulk helpers (e.g. `evaluators.calibrate_batch`),
+          adapting the number of requests in flight to the load of the API (see
+          :mod:`scorable.concurrency`). Its `limit` is the current number.
+        circuit_breaker: Circuit breaker failing the requests to failing endpoints fast with
+          :class:`scorable.circuit_breaker.CircuitOpenError` (see :mod:`scorable.circuit_breaker`).
+        hedging: Hedging policy of the GET requests, sending a second request when the first
+          one is slow (see :mod:`scorable.hedging`); requests are not hedged by default.
     """
 
     def __init__(
@@ -90,8 +220,30 @@ class Scorable:
         run_async: bool = False,
         _api_client: Union[Optional[openapi_aclient.ApiClient], Optional[openapi_client.ApiClient]] = None,
         base_url: Optional[str] = None,
+        http2: bool = False,
+        transport: Optional[TransportFactory] = None,
+        trusted_responses: bool = False,
+        rate_limit: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
+        if http2 and transport is not None:
+            raise ValueError("http2 and transport cannot be used together")
         self.run_async = run_async
+        self.http2 = http2
+        self.transport = transport
+        self.trusted_responses = trusted_responses
+        self.rate_limit = rate_limit
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        if concurrency is None:
+            from .concurrency import AdaptiveConcurrencyLimiter
+
+            concurrency = AdaptiveConcurrencyLimiter()
+        self.concurrency = concurrency
         if api_key is None:
             api_key = _get_api_key()
         if base_url is None:
@@ -99,6 +251,140 @@ class Scorable:
         self.base_url = base_url
         self.api_key = api_key
         self._api_client_arg = _api_client
+        self._sync_client: Optional[ApiClient] = None
+        self._sync_client_lock = threading.Lock()
+        self._async_clients = _AsyncClientRegistry()
+        self._fork_generation = _fork_generation
+
+    def __enter__(self) -> Scorable:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the pooled connections of the synchronous client.
+
+        The client remains usable; a new pool is created on the next call.
+        """
+        with self._sync_client_lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
+    async def __aenter__(self) -> Scorable:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the aiohttp sessions of the asynchronous client.
+
+        Sessions that belong to other running event loops are closed
+        within those loops. The client remains usable; a new session is
+        created on the next call.
+        """
+        await self._async_clients.aclose()
+
+    def _reset_pools_after_fork(self) -> None:
+        if self._fork_generation == _fork_generation:
+            return
+        # The inherited sockets are still used by the parent process, so the
+        # pools are abandoned rather than closed. The lock is replaced too, as
+        # some other thread of the parent may have held it when forking.
+        self._fork_generation = _fork_generation
+        self._sync_client_lock = threading.Lock()
+        self._sync_client = None
+        self._async_clients = _AsyncClientRegistry()
+
+    def _get_sync_client(self, config: _Configuration) -> ApiClient:
+        self._reset_pools_after_fork()
+        # Double-checked so that the common path does not take the lock
+        client = self._sync_client
+        if client is None:
+            with self._sync_client_lock:
+                client = self._sync_client
+                if client is None:
+                    client = self._sync_client = self._create_sync_client(config)
+        return client
+
+    def _create_sync_client(self, config: _Configuration) -> ApiClient:
+        from .api_client import ApiClient
+
+        return ApiClient(
+            config, transport=self._create_sync_transport(config), trusted_responses=self.trusted_responses
+        )
+
+    def _create_sync_transport(self, config: _Configuration) -> Transport:
+        from .transport import HTTPXTransport, URLLib3Transport
+
+        transport: Transport
+        if self.transport is not None:
+            transport = cast("Transport", self.transport(config))
+        elif self.http2:
+            transport = HTTPXTransport(config)
+        else:
+            transport = URLLib3Transport(config)
+        if self.rate_limit is not None:
+            from .rate_limit import RateLimitedTransport
+
+            transport = RateLimitedTransport(transport, self.rate_limit)
+        if self.circuit_breaker is not None:
+            from .circuit_breaker import CircuitBreakerTransport
+
+            # Outside the rate limiter, so that open circuits fail without waiting for a token
+            transport = CircuitBreakerTransport(transport, self.circuit_breaker)
+        if self.hedging is not None:
+            from .hedging import HedgedTransport
+
+            transport = HedgedTransport(transport, self.hedging)
+        if self.retry is not None:
+            from .retry import RetryTransport
+
+            # Outermost, so that every attempt goes through the rate limiter
+            transport = RetryTransport(transport, self.retry, self.concurrency)
+        return transport
+
+    async def _get_async_client(self, config: _AConfiguration) -> AApiClient:
+        self._reset_pools_after_fork()
+        return await self._async_clients.get(partial(self._create_async_client, config))
+
+    def _create_async_client(self, config: _AConfiguration) -> AApiClient:
+        from .aapi_client import AApiClient
+
+        return AApiClient(
+            config, transport=self._create_async_transport(config), trusted_responses=self.trusted_responses
+        )
+
+    def _create_async_transport(self, config: _AConfiguration) -> AsyncTransport:
+        from .transport import AiohttpTransport, AsyncHTTPXTransport
+
+        transport: AsyncTransport
+        if self.transport is not None:
+            transport = cast("AsyncTransport", self.transport(config))
+        elif self.http2:
+            transport = AsyncHTTPXTransport(config)
+        else:
+            transport = AiohttpTransport(config)
+        if self.rate_limit is not None:
+            from .rate_limit import AsyncRateLimitedTransport
+
+            transport = AsyncRateLimitedTransport(transport, self.rate_limit)
+        if self.circuit_breaker is not None:
+            from .circuit_breaker import AsyncCircuitBreakerTransport
+
+            # Outside the rate limiter, so that open circuits fail without waiting for a token
+            transport = AsyncCircuitBreakerTransport(transport, self.circuit_breaker)
+        if self.hedging is not None:
+            from .hedging import AsyncHedgedTransport
+
+            transport = AsyncHedgedTransport(transport, self.hedging)
+        if self.retry is not None:
+            from .retry import AsyncRetryTransport
+
+            transport = AsyncRetryTransport(transport, self.retry, self.concurrency)
+        return transport
 
     @cached_property
     def get_client_context(
@@ -107,16 +393,12 @@ class Scorable:
         Callable[[], AsyncContextManager[openapi_aclient.ApiClient]],
         Callable[[], ContextManager[openapi_client.ApiClient]],
     ]:
-        if self._api_client_arg is not None:
-            if isinstance(self._api_client_arg, openapi_aclient.ApiClient):
+        # The generated clients are imported here, so that the asynchronous
+        # one (and aiohttp) is only imported when used
+        from .generated import openapi_client
 
-                @asynccontextmanager
-                async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
-                    assert isinstance(self._api_client_arg, openapi_aclient.ApiClient)
-                    yield self._api_client_arg
-
-                return async_client_context
-            else:
+        if self._api_client_arg is not None:
+            if isinstance(self._api_client_arg, openapi_client.ApiClient):
 
                 @contextmanager
                 def sync_client_context() -> Generator[openapi_client.ApiClient, None, None]:
@@ -124,9 +406,24 @@ class Scorable:
                     yield self._api_client_arg
 
                 return sync_client_context
+            else:
+
+                @asynccontextmanager
+                async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
+                    assert self._api_client_arg is not None
+                    assert not isinstance(self._api_client_arg, openapi_client.ApiClient)
+                    yield self._api_client_arg
+
+                return async_client_context
 
         if self.run_async:
+            from .generated import openapi_aclient
+            from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+
             return self._configure_client_context(openapi_aclient.ApiClient, _AConfiguration)
+
+        from .generated.openapi_client.configuration import Configuration as _Configuration
+
         return self._configure_client_context(openapi_client.ApiClient, _Configuration)
 
     def _configure_client_context(
@@ -140,38 +437,44 @@ class Scorable:
         config = config_cls(host=self.base_url)
         config.api_key["publicApiKey"] = f"Api-Key {self.api_key}"
 
-        if issubclass(client_cls, openapi_aclient.ApiClient):
+        from .generated import openapi_client
 
-            @asynccontextmanager
-            async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
-                async with client_cls(config) as client:
-                    client.user_agent = f"rs-python-sdk/{__version__}"
-                    yield client
-
-            return async_client_context
-        else:
+        if issubclass(client_cls, openapi_client.ApiClient):
+            sync_config = cast("_Configuration", config)
 
             @contextmanager
             def sync_client_context() -> Generator[openapi_client.ApiClient, None, None]:
-                with client_cls(config) as client:
-                    client.user_agent = f"rs-python-sdk/{__version__}"
-                    yield client
+                yield self._get_sync_client(sync_config)
 
             return sync_client_context
+        else:
+            async_config = cast("_AConfiguration", config)
+
+            @asynccontextmanager
+            async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
+                yield await self._get_async_client(async_config)
+
+            return async_client_context
 
     @cached_property
     def datasets(self) -> DataSets:
         """Get DataSets API"""
         from .datasets import DataSets
 
-        return DataSets(self.get_client_context, self.base_url, self.api_key)
+        return DataSets(
+            self.get_client_context,
+            self.base_url,
+            self.api_key,
+            rate_limit=self.rate_limit,
+            circuit_breaker=self.circuit_breaker,
+        )
 
     @cached_property
     def evaluators(self) -> Evaluators:
         """Get Evaluators API"""
         from .skills import Evaluators
 
-        return Evaluators(self.get_client_context)
+        return Evaluators(self.get_client_context, concurrency=self.concurrency)
 
     @cached_property
     def execution_logs(self) -> ExecutionLogs:
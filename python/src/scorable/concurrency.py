@@ -0,0 +1,216 @@
+"""Adaptive concurrency limiting of bulk workloads.
+
+The bulk helpers of the client (e.g. :meth:`scorable.skills.Evaluators.calibrate_batch`)
+run their requests in slots of the client's :class:`AdaptiveConcurrencyLimiter`,
+instead of with a fixed number of workers::
+
+  client = Scorable(concurrency=AdaptiveConcurrencyLimiter(4, max_limit=32))
+  client.evaluators.calibrate_batch(...)
+  print(client.concurrency.limit)
+
+The limit follows an AIMD (additive increase, multiplicative decrease)
+scheme, as TCP congestion control does: every request completing within
+`latency_tolerance` times the smoothed latency raises the limit by
+``1 / limit`` (one slot per "round" of requests), and a throttled or failed
+request (429, 5xx, connection errors and timeouts) or a latency spike
+multiplies it by `backoff`, at most once per smoothed latency. The attempts
+retried by the client's retry policy (see :mod:`scorable.retry`) count as
+throttled too, though the request eventually succeeds.
+
+The same limiter can be used by user code fanning requests out, from
+threads or event loops::
+
+  with client.concurrency.slot():
+      client.evaluators.run(...)
+
+  async with client.concurrency.aslot():
+      await client.evaluators.arun(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Deque, Iterator, Optional, Tuple
+
+from .circuit_breaker import CircuitOpenError, is_connection_error
+from .rate_limit import RateLimitError, RequestDroppedError
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter, shared between threads and event loops.
+
+    Args:
+        initial: Initial limit.
+        min_limit: Lowest limit.
+        max_limit: Highest limit.
+        backoff: Factor applied to the limit on throttling, errors and latency spikes.
+        latency_tolerance: Latency, relative to the smoothed latency, above which a
+          request counts as a latency spike.
+        smoothing: Weight of each latency sample in the smoothed latency.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("1 <= min_limit <= initial <= max_limit must hold")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._clock = clock
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._decreased_at = float("-inf")
+        self._condition = threading.Condition()
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+
+    @classmethod
+    def fixed(cls, limit: int) -> AdaptiveConcurrencyLimiter:
+        """Return a limiter keeping `limit` requests in flight."""
+        return cls(limit, min_limit=limit, max_limit=limit)
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency of the requests, in seconds."""
+        return self._latency
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def _wake(self) -> None:
+        self._condition.notify_all()
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            loop, waiter = self._waiters.popleft()
+            loop.call_soon_threadsafe(_set_done, waiter)
+            free -= 1
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def aacquire(self) -> None:
+        """Asynchronously wait for a free slot and take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._condition:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                    # The wakeup may have been for this waiter
+                    self._wake()
+                raise
+
+    def release(self, latency: Optional[float] = None, *, overloaded: bool = False) -> None:
+        """Free a slot, adjusting the limit to the `latency` of its request, or to it being `overloaded`."""
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or latency is not None:
+                self._adjust(latency, overloaded)
+            self._wake()
+
+    def overloaded(self) -> None:
+        """Lower the limit for an overload signal that does not end a request (e.g. a retried 429)."""
+        with self._condition:
+            self._adjust(None, True)
+
+    def _adjust(self, latency: Optional[float], overloaded: bool) -> None:
+        spike = latency is not None and self._latency is not None and latency > self._latency * self.latency_tolerance
+        if overloaded or spike:
+            # One decrease per round of requests, not one per request of the round
+            now = self._clock()
+            if now - self._decreased_at >= (self._latency or 0):
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._decreased_at = now
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        if latency is not None and not overloaded:
+            self._latency = (
+                latency if self._latency is None else self._latency + self.smoothing * (latency - self._latency)
+            )
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Run the request(s) of the block in a slot."""
+        self.acquire()
+        started = self._clock()
+        try:
+            yield
+        except BaseException as exc:
+            self._release_after(exc)
+            raise
+        self.release(self._clock() - started)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Asynchronously run the request(s) of the block in a slot."""
+        await self.aacquire()
+        started = self._clock()
+        try:
+            yield
+        except BaseException as exc:
+            self._release_after(exc)
+            raise
+        self.release(self._clock() - started)
+
+    def _release_after(self, exc: BaseException) -> None:
+        if is_overload_error(exc):
+            self.release(overloaded=True)
+        else:
+            # Says nothing of the load of the API
+            self.release()
+
+
+def _set_done(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """Whether `exc` signals an overloaded API: throttling, server and connection errors, timeouts, open circuits."""
+    if isinstance(exc, (RateLimitError, RequestDroppedError, CircuitOpenError)):
+        return True
+    # ApiException of both generated clients
+    status = getattr(exc, "status", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return is_connection_error(exc)
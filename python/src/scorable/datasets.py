@@ -1,24 +1,31 @@
-from contextlib import AbstractAsyncContextManager
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager, nullcontext
 from functools import partial
-from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, ContextManager, Dict, Iterator, Optional
 
-import aiohttp
-import requests
 from pydantic import StrictStr
 
 from scorable.generated.openapi_client.api_client import ApiClient
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.datasets_api import DatasetsApi as ADatasetsApi
-from .generated.openapi_aclient.models.data_set_create import DataSetCreate as ADataSetCreate
-from .generated.openapi_aclient.models.data_set_list import DataSetList as ADataSetList
-from .generated.openapi_aclient.models.paginated_data_set_list_list import (
-    PaginatedDataSetListList as APaginatedDataSetListList,
-)
-from .generated.openapi_client.api.datasets_api import DatasetsApi as DatasetsApi
 from .generated.openapi_client.models.data_set_create import DataSetCreate
 from .generated.openapi_client.models.data_set_list import DataSetList
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .generated.openapi_client.models.paginated_data_set_list_list import (
+    PaginatedDataSetListList,
+)
+from .transport import get_ssl_context
+from .utils import ClientContextCallable, iterate_cursor_list, lazy_import, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.datasets_api import DatasetsApi as ADatasetsApi
+    from .generated.openapi_client.api.datasets_api import DatasetsApi
+    from .rate_limit import RateLimiter
+else:
+    # Imported on first use
+    ADatasetsApi = lazy_import("scorable.generated.openapi_aclient.api.datasets_api", "DatasetsApi")
+    DatasetsApi = lazy_import("scorable.generated.openapi_client.api.datasets_api", "DatasetsApi")
 
 
 class DataSets:
@@ -31,10 +38,26 @@ class DataSets:
       accesing an attribute of a :class:`root.client.Scorable` instance.
     """
 
-    def __init__(self, client_context: ClientContextCallable, base_url: str, api_key: str):
+    def __init__(
+        self,
+        client_context: ClientContextCallable,
+        base_url: str,
+        api_key: str,
+        *,
+        rate_limit: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         self.client_context = client_context
         self.base_url = base_url
         self.api_key = api_key
+        # The uploads do not go through the client transports
+        self.rate_limit = rate_limit
+        self.circuit_breaker = circuit_breaker
+
+    def _upload_circuit(self) -> ContextManager[Callable[[int], None]]:
+        if self.circuit_breaker is None:
+            return nullcontext(lambda status: None)
+        return self.circuit_breaker.guard("datasets")
 
     def create(
         self,
@@ -49,7 +72,11 @@ class DataSets:
         If the dataset has a path, it will be uploaded to the registry.
         """
 
+        import requests
+
         payload: Dict[str, Any] = {"name": name, "type": type, "tags": []}
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
         file = None
         try:
             if path:
@@ -58,13 +85,17 @@ class DataSets:
             else:
                 files = None
 
-            response = requests.post(
-                f"{self.base_url}/datasets/",
-                headers={"Authorization": f"Api-Key {self.api_key}"},
-                data=payload,
-                files=files,
-                timeout=_request_timeout or 120,
-            )
+            with self._upload_circuit() as record_status:
+                response = requests.post(
+                    f"{self.base_url}/datasets/",
+                    headers={"Authorization": f"Api-Key {self.api_key}"},
+                    data=payload,
+                    files=files,
+                    timeout=_request_timeout or 120,
+                )
+                record_status(response.status_code)
+            if self.rate_limit is not None:
+                self.rate_limit.update(response.status_code, response.headers.get)
             if not response.ok:
                 raise Exception(f"create failed with status code {response.status_code} and message\n{response.text}")
 
@@ -80,35 +111,44 @@ class DataSets:
         path: Optional[str] = None,
         type: str = "reference",
         _request_timeout: Optional[int] = None,
-    ) -> Optional[ADataSetCreate]:
+    ) -> Optional[DataSetCreate]:
         """
         Asynchronously create a dataset object with the given parameters to the registry.
         If the dataset has a path, it will be uploaded to the registry.
 
         """
 
+        import aiohttp
+
         payload = aiohttp.FormData()
         payload.add_field("name", name)
         payload.add_field("type", type)
 
+        if self.rate_limit is not None:
+            await self.rate_limit.aacquire()
         file = None
         try:
             if path:
                 file = open(path, "rb")
                 payload.add_field("file", file)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/datasets/",
-                    data=payload,
-                    headers={"Authorization": f"Api-Key {self.api_key}"},
-                    timeout=aiohttp.ClientTimeout(_request_timeout) or aiohttp.ClientTimeout(120),
-                ) as response:
-                    if not response.ok:
-                        raise Exception(
-                            f"create failed with status code {response.status} and message\n{response.text}"
-                        )
-                    return ADataSetCreate.from_dict(await response.json())
+            connector = aiohttp.TCPConnector(ssl=get_ssl_context())
+            async with aiohttp.ClientSession(connector=connector) as session:
+                with self._upload_circuit() as record_status:
+                    async with session.post(
+                        f"{self.base_url}/datasets/",
+                        data=payload,
+                        headers={"Authorization": f"Api-Key {self.api_key}"},
+                        timeout=aiohttp.ClientTimeout(_request_timeout) or aiohttp.ClientTimeout(120),
+                    ) as response:
+                        record_status(response.status)
+                        if self.rate_limit is not None:
+                            await self.rate_limit.aupdate(response.status, response.headers.get)
+                        if not response.ok:
+                            raise Exception(
+                                f"create failed with status code {response.status} and message\n{response.text}"
+                            )
+                        return DataSetCreate.from_dict(await response.json())
         finally:
             if file and not file.closed:
                 file.close()
@@ -135,7 +175,7 @@ class DataSets:
         *,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ADataSetList:
+    ) -> DataSetList:
         """
         Asynchronously get a dataset object from the registry.
         """
@@ -171,7 +211,7 @@ class DataSets:
         *,
         limit: int = 100,
         _request_timeout: Optional[int] = None,
-    ) -> AsyncIterator[ADataSetList]:
+    ) -> AsyncIterator[DataSetList]:
         """
         Asynchronously iterate through the datasets.
 
@@ -187,7 +227,7 @@ class DataSets:
             partial_list = partial(api_instance.datasets_list, search=search_term, _request_timeout=_request_timeout)
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedDataSetListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedDataSetListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
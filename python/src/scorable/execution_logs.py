@@ -6,18 +6,22 @@ from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional, Proto
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.execution_logs_api import ExecutionLogsApi as AExecutionLogsApi
-from .generated.openapi_aclient.models.execution_log_details import ExecutionLogDetails as AExecutionLogDetails
-from .generated.openapi_aclient.models.execution_log_list import ExecutionLogList as AExecutionLogList
-from .generated.openapi_aclient.models.paginated_execution_log_list_list import (
-    PaginatedExecutionLogListList as APaginatedExecutionLogListList,
-)
 from .generated.openapi_client import ApiClient
-from .generated.openapi_client.api.execution_logs_api import ExecutionLogsApi as ExecutionLogsApi
 from .generated.openapi_client.models.execution_log_details import ExecutionLogDetails
 from .generated.openapi_client.models.execution_log_list import ExecutionLogList
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .generated.openapi_client.models.paginated_execution_log_list_list import (
+    PaginatedExecutionLogListList,
+)
+from .utils import ClientContextCallable, iterate_cursor_list, lazy_import, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.execution_logs_api import ExecutionLogsApi as AExecutionLogsApi
+    from .generated.openapi_client.api.execution_logs_api import ExecutionLogsApi
+else:
+    # Imported on first use
+    AExecutionLogsApi = lazy_import("scorable.generated.openapi_aclient.api.execution_logs_api", "ExecutionLogsApi")
+    ExecutionLogsApi = lazy_import("scorable.generated.openapi_client.api.execution_logs_api", "ExecutionLogsApi")
 
 if TYPE_CHECKING:
 
@@ -71,7 +75,7 @@ class ExecutionLogs:
         tags: Optional[List[str]] = None,
         include: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
-    ) -> AsyncIterator[AExecutionLogList]:
+    ) -> AsyncIterator[ExecutionLogList]:
         """
         Asynchronously list execution logs
 
@@ -96,7 +100,7 @@ class ExecutionLogs:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedExecutionLogListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedExecutionLogListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -143,7 +147,7 @@ class ExecutionLogs:
         execution_result: Optional[ExecutionResult] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AExecutionLogDetails:
+    ) -> ExecutionLogDetails:
         """
         Asynchronously get a specific execution log details
 
@@ -19,24 +19,24 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.evaluation_agent import EvaluationAgent
-from scorable.generated.openapi_aclient.models.evaluation_agent_execute_request_request import (
+from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.evaluation_agent import EvaluationAgent
+from scorable.generated.openapi_client.models.evaluation_agent_execute_request_request import (
     EvaluationAgentExecuteRequestRequest,
 )
-from scorable.generated.openapi_aclient.models.evaluation_agent_execute_response import EvaluationAgentExecuteResponse
-from scorable.generated.openapi_aclient.models.evaluation_agent_generate_request_request import (
+from scorable.generated.openapi_client.models.evaluation_agent_execute_response import EvaluationAgentExecuteResponse
+from scorable.generated.openapi_client.models.evaluation_agent_generate_request_request import (
     EvaluationAgentGenerateRequestRequest,
 )
-from scorable.generated.openapi_aclient.models.evaluation_agent_request import EvaluationAgentRequest
-from scorable.generated.openapi_aclient.models.evaluation_job_request_request import EvaluationJobRequestRequest
-from scorable.generated.openapi_aclient.models.evaluation_job_response import EvaluationJobResponse
-from scorable.generated.openapi_aclient.models.id import ID
-from scorable.generated.openapi_aclient.models.paginated_evaluation_agent_list import PaginatedEvaluationAgentList
-from scorable.generated.openapi_aclient.models.paginated_evaluation_batch_job_serializer_list import (
+from scorable.generated.openapi_client.models.evaluation_agent_request import EvaluationAgentRequest
+from scorable.generated.openapi_client.models.evaluation_job_request_request import EvaluationJobRequestRequest
+from scorable.generated.openapi_client.models.evaluation_job_response import EvaluationJobResponse
+from scorable.generated.openapi_client.models.id import ID
+from scorable.generated.openapi_client.models.paginated_evaluation_agent_list import PaginatedEvaluationAgentList
+from scorable.generated.openapi_client.models.paginated_evaluation_batch_job_serializer_list import (
     PaginatedEvaluationBatchJobSerializerList,
 )
-from scorable.generated.openapi_aclient.models.patched_evaluation_agent_request import PatchedEvaluationAgentRequest
-from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.patched_evaluation_agent_request import PatchedEvaluationAgentRequest
 
 
 class BetaApi:
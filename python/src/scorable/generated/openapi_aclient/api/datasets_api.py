@@ -19,13 +19,13 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.data_set_create import DataSetCreate
-from scorable.generated.openapi_aclient.models.data_set_create_request import DataSetCreateRequest
-from scorable.generated.openapi_aclient.models.data_set_list import DataSetList
-from scorable.generated.openapi_aclient.models.paginated_data_set_list_list import PaginatedDataSetListList
-from scorable.generated.openapi_aclient.models.status_change import StatusChange
-from scorable.generated.openapi_aclient.models.status_change_request import StatusChangeRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
+from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
+from scorable.generated.openapi_client.models.data_set_list import DataSetList
+from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
+from scorable.generated.openapi_client.models.status_change import StatusChange
+from scorable.generated.openapi_client.models.status_change_request import StatusChangeRequest
 
 
 class DatasetsApi:
@@ -19,21 +19,21 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.evaluator import Evaluator
-from scorable.generated.openapi_aclient.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from scorable.generated.openapi_aclient.models.evaluator_execution_request import EvaluatorExecutionRequest
-from scorable.generated.openapi_aclient.models.evaluator_execution_result import EvaluatorExecutionResult
-from scorable.generated.openapi_aclient.models.evaluator_request import EvaluatorRequest
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list import PaginatedEvaluatorList
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list_output_list import (
+from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.evaluator import Evaluator
+from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+from scorable.generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+from scorable.generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
+from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
+from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
     PaginatedEvaluatorListOutputList,
 )
-from scorable.generated.openapi_aclient.models.patched_evaluator_request import PatchedEvaluatorRequest
-from scorable.generated.openapi_aclient.models.skill_test_data_request import SkillTestDataRequest
-from scorable.generated.openapi_aclient.models.skill_test_input_request import SkillTestInputRequest
-from scorable.generated.openapi_aclient.models.status_change import StatusChange
-from scorable.generated.openapi_aclient.models.status_change_request import StatusChangeRequest
-from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
+from scorable.generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
+from scorable.generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
+from scorable.generated.openapi_client.models.status_change import StatusChange
+from scorable.generated.openapi_client.models.status_change_request import StatusChangeRequest
 
 
 class EvaluatorsApi:
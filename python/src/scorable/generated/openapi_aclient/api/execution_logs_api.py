@@ -20,9 +20,9 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.execution_log_details import ExecutionLogDetails
-from scorable.generated.openapi_aclient.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.execution_log_details import ExecutionLogDetails
+from scorable.generated.openapi_client.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
 
 
 class ExecutionLogsApi:
@@ -19,13 +19,13 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.model import Model
-from scorable.generated.openapi_aclient.models.model_request import ModelRequest
-from scorable.generated.openapi_aclient.models.model_test_request_request import ModelTestRequestRequest
-from scorable.generated.openapi_aclient.models.model_test_response import ModelTestResponse
-from scorable.generated.openapi_aclient.models.paginated_model_list_list import PaginatedModelListList
-from scorable.generated.openapi_aclient.models.patched_model_request import PatchedModelRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.model import Model
+from scorable.generated.openapi_client.models.model_request import ModelRequest
+from scorable.generated.openapi_client.models.model_test_request_request import ModelTestRequestRequest
+from scorable.generated.openapi_client.models.model_test_response import ModelTestResponse
+from scorable.generated.openapi_client.models.paginated_model_list_list import PaginatedModelListList
+from scorable.generated.openapi_client.models.patched_model_request import PatchedModelRequest
 
 
 class ModelsApi:
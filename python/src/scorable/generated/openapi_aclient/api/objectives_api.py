@@ -19,13 +19,13 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.id import ID
-from scorable.generated.openapi_aclient.models.objective import Objective
-from scorable.generated.openapi_aclient.models.objective_request import ObjectiveRequest
-from scorable.generated.openapi_aclient.models.paginated_objective_list import PaginatedObjectiveList
-from scorable.generated.openapi_aclient.models.paginated_objective_list_list import PaginatedObjectiveListList
-from scorable.generated.openapi_aclient.models.patched_objective_request import PatchedObjectiveRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.id import ID
+from scorable.generated.openapi_client.models.objective import Objective
+from scorable.generated.openapi_client.models.objective_request import ObjectiveRequest
+from scorable.generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
+from scorable.generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
+from scorable.generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
 
 
 class ObjectivesApi:
@@ -23,7 +23,7 @@ from urllib.parse import quote
 
 from dateutil.parser import parse
 
-import scorable.generated.openapi_aclient.models
+import scorable.generated.openapi_client.models
 from scorable.generated.openapi_aclient import rest
 from scorable.generated.openapi_aclient.api_response import ApiResponse
 from scorable.generated.openapi_aclient.api_response import T as ApiResponseT
@@ -381,7 +381,7 @@ class ApiClient:
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
             else:
-                klass = getattr(scorable.generated.openapi_aclient.models, klass)
+                klass = getattr(scorable.generated.openapi_client.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
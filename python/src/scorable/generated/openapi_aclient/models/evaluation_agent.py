@@ -1,142 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.evaluation_agent_evaluation_approach_enum import (
-    EvaluationAgentEvaluationApproachEnum,
-)
-from scorable.generated.openapi_aclient.models.model_enum import ModelEnum
-from scorable.generated.openapi_aclient.models.nested_objective import NestedObjective
-from scorable.generated.openapi_aclient.models.status_enum import StatusEnum
-
-
-class EvaluationAgent(BaseModel):
-    """
-    EvaluationAgent
-    """  # noqa: E501
-
-    created_at: datetime
-    evaluation_approach: Optional[EvaluationAgentEvaluationApproachEnum] = None
-    id: StrictStr
-    model: Optional[ModelEnum] = None
-    name: Annotated[str, Field(strict=True, max_length=1000)]
-    objective_id: StrictStr
-    objective: NestedObjective
-    scoring_criteria: StrictStr
-    status: Optional[StatusEnum] = None
-    version_id: StrictStr
-    __properties: ClassVar[List[str]] = [
-        "created_at",
-        "evaluation_approach",
-        "id",
-        "model",
-        "name",
-        "objective_id",
-        "objective",
-        "scoring_criteria",
-        "status",
-        "version_id",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluationAgent from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "created_at",
-                "id",
-                "objective",
-                "version_id",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of objective
-        if self.objective:
-            _dict["objective"] = self.objective.to_dict()
-        # set to None if status (nullable) is None
-        # and model_fields_set contains the field
-        if self.status is None and "status" in self.model_fields_set:
-            _dict["status"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluationAgent from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "created_at": obj.get("created_at"),
-                "evaluation_approach": obj.get("evaluation_approach"),
-                "id": obj.get("id"),
-                "model": obj.get("model"),
-                "name": obj.get("name"),
-                "objective_id": obj.get("objective_id"),
-                "objective": NestedObjective.from_dict(obj["objective"]) if obj.get("objective") is not None else None,
-                "scoring_criteria": obj.get("scoring_criteria"),
-                "status": obj.get("status"),
-                "version_id": obj.get("version_id"),
-            }
-        )
-        return _obj
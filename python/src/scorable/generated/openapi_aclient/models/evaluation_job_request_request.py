@@ -1,167 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.input_output_pair_input_request import InputOutputPairInputRequest
-
-
-class EvaluationJobRequestRequest(BaseModel):
-    """
-    EvaluationJobRequestRequest
-    """  # noqa: E501
-
-    id: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="Will be set automatically"
-    )
-    created_at: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="Will be set automatically"
-    )
-    updated_at: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="Will be set automatically"
-    )
-    samples: List[InputOutputPairInputRequest] = Field(description="List of content to evaluate in batch")
-    job_name: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="Optional name for this batch job"
-    )
-    drop_hints: Optional[StrictBool] = Field(
-        default=False, description="Whether to drop existing preference hints during evaluation"
-    )
-    dataset_name: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="Optional dataset name to set for the samples. Should be unique"
-    )
-    fast_mode: Optional[StrictBool] = Field(default=False, description="Use fast agents for evaluation")
-    __properties: ClassVar[List[str]] = [
-        "id",
-        "created_at",
-        "updated_at",
-        "samples",
-        "job_name",
-        "drop_hints",
-        "dataset_name",
-        "fast_mode",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluationJobRequestRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in samples (list)
-        _items = []
-        if self.samples:
-            for _item in self.samples:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["samples"] = _items
-        # set to None if id (nullable) is None
-        # and model_fields_set contains the field
-        if self.id is None and "id" in self.model_fields_set:
-            _dict["id"] = None
-
-        # set to None if created_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.created_at is None and "created_at" in self.model_fields_set:
-            _dict["created_at"] = None
-
-        # set to None if updated_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.updated_at is None and "updated_at" in self.model_fields_set:
-            _dict["updated_at"] = None
-
-        # set to None if job_name (nullable) is None
-        # and model_fields_set contains the field
-        if self.job_name is None and "job_name" in self.model_fields_set:
-            _dict["job_name"] = None
-
-        # set to None if drop_hints (nullable) is None
-        # and model_fields_set contains the field
-        if self.drop_hints is None and "drop_hints" in self.model_fields_set:
-            _dict["drop_hints"] = None
-
-        # set to None if dataset_name (nullable) is None
-        # and model_fields_set contains the field
-        if self.dataset_name is None and "dataset_name" in self.model_fields_set:
-            _dict["dataset_name"] = None
-
-        # set to None if fast_mode (nullable) is None
-        # and model_fields_set contains the field
-        if self.fast_mode is None and "fast_mode" in self.model_fields_set:
-            _dict["fast_mode"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluationJobRequestRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "id": obj.get("id"),
-                "created_at": obj.get("created_at"),
-                "updated_at": obj.get("updated_at"),
-                "samples": [InputOutputPairInputRequest.from_dict(_item) for _item in obj["samples"]]
-                if obj.get("samples") is not None
-                else None,
-                "job_name": obj.get("job_name"),
-                "drop_hints": obj.get("drop_hints") if obj.get("drop_hints") is not None else False,
-                "dataset_name": obj.get("dataset_name"),
-                "fast_mode": obj.get("fast_mode") if obj.get("fast_mode") is not None else False,
-            }
-        )
-        return _obj
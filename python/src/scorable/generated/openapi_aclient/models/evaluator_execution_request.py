@@ -1,118 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-
-class EvaluatorExecutionRequest(BaseModel):
-    """
-    EvaluatorExecutionRequest
-    """  # noqa: E501
-
-    request: Optional[StrictStr] = ""
-    response: Optional[StrictStr] = ""
-    contexts: Optional[List[Annotated[str, Field(min_length=1, strict=True)]]] = None
-    expected_output: Optional[Annotated[str, Field(strict=True, max_length=3500000)]] = None
-    tags: Optional[List[Annotated[str, Field(min_length=1, strict=True, max_length=1000)]]] = None
-    evaluator_version_id: Optional[StrictStr] = None
-    variables: Optional[Dict[str, Annotated[str, Field(min_length=1, strict=True)]]] = Field(
-        default=None, description="Extra variables to be used in the execution of the evaluator. Optional."
-    )
-    __properties: ClassVar[List[str]] = [
-        "request",
-        "response",
-        "contexts",
-        "expected_output",
-        "tags",
-        "evaluator_version_id",
-        "variables",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluatorExecutionRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if expected_output (nullable) is None
-        # and model_fields_set contains the field
-        if self.expected_output is None and "expected_output" in self.model_fields_set:
-            _dict["expected_output"] = None
-
-        # set to None if evaluator_version_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_version_id is None and "evaluator_version_id" in self.model_fields_set:
-            _dict["evaluator_version_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluatorExecutionRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "request": obj.get("request") if obj.get("request") is not None else "",
-                "response": obj.get("response") if obj.get("response") is not None else "",
-                "contexts": obj.get("contexts"),
-                "expected_output": obj.get("expected_output"),
-                "tags": obj.get("tags"),
-                "evaluator_version_id": obj.get("evaluator_version_id"),
-                "variables": obj.get("variables"),
-            }
-        )
-        return _obj
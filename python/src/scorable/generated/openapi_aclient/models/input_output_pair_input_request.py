@@ -1,130 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.kind_enum import KindEnum
-from scorable.generated.openapi_aclient.models.result_preference_signifier_request import (
-    ResultPreferenceSignifierRequest,
-)
-
-
-class InputOutputPairInputRequest(BaseModel):
-    """
-    InputOutputPairInputRequest
-    """  # noqa: E501
-
-    kind: KindEnum
-    original_input: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    original_response: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    original_content: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    original_preference: Optional[ResultPreferenceSignifierRequest] = None
-    __properties: ClassVar[List[str]] = [
-        "kind",
-        "original_input",
-        "original_response",
-        "original_content",
-        "original_preference",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of InputOutputPairInputRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of original_preference
-        if self.original_preference:
-            _dict["original_preference"] = self.original_preference.to_dict()
-        # set to None if original_input (nullable) is None
-        # and model_fields_set contains the field
-        if self.original_input is None and "original_input" in self.model_fields_set:
-            _dict["original_input"] = None
-
-        # set to None if original_response (nullable) is None
-        # and model_fields_set contains the field
-        if self.original_response is None and "original_response" in self.model_fields_set:
-            _dict["original_response"] = None
-
-        # set to None if original_content (nullable) is None
-        # and model_fields_set contains the field
-        if self.original_content is None and "original_content" in self.model_fields_set:
-            _dict["original_content"] = None
-
-        # set to None if original_preference (nullable) is None
-        # and model_fields_set contains the field
-        if self.original_preference is None and "original_preference" in self.model_fields_set:
-            _dict["original_preference"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of InputOutputPairInputRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "kind": obj.get("kind"),
-                "original_input": obj.get("original_input"),
-                "original_response": obj.get("original_response"),
-                "original_content": obj.get("original_content"),
-                "original_preference": ResultPreferenceSignifierRequest.from_dict(obj["original_preference"])
-                if obj.get("original_preference") is not None
-                else None,
-            }
-        )
-        return _obj
@@ -1,155 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
-from typing_extensions import Self
-
-from scorable.generated.openapi_aclient.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
-from scorable.generated.openapi_aclient.models.judge_batch_execution_item_status_enum import (
-    JudgeBatchExecutionItemStatusEnum,
-)
-
-
-class JudgeBatchExecutionItem(BaseModel):
-    """
-    JudgeBatchExecutionItem
-    """  # noqa: E501
-
-    index: StrictInt = Field(description="Position in the batch (0-indexed)")
-    status: JudgeBatchExecutionItemStatusEnum
-    input: JudgeBatchExecutionItemInput
-    evaluator_results: Optional[Any] = Field(description="List of evaluator results for this execution")
-    error_message: StrictStr
-    execution_log_id: Optional[StrictStr]
-    started_at: Optional[datetime]
-    completed_at: Optional[datetime]
-    __properties: ClassVar[List[str]] = [
-        "index",
-        "status",
-        "input",
-        "evaluator_results",
-        "error_message",
-        "execution_log_id",
-        "started_at",
-        "completed_at",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of JudgeBatchExecutionItem from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "index",
-                "status",
-                "evaluator_results",
-                "error_message",
-                "execution_log_id",
-                "started_at",
-                "completed_at",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of input
-        if self.input:
-            _dict["input"] = self.input.to_dict()
-        # set to None if evaluator_results (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_results is None and "evaluator_results" in self.model_fields_set:
-            _dict["evaluator_results"] = None
-
-        # set to None if execution_log_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.execution_log_id is None and "execution_log_id" in self.model_fields_set:
-            _dict["execution_log_id"] = None
-
-        # set to None if started_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.started_at is None and "started_at" in self.model_fields_set:
-            _dict["started_at"] = None
-
-        # set to None if completed_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.completed_at is None and "completed_at" in self.model_fields_set:
-            _dict["completed_at"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of JudgeBatchExecutionItem from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "index": obj.get("index"),
-                "status": obj.get("status"),
-                "input": JudgeBatchExecutionItemInput.from_dict(obj["input"]) if obj.get("input") is not None else None,
-                "evaluator_results": obj.get("evaluator_results"),
-                "error_message": obj.get("error_message"),
-                "execution_log_id": obj.get("execution_log_id"),
-                "started_at": obj.get("started_at"),
-                "completed_at": obj.get("completed_at"),
-            }
-        )
-        return _obj
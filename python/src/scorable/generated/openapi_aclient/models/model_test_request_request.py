@@ -1,113 +0,0 @@
-# coding: utf-8
-
-"""
-Root Signals API
-
-Root Signals JSON API provides a way to access Root Signals using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field
-from typing_extensions import Annotated, Self
-
-
-class ModelTestRequestRequest(BaseModel):
-    """
-    ModelTestRequestRequest
-    """  # noqa: E501
-
-    model: Annotated[str, Field(min_length=1, strict=True)] = Field(
-        description="Model name to test (e.g., 'gpt-4-turbo', 'azure/gpt-4')"
-    )
-    api_key: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="API key for the model (optional, uses organization default if not provided)"
-    )
-    url: Optional[Annotated[str, Field(min_length=1, strict=True)]] = Field(
-        default=None, description="API base URL (optional, for self-hosted models)"
-    )
-    max_output_token_count: Optional[Annotated[int, Field(strict=True, ge=800)]] = None
-    __properties: ClassVar[List[str]] = ["model", "api_key", "url", "max_output_token_count"]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of ModelTestRequestRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if api_key (nullable) is None
-        # and model_fields_set contains the field
-        if self.api_key is None and "api_key" in self.model_fields_set:
-            _dict["api_key"] = None
-
-        # set to None if url (nullable) is None
-        # and model_fields_set contains the field
-        if self.url is None and "url" in self.model_fields_set:
-            _dict["url"] = None
-
-        # set to None if max_output_token_count (nullable) is None
-        # and model_fields_set contains the field
-        if self.max_output_token_count is None and "max_output_token_count" in self.model_fields_set:
-            _dict["max_output_token_count"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of ModelTestRequestRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "model": obj.get("model"),
-                "api_key": obj.get("api_key"),
-                "url": obj.get("url"),
-                "max_output_token_count": obj.get("max_output_token_count"),
-            }
-        )
-        return _obj
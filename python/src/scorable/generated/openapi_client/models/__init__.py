@@ -12,156 +12,306 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
-from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
-from scorable.generated.openapi_client.models.data_set_list import DataSetList
-from scorable.generated.openapi_client.models.data_set_type import DataSetType
-from scorable.generated.openapi_client.models.dataset_range_request import DatasetRangeRequest
-from scorable.generated.openapi_client.models.evaluation_agent import EvaluationAgent
-from scorable.generated.openapi_client.models.evaluation_agent_evaluation_approach_enum import (
-    EvaluationAgentEvaluationApproachEnum,
-)
-from scorable.generated.openapi_client.models.evaluation_agent_execute_request_request import (
-    EvaluationAgentExecuteRequestRequest,
-)
-from scorable.generated.openapi_client.models.evaluation_agent_execute_response import EvaluationAgentExecuteResponse
-from scorable.generated.openapi_client.models.evaluation_agent_generate_example_request import (
-    EvaluationAgentGenerateExampleRequest,
-)
-from scorable.generated.openapi_client.models.evaluation_agent_generate_request_evaluation_approach_enum import (
-    EvaluationAgentGenerateRequestEvaluationApproachEnum,
-)
-from scorable.generated.openapi_client.models.evaluation_agent_generate_request_request import (
-    EvaluationAgentGenerateRequestRequest,
-)
-from scorable.generated.openapi_client.models.evaluation_agent_request import EvaluationAgentRequest
-from scorable.generated.openapi_client.models.evaluation_batch_job_serializer import EvaluationBatchJobSerializer
-from scorable.generated.openapi_client.models.evaluation_job_request_request import EvaluationJobRequestRequest
-from scorable.generated.openapi_client.models.evaluation_job_response import EvaluationJobResponse
-from scorable.generated.openapi_client.models.evaluator import Evaluator
-from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from scorable.generated.openapi_client.models.evaluator_calibration_result import EvaluatorCalibrationResult
-from scorable.generated.openapi_client.models.evaluator_demonstrations import EvaluatorDemonstrations
-from scorable.generated.openapi_client.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
-from scorable.generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
-from scorable.generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
-from scorable.generated.openapi_client.models.evaluator_inputs_value import EvaluatorInputsValue
-from scorable.generated.openapi_client.models.evaluator_inputs_value_items import EvaluatorInputsValueItems
-from scorable.generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
-from scorable.generated.openapi_client.models.evaluator_reference import EvaluatorReference
-from scorable.generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
-from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
-from scorable.generated.openapi_client.models.evaluator_result import EvaluatorResult
-from scorable.generated.openapi_client.models.execution_log_details import ExecutionLogDetails
-from scorable.generated.openapi_client.models.execution_log_details_evaluation_context import (
-    ExecutionLogDetailsEvaluationContext,
-)
-from scorable.generated.openapi_client.models.execution_log_details_evaluator_latencies_inner import (
-    ExecutionLogDetailsEvaluatorLatenciesInner,
-)
-from scorable.generated.openapi_client.models.execution_log_list import ExecutionLogList
-from scorable.generated.openapi_client.models.execution_log_list_evaluation_context import (
-    ExecutionLogListEvaluationContext,
-)
-from scorable.generated.openapi_client.models.generation_model_params_request import GenerationModelParamsRequest
-from scorable.generated.openapi_client.models.id import ID
-from scorable.generated.openapi_client.models.input_output_pair_input_request import InputOutputPairInputRequest
-from scorable.generated.openapi_client.models.input_variable import InputVariable
-from scorable.generated.openapi_client.models.input_variable_request import InputVariableRequest
-from scorable.generated.openapi_client.models.job_status import JobStatus
-from scorable.generated.openapi_client.models.judge import Judge
-from scorable.generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
-from scorable.generated.openapi_client.models.judge_batch_execution_input_request import JudgeBatchExecutionInputRequest
-from scorable.generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
-from scorable.generated.openapi_client.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
-from scorable.generated.openapi_client.models.judge_batch_execution_item_status_enum import (
-    JudgeBatchExecutionItemStatusEnum,
-)
-from scorable.generated.openapi_client.models.judge_batch_execution_list_item import JudgeBatchExecutionListItem
-from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
-from scorable.generated.openapi_client.models.judge_batch_execution_response import JudgeBatchExecutionResponse
-from scorable.generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
-from scorable.generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
-from scorable.generated.openapi_client.models.judge_files_inner import JudgeFilesInner
-from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
-from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
-from scorable.generated.openapi_client.models.judge_generator_visibility_enum import JudgeGeneratorVisibilityEnum
-from scorable.generated.openapi_client.models.judge_invite_request import JudgeInviteRequest
-from scorable.generated.openapi_client.models.judge_list import JudgeList
-from scorable.generated.openapi_client.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
-from scorable.generated.openapi_client.models.judge_rectifier_response import JudgeRectifierResponse
-from scorable.generated.openapi_client.models.judge_request import JudgeRequest
-from scorable.generated.openapi_client.models.kind_enum import KindEnum
-from scorable.generated.openapi_client.models.model import Model
-from scorable.generated.openapi_client.models.model_enum import ModelEnum
-from scorable.generated.openapi_client.models.model_list import ModelList
-from scorable.generated.openapi_client.models.model_list_visibility_enum import ModelListVisibilityEnum
-from scorable.generated.openapi_client.models.model_params import ModelParams
-from scorable.generated.openapi_client.models.model_params_request import ModelParamsRequest
-from scorable.generated.openapi_client.models.model_request import ModelRequest
-from scorable.generated.openapi_client.models.model_test_request_request import ModelTestRequestRequest
-from scorable.generated.openapi_client.models.model_test_response import ModelTestResponse
-from scorable.generated.openapi_client.models.nested_evaluator import NestedEvaluator
-from scorable.generated.openapi_client.models.nested_evaluator_objective import NestedEvaluatorObjective
-from scorable.generated.openapi_client.models.nested_evaluator_request import NestedEvaluatorRequest
-from scorable.generated.openapi_client.models.nested_judge import NestedJudge
-from scorable.generated.openapi_client.models.nested_objective import NestedObjective
-from scorable.generated.openapi_client.models.nested_objective_evaluator import NestedObjectiveEvaluator
-from scorable.generated.openapi_client.models.nested_objective_evaluator_request import NestedObjectiveEvaluatorRequest
-from scorable.generated.openapi_client.models.nested_objective_list import NestedObjectiveList
-from scorable.generated.openapi_client.models.nested_user_details import NestedUserDetails
-from scorable.generated.openapi_client.models.nested_user_details_request import NestedUserDetailsRequest
-from scorable.generated.openapi_client.models.nested_vector_objective import NestedVectorObjective
-from scorable.generated.openapi_client.models.nested_vector_objective_request import NestedVectorObjectiveRequest
-from scorable.generated.openapi_client.models.null_enum import NullEnum
-from scorable.generated.openapi_client.models.objective import Objective
-from scorable.generated.openapi_client.models.objective_list import ObjectiveList
-from scorable.generated.openapi_client.models.objective_request import ObjectiveRequest
-from scorable.generated.openapi_client.models.objective_validator import ObjectiveValidator
-from scorable.generated.openapi_client.models.objective_validator_request import ObjectiveValidatorRequest
-from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
-from scorable.generated.openapi_client.models.paginated_evaluation_agent_list import PaginatedEvaluationAgentList
-from scorable.generated.openapi_client.models.paginated_evaluation_batch_job_serializer_list import (
-    PaginatedEvaluationBatchJobSerializerList,
-)
-from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
-from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
-    PaginatedEvaluatorListOutputList,
-)
-from scorable.generated.openapi_client.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
-from scorable.generated.openapi_client.models.paginated_judge_batch_execution_list_item_list import (
-    PaginatedJudgeBatchExecutionListItemList,
-)
-from scorable.generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
-from scorable.generated.openapi_client.models.paginated_model_list_list import PaginatedModelListList
-from scorable.generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
-from scorable.generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
-from scorable.generated.openapi_client.models.patched_evaluation_agent_request import PatchedEvaluationAgentRequest
-from scorable.generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
-from scorable.generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
-from scorable.generated.openapi_client.models.patched_model_request import PatchedModelRequest
-from scorable.generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
-from scorable.generated.openapi_client.models.provider import Provider
-from scorable.generated.openapi_client.models.reasoning_effort_enum import ReasoningEffortEnum
-from scorable.generated.openapi_client.models.reference_variable import ReferenceVariable
-from scorable.generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
-from scorable.generated.openapi_client.models.result_preference_signifier_evaluation_approach_enum import (
-    ResultPreferenceSignifierEvaluationApproachEnum,
-)
-from scorable.generated.openapi_client.models.result_preference_signifier_request import (
-    ResultPreferenceSignifierRequest,
-)
-from scorable.generated.openapi_client.models.skill_execution_validator_result import SkillExecutionValidatorResult
-from scorable.generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
-from scorable.generated.openapi_client.models.skill_test_data_request_dataset_range import (
-    SkillTestDataRequestDatasetRange,
-)
-from scorable.generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
-from scorable.generated.openapi_client.models.skill_type_enum import SkillTypeEnum
-from scorable.generated.openapi_client.models.status776_enum import Status776Enum
-from scorable.generated.openapi_client.models.status_change import StatusChange
-from scorable.generated.openapi_client.models.status_change_request import StatusChangeRequest
-from scorable.generated.openapi_client.models.status_change_status_enum import StatusChangeStatusEnum
-from scorable.generated.openapi_client.models.status_enum import StatusEnum
-from scorable.generated.openapi_client.models.validation_result_status import ValidationResultStatus
+# Models are imported on first access (see scripts/lazy_models.py)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
+    from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
+    from scorable.generated.openapi_client.models.data_set_list import DataSetList
+    from scorable.generated.openapi_client.models.data_set_type import DataSetType
+    from scorable.generated.openapi_client.models.dataset_range_request import DatasetRangeRequest
+    from scorable.generated.openapi_client.models.evaluation_agent import EvaluationAgent
+    from scorable.generated.openapi_client.models.evaluation_agent_evaluation_approach_enum import (
+        EvaluationAgentEvaluationApproachEnum,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_execute_request_request import (
+        EvaluationAgentExecuteRequestRequest,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_execute_response import (
+        EvaluationAgentExecuteResponse,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_generate_example_request import (
+        EvaluationAgentGenerateExampleRequest,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_generate_request_evaluation_approach_enum import (
+        EvaluationAgentGenerateRequestEvaluationApproachEnum,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_generate_request_request import (
+        EvaluationAgentGenerateRequestRequest,
+    )
+    from scorable.generated.openapi_client.models.evaluation_agent_request import EvaluationAgentRequest
+    from scorable.generated.openapi_client.models.evaluation_batch_job_serializer import EvaluationBatchJobSerializer
+    from scorable.generated.openapi_client.models.evaluation_job_request_request import EvaluationJobRequestRequest
+    from scorable.generated.openapi_client.models.evaluation_job_response import EvaluationJobResponse
+    from scorable.generated.openapi_client.models.evaluator import Evaluator
+    from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+    from scorable.generated.openapi_client.models.evaluator_calibration_result import EvaluatorCalibrationResult
+    from scorable.generated.openapi_client.models.evaluator_demonstrations import EvaluatorDemonstrations
+    from scorable.generated.openapi_client.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
+    from scorable.generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+    from scorable.generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from scorable.generated.openapi_client.models.evaluator_inputs_value import EvaluatorInputsValue
+    from scorable.generated.openapi_client.models.evaluator_inputs_value_items import EvaluatorInputsValueItems
+    from scorable.generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
+    from scorable.generated.openapi_client.models.evaluator_reference import EvaluatorReference
+    from scorable.generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
+    from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
+    from scorable.generated.openapi_client.models.evaluator_result import EvaluatorResult
+    from scorable.generated.openapi_client.models.execution_log_details import ExecutionLogDetails
+    from scorable.generated.openapi_client.models.execution_log_details_evaluation_context import (
+        ExecutionLogDetailsEvaluationContext,
+    )
+    from scorable.generated.openapi_client.models.execution_log_details_evaluator_latencies_inner import (
+        ExecutionLogDetailsEvaluatorLatenciesInner,
+    )
+    from scorable.generated.openapi_client.models.execution_log_list import ExecutionLogList
+    from scorable.generated.openapi_client.models.execution_log_list_evaluation_context import (
+        ExecutionLogListEvaluationContext,
+    )
+    from scorable.generated.openapi_client.models.generation_model_params_request import GenerationModelParamsRequest
+    from scorable.generated.openapi_client.models.id import ID
+    from scorable.generated.openapi_client.models.input_output_pair_input_request import InputOutputPairInputRequest
+    from scorable.generated.openapi_client.models.input_variable import InputVariable
+    from scorable.generated.openapi_client.models.input_variable_request import InputVariableRequest
+    from scorable.generated.openapi_client.models.job_status import JobStatus
+    from scorable.generated.openapi_client.models.judge import Judge
+    from scorable.generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+    from scorable.generated.openapi_client.models.judge_batch_execution_input_request import (
+        JudgeBatchExecutionInputRequest,
+    )
+    from scorable.generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
+    from scorable.generated.openapi_client.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
+    from scorable.generated.openapi_client.models.judge_batch_execution_item_status_enum import (
+        JudgeBatchExecutionItemStatusEnum,
+    )
+    from scorable.generated.openapi_client.models.judge_batch_execution_list_item import JudgeBatchExecutionListItem
+    from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
+    from scorable.generated.openapi_client.models.judge_batch_execution_response import JudgeBatchExecutionResponse
+    from scorable.generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
+    from scorable.generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
+    from scorable.generated.openapi_client.models.judge_files_inner import JudgeFilesInner
+    from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
+    from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
+    from scorable.generated.openapi_client.models.judge_generator_visibility_enum import JudgeGeneratorVisibilityEnum
+    from scorable.generated.openapi_client.models.judge_invite_request import JudgeInviteRequest
+    from scorable.generated.openapi_client.models.judge_list import JudgeList
+    from scorable.generated.openapi_client.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
+    from scorable.generated.openapi_client.models.judge_rectifier_response import JudgeRectifierResponse
+    from scorable.generated.openapi_client.models.judge_request import JudgeRequest
+    from scorable.generated.openapi_client.models.kind_enum import KindEnum
+    from scorable.generated.openapi_client.models.model import Model
+    from scorable.generated.openapi_client.models.model_enum import ModelEnum
+    from scorable.generated.openapi_client.models.model_list import ModelList
+    from scorable.generated.openapi_client.models.model_list_visibility_enum import ModelListVisibilityEnum
+    from scorable.generated.openapi_client.models.model_params import ModelParams
+    from scorable.generated.openapi_client.models.model_params_request import ModelParamsRequest
+    from scorable.generated.openapi_client.models.model_request import ModelRequest
+    from scorable.generated.openapi_client.models.model_test_request_request import ModelTestRequestRequest
+    from scorable.generated.openapi_client.models.model_test_response import ModelTestResponse
+    from scorable.generated.openapi_client.models.nested_evaluator import NestedEvaluator
+    from scorable.generated.openapi_client.models.nested_evaluator_objective import NestedEvaluatorObjective
+    from scorable.generated.openapi_client.models.nested_evaluator_request import NestedEvaluatorRequest
+    from scorable.generated.openapi_client.models.nested_judge import NestedJudge
+    from scorable.generated.openapi_client.models.nested_objective import NestedObjective
+    from scorable.generated.openapi_client.models.nested_objective_evaluator import NestedObjectiveEvaluator
+    from scorable.generated.openapi_client.models.nested_objective_evaluator_request import (
+        NestedObjectiveEvaluatorRequest,
+    )
+    from scorable.generated.openapi_client.models.nested_objective_list import NestedObjectiveList
+    from scorable.generated.openapi_client.models.nested_user_details import NestedUserDetails
+    from scorable.generated.openapi_client.models.nested_user_details_request import NestedUserDetailsRequest
+    from scorable.generated.openapi_client.models.nested_vector_objective import NestedVectorObjective
+    from scorable.generated.openapi_client.models.nested_vector_objective_request import NestedVectorObjectiveRequest
+    from scorable.generated.openapi_client.models.null_enum import NullEnum
+    from scorable.generated.openapi_client.models.objective import Objective
+    from scorable.generated.openapi_client.models.objective_list import ObjectiveList
+    from scorable.generated.openapi_client.models.objective_request import ObjectiveRequest
+    from scorable.generated.openapi_client.models.objective_validator import ObjectiveValidator
+    from scorable.generated.openapi_client.models.objective_validator_request import ObjectiveValidatorRequest
+    from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
+    from scorable.generated.openapi_client.models.paginated_evaluation_agent_list import PaginatedEvaluationAgentList
+    from scorable.generated.openapi_client.models.paginated_evaluation_batch_job_serializer_list import (
+        PaginatedEvaluationBatchJobSerializerList,
+    )
+    from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
+    from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
+        PaginatedEvaluatorListOutputList,
+    )
+    from scorable.generated.openapi_client.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
+    from scorable.generated.openapi_client.models.paginated_judge_batch_execution_list_item_list import (
+        PaginatedJudgeBatchExecutionListItemList,
+    )
+    from scorable.generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
+    from scorable.generated.openapi_client.models.paginated_model_list_list import PaginatedModelListList
+    from scorable.generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
+    from scorable.generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
+    from scorable.generated.openapi_client.models.patched_evaluation_agent_request import PatchedEvaluationAgentRequest
+    from scorable.generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
+    from scorable.generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
+    from scorable.generated.openapi_client.models.patched_model_request import PatchedModelRequest
+    from scorable.generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
+    from scorable.generated.openapi_client.models.provider import Provider
+    from scorable.generated.openapi_client.models.reasoning_effort_enum import ReasoningEffortEnum
+    from scorable.generated.openapi_client.models.reference_variable import ReferenceVariable
+    from scorable.generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
+    from scorable.generated.openapi_client.models.result_preference_signifier_evaluation_approach_enum import (
+        ResultPreferenceSignifierEvaluationApproachEnum,
+    )
+    from scorable.generated.openapi_client.models.result_preference_signifier_request import (
+        ResultPreferenceSignifierRequest,
+    )
+    from scorable.generated.openapi_client.models.skill_execution_validator_result import SkillExecutionValidatorResult
+    from scorable.generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
+    from scorable.generated.openapi_client.models.skill_test_data_request_dataset_range import (
+        SkillTestDataRequestDatasetRange,
+    )
+    from scorable.generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
+    from scorable.generated.openapi_client.models.skill_type_enum import SkillTypeEnum
+    from scorable.generated.openapi_client.models.status776_enum import Status776Enum
+    from scorable.generated.openapi_client.models.status_change import StatusChange
+    from scorable.generated.openapi_client.models.status_change_request import StatusChangeRequest
+    from scorable.generated.openapi_client.models.status_change_status_enum import StatusChangeStatusEnum
+    from scorable.generated.openapi_client.models.status_enum import StatusEnum
+    from scorable.generated.openapi_client.models.validation_result_status import ValidationResultStatus
+
+_MODULES = {
+    "DataSetCreate": "data_set_create",
+    "DataSetCreateRequest": "data_set_create_request",
+    "DataSetList": "data_set_list",
+    "DataSetType": "data_set_type",
+    "DatasetRangeRequest": "dataset_range_request",
+    "EvaluationAgent": "evaluation_agent",
+    "EvaluationAgentEvaluationApproachEnum": "evaluation_agent_evaluation_approach_enum",
+    "EvaluationAgentExecuteRequestRequest": "evaluation_agent_execute_request_request",
+    "EvaluationAgentExecuteResponse": "evaluation_agent_execute_response",
+    "EvaluationAgentGenerateExampleRequest": "evaluation_agent_generate_example_request",
+    "EvaluationAgentGenerateRequestEvaluationApproachEnum": "evaluation_agent_generate_request_evaluation_approach_enum",
+    "EvaluationAgentGenerateRequestRequest": "evaluation_agent_generate_request_request",
+    "EvaluationAgentRequest": "evaluation_agent_request",
+    "EvaluationBatchJobSerializer": "evaluation_batch_job_serializer",
+    "EvaluationJobRequestRequest": "evaluation_job_request_request",
+    "EvaluationJobResponse": "evaluation_job_response",
+    "Evaluator": "evaluator",
+    "EvaluatorCalibrationOutput": "evaluator_calibration_output",
+    "EvaluatorCalibrationResult": "evaluator_calibration_result",
+    "EvaluatorDemonstrations": "evaluator_demonstrations",
+    "EvaluatorDemonstrationsRequest": "evaluator_demonstrations_request",
+    "EvaluatorExecutionRequest": "evaluator_execution_request",
+    "EvaluatorExecutionResult": "evaluator_execution_result",
+    "EvaluatorInputsValue": "evaluator_inputs_value",
+    "EvaluatorInputsValueItems": "evaluator_inputs_value_items",
+    "EvaluatorListOutput": "evaluator_list_output",
+    "EvaluatorReference": "evaluator_reference",
+    "EvaluatorReferenceRequest": "evaluator_reference_request",
+    "EvaluatorRequest": "evaluator_request",
+    "EvaluatorResult": "evaluator_result",
+    "ExecutionLogDetails": "execution_log_details",
+    "ExecutionLogDetailsEvaluationContext": "execution_log_details_evaluation_context",
+    "ExecutionLogDetailsEvaluatorLatenciesInner": "execution_log_details_evaluator_latencies_inner",
+    "ExecutionLogList": "execution_log_list",
+    "ExecutionLogListEvaluationContext": "execution_log_list_evaluation_context",
+    "GenerationModelParamsRequest": "generation_model_params_request",
+    "ID": "id",
+    "InputOutputPairInputRequest": "input_output_pair_input_request",
+    "InputVariable": "input_variable",
+    "InputVariableRequest": "input_variable_request",
+    "JobStatus": "job_status",
+    "Judge": "judge",
+    "JudgeBatchExecutionDetail": "judge_batch_execution_detail",
+    "JudgeBatchExecutionInputRequest": "judge_batch_execution_input_request",
+    "JudgeBatchExecutionItem": "judge_batch_execution_item",
+    "JudgeBatchExecutionItemInput": "judge_batch_execution_item_input",
+    "JudgeBatchExecutionItemStatusEnum": "judge_batch_execution_item_status_enum",
+    "JudgeBatchExecutionListItem": "judge_batch_execution_list_item",
+    "JudgeBatchExecutionRequest": "judge_batch_execution_request",
+    "JudgeBatchExecutionResponse": "judge_batch_execution_response",
+    "JudgeExecutionRequest": "judge_execution_request",
+    "JudgeExecutionResponse": "judge_execution_response",
+    "JudgeFilesInner": "judge_files_inner",
+    "JudgeGeneratorRequest": "judge_generator_request",
+    "JudgeGeneratorResponse": "judge_generator_response",
+    "JudgeGeneratorVisibilityEnum": "judge_generator_visibility_enum",
+    "JudgeInviteRequest": "judge_invite_request",
+    "JudgeList": "judge_list",
+    "JudgeRectifierRequestRequest": "judge_rectifier_request_request",
+    "JudgeRectifierResponse": "judge_rectifier_response",
+    "JudgeRequest": "judge_request",
+    "KindEnum": "kind_enum",
+    "Model": "model",
+    "ModelEnum": "model_enum",
+    "ModelList": "model_list",
+    "ModelListVisibilityEnum": "model_list_visibility_enum",
+    "ModelParams": "model_params",
+    "ModelParamsRequest": "model_params_request",
+    "ModelRequest": "model_request",
+    "ModelTestRequestRequest": "model_test_request_request",
+    "ModelTestResponse": "model_test_response",
+    "NestedEvaluator": "nested_evaluator",
+    "NestedEvaluatorObjective": "nested_evaluator_objective",
+    "NestedEvaluatorRequest": "nested_evaluator_request",
+    "NestedJudge": "nested_judge",
+    "NestedObjective": "nested_objective",
+    "NestedObjectiveEvaluator": "nested_objective_evaluator",
+    "NestedObjectiveEvaluatorRequest": "nested_objective_evaluator_request",
+    "NestedObjectiveList": "nested_objective_list",
+    "NestedUserDetails": "nested_user_details",
+    "NestedUserDetailsRequest": "nested_user_details_request",
+    "NestedVectorObjective": "nested_vector_objective",
+    "NestedVectorObjectiveRequest": "nested_vector_objective_request",
+    "NullEnum": "null_enum",
+    "Objective": "objective",
+    "ObjectiveList": "objective_list",
+    "ObjectiveRequest": "objective_request",
+    "ObjectiveValidator": "objective_validator",
+    "ObjectiveValidatorRequest": "objective_validator_request",
+    "PaginatedDataSetListList": "paginated_data_set_list_list",
+    "PaginatedEvaluationAgentList": "paginated_evaluation_agent_list",
+    "PaginatedEvaluationBatchJobSerializerList": "paginated_evaluation_batch_job_serializer_list",
+    "PaginatedEvaluatorList": "paginated_evaluator_list",
+    "PaginatedEvaluatorListOutputList": "paginated_evaluator_list_output_list",
+    "PaginatedExecutionLogListList": "paginated_execution_log_list_list",
+    "PaginatedJudgeBatchExecutionListItemList": "paginated_judge_batch_execution_list_item_list",
+    "PaginatedJudgeListList": "paginated_judge_list_list",
+    "PaginatedModelListList": "paginated_model_list_list",
+    "PaginatedObjectiveList": "paginated_objective_list",
+    "PaginatedObjectiveListList": "paginated_objective_list_list",
+    "PatchedEvaluationAgentRequest": "patched_evaluation_agent_request",
+    "PatchedEvaluatorRequest": "patched_evaluator_request",
+    "PatchedJudgeRequest": "patched_judge_request",
+    "PatchedModelRequest": "patched_model_request",
+    "PatchedObjectiveRequest": "patched_objective_request",
+    "Provider": "provider",
+    "ReasoningEffortEnum": "reasoning_effort_enum",
+    "ReferenceVariable": "reference_variable",
+    "ReferenceVariableRequest": "reference_variable_request",
+    "ResultPreferenceSignifierEvaluationApproachEnum": "result_preference_signifier_evaluation_approach_enum",
+    "ResultPreferenceSignifierRequest": "result_preference_signifier_request",
+    "SkillExecutionValidatorResult": "skill_execution_validator_result",
+    "SkillTestDataRequest": "skill_test_data_request",
+    "SkillTestDataRequestDatasetRange": "skill_test_data_request_dataset_range",
+    "SkillTestInputRequest": "skill_test_input_request",
+    "SkillTypeEnum": "skill_type_enum",
+    "Status776Enum": "status776_enum",
+    "StatusChange": "status_change",
+    "StatusChangeRequest": "status_change_request",
+    "StatusChangeStatusEnum": "status_change_status_enum",
+    "StatusEnum": "status_enum",
+    "ValidationResultStatus": "validation_result_status",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_MODULES})
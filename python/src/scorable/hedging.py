@@ -0,0 +1,240 @@
+"""Hedging of slow reads.
+
+A :class:`HedgingPolicy` passed to the client cuts the tail latency of the
+GET requests (e.g. ``evaluators.get``, ``judges.get``, ``execution_logs.get``
+and the listings): when a request has not been answered after a delay, a
+second identical request is sent, the first answer is used and the other
+request is cancelled::
+
+  client = Scorable(hedging=HedgingPolicy())
+
+The delay is by default the 95th percentile of the latencies of the
+recent requests, so that about 5% of the requests are hedged, and a hedge
+budget (see :class:`scorable.retry.RetryBudget`) caps the hedged requests
+to a share of the requests. Only the JSON reads are hedged: the file
+downloads (e.g. of batch jobs) are not sent twice.
+
+Asynchronous clients send the requests from tasks. Synchronous clients
+send them from a thread pool once a hedge may be needed, as the caller
+must be free to take the answer of the hedge; until the delay is known
+(and when the pool is busy) they are sent from the calling thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from .retry import RetryBudget
+from .transport import (
+    AsyncTransport,
+    AsyncTransportResponse,
+    RequestTimeout,
+    Transport,
+    TransportResponse,
+    discard,
+)
+
+HEDGED_METHODS = frozenset(("GET", "HEAD"))
+
+
+def is_hedged(method: str, headers: Optional[Dict[str, str]]) -> bool:
+    """Whether a request may be hedged: a read expecting a JSON answer."""
+    if method.upper() not in HEDGED_METHODS:
+        return False
+    accept = next((value for name, value in (headers or {}).items() if name.lower() == "accept"), None)
+    return accept is None or "json" in accept
+
+
+class HedgingPolicy:
+    """Hedging policy of a client.
+
+    Args:
+        delay: Delay before the second request, in seconds. By default, the `percentile`
+          of the latencies of the recent requests.
+        percentile: Percentile of the recent latencies used as the delay.
+        min_delay: Shortest delay, in seconds.
+        window: Number of recent latencies kept.
+        min_samples: Latencies needed before requests are hedged, without a fixed `delay`.
+        budget: Maximum share of hedged requests among the requests.
+        min_hedges: Hedged requests allowed regardless of the budget.
+        max_workers: Threads sending the requests of synchronous clients; further
+          requests are sent unhedged from the calling threads.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        *,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+        budget: float = 0.05,
+        min_hedges: int = 5,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.budget = RetryBudget(budget, min_hedges)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a (first) request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def recorder(self) -> Callable[[Union[Future[Any], asyncio.Future[Any]]], None]:
+        """Return a done callback recording the latency of the request of a future, from now."""
+        started = time.monotonic()
+
+        def record(future: Union[Future[Any], asyncio.Future[Any]]) -> None:
+            if not future.cancelled():
+                self.record(time.monotonic() - started)
+
+        return record
+
+    def delay(self) -> Optional[float]:
+        """Return the delay before hedging a request, or None when requests are not hedged yet."""
+        if self.fixed_delay is not None:
+            return max(self.min_delay, self.fixed_delay)
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return max(self.min_delay, latencies[int(self.percentile * (len(latencies) - 1))])
+
+
+class HedgedTransport:
+    """Synchronous transport hedging the GET requests of `transport` according to `policy`."""
+
+    def __init__(self, transport: Transport, policy: HedgingPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+        self._executor = ThreadPoolExecutor(max_workers=policy.max_workers, thread_name_prefix="scorable-hedging")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def _submit(self, *args: Any) -> Optional[Future[TransportResponse]]:
+        """Send a request from the pool, or return None if all its threads are busy."""
+        with self._lock:
+            if self._in_flight >= self.policy.max_workers:
+                return None
+            self._in_flight += 1
+        future = self._executor.submit(self.transport.request, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future[TransportResponse]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _request_inline(self, *args: Any) -> TransportResponse:
+        started = time.monotonic()
+        try:
+            return self.transport.request(*args)
+        finally:
+            self.policy.record(time.monotonic() - started)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> TransportResponse:
+        args = (method, url, headers, body, post_params, _request_timeout)
+        if not is_hedged(method, headers):
+            return self.transport.request(*args)
+        delay = self.policy.delay()
+        self.policy.budget.deposit()
+        first = self._submit(*args) if delay is not None else None
+        if first is None:
+            # Not hedged: no thread hop
+            return self._request_inline(*args)
+        first.add_done_callback(self.policy.recorder())
+        if wait([first], timeout=delay).done or not self.policy.budget.withdraw():
+            return first.result()
+        hedge = self._submit(*args)
+        if hedge is None:
+            return first.result()
+
+        pending = {first, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None or not pending:
+                break
+        for future in (done | pending) - {winner}:
+            # Not started, or closes the connection once answered
+            if not future.cancel():
+                future.add_done_callback(_discard)
+        return (winner or first).result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.transport.close()
+
+
+def _discard(future: Future[TransportResponse]) -> None:
+    if future.exception() is None:
+        discard(future.result())
+
+
+class AsyncHedgedTransport:
+    """Asynchronous transport hedging the GET requests of `transport` according to `policy`."""
+
+    def __init__(self, transport: AsyncTransport, policy: HedgingPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncTransportResponse:
+        args = (method, url, headers, body, post_params, _request_timeout)
+        if not is_hedged(method, headers):
+            return await self.transport.request(*args)
+        delay = self.policy.delay()
+        self.policy.budget.deposit()
+        record = self.policy.recorder()
+        first = asyncio.ensure_future(self.transport.request(*args))
+        first.add_done_callback(record)
+        pending: Set[asyncio.Future[AsyncTransportResponse]] = {first}
+        try:
+            if delay is None or (await asyncio.wait(pending, timeout=delay))[0] or not self.policy.budget.withdraw():
+                return await first
+
+            pending.add(asyncio.ensure_future(self.transport.request(*args)))
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    break
+            for task in done - {winner}:
+                if task.exception() is None:
+                    discard(task.result())
+            return await (winner or first)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def close(self) -> None:
+        await self.transport.close()
@@ -1,61 +1,163 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional, Union, cast
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
 
-from pydantic import StrictStr
+from pydantic import BaseModel, StrictStr
 
-from scorable.generated.openapi_aclient.models.judge_generator_request import (
-    JudgeGeneratorRequest as AJudgeGeneratorRequest,
-)
-from scorable.generated.openapi_aclient.models.judge_generator_response import (
-    JudgeGeneratorResponse as AJudgeGeneratorResponse,
-)
-from scorable.generated.openapi_aclient.models.judge_generator_visibility_enum import (
-    JudgeGeneratorVisibilityEnum as AJudgeGeneratorVisibilityEnum,
-)
-from scorable.generated.openapi_aclient.models.judge_request import (
-    JudgeRequest as AJudgeRequest,
-)
-from scorable.generated.openapi_aclient.models.status_enum import (
-    StatusEnum as AStatusEnum,
-)
 from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
 from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
 from scorable.generated.openapi_client.models.judge_generator_visibility_enum import JudgeGeneratorVisibilityEnum
 from scorable.generated.openapi_client.models.judge_request import JudgeRequest
 from scorable.generated.openapi_client.models.status_enum import StatusEnum
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
-from .generated.openapi_aclient.models.evaluator_reference_request import (
-    EvaluatorReferenceRequest as AEvaluatorReferenceRequest,
-)
-from .generated.openapi_aclient.models.judge import Judge as AOpenApiJudge
-from .generated.openapi_aclient.models.judge_execution_request import (
-    JudgeExecutionRequest as AJudgeExecutionRequest,
-)
-from .generated.openapi_aclient.models.judge_execution_response import (
-    JudgeExecutionResponse as AJudgeExecutionResponse,
-)
-from .generated.openapi_aclient.models.judge_list import JudgeList as AJudgeList
-from .generated.openapi_aclient.models.paginated_judge_list_list import (
-    PaginatedJudgeListList as APaginatedJudgeListList,
-)
-from .generated.openapi_aclient.models.patched_judge_request import (
-    PatchedJudgeRequest as APatchedJudgeRequest,
-)
+from ._bulk import Outcome, abounded_map, bounded_map
+from .concurrency import AdaptiveConcurrencyLimiter
 from .generated.openapi_client import ApiClient
-from .generated.openapi_client.api.judges_api import JudgesApi
 from .generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
 from .generated.openapi_client.models.judge import Judge as OpenApiJudge
+from .generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+from .generated.openapi_client.models.judge_batch_execution_input_request import JudgeBatchExecutionInputRequest
+from .generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
+from .generated.openapi_client.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
+from .generated.openapi_client.models.judge_batch_execution_item_status_enum import (
+    JudgeBatchExecutionItemStatusEnum,
+)
+from .generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
 from .generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
 from .generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
 from .generated.openapi_client.models.judge_list import JudgeList
 from .generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
 from .generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
-from .utils import ClientContextCallable, with_async_client, with_sync_client
+from .generated.openapi_client.models.status776_enum import Status776Enum
+from .retry import idempotency_headers
+from .utils import ClientContextCallable, Poller, deadline_after, lazy_import, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
+    from .generated.openapi_client.api.judges_api import JudgesApi
+else:
+    # Imported on first use
+    AJudgesApi = lazy_import("scorable.generated.openapi_aclient.api.judges_api", "JudgesApi")
+    JudgesApi = lazy_import("scorable.generated.openapi_client.api.judges_api", "JudgesApi")
+
+JUDGE_BATCH_SIZE = 100
+"""Maximum number of inputs of a server-side judge batch execution."""
+
+JudgeBatchInput = Union[JudgeBatchExecutionInputRequest, Mapping[str, Any]]
+"""Input of a judge batch execution, with the `request`, `response`, `contexts` and `expected_output`."""
+
+_FINISHED_BATCH_STATUSES = frozenset((Status776Enum.COMPLETED, Status776Enum.FAILED, Status776Enum.PARTIAL))
+
+
+def _chunks(inputs: Iterable[JudgeBatchInput]) -> Iterator[List[JudgeBatchInput]]:
+    iterator = iter(inputs)
+    while chunk := list(islice(iterator, JUDGE_BATCH_SIZE)):
+        yield chunk
+
+
+async def _achunks(
+    inputs: Union[Iterable[JudgeBatchInput], AsyncIterable[JudgeBatchInput]],
+) -> AsyncIterator[List[JudgeBatchInput]]:
+    if not isinstance(inputs, AsyncIterable):
+        for items in _chunks(inputs):
+            yield items
+        return
+    chunk: List[JudgeBatchInput] = []
+    async for item in inputs:
+        chunk.append(item)
+        if len(chunk) == JUDGE_BATCH_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _batch_request(
+    chunk: List[JudgeBatchInput], tags: Optional[List[str]], judge_version_id: Optional[str]
+) -> JudgeBatchExecutionRequest:
+    return JudgeBatchExecutionRequest(
+        inputs=[
+            item if isinstance(item, JudgeBatchExecutionInputRequest) else JudgeBatchExecutionInputRequest(**item)
+            for item in chunk
+        ],
+        tags=tags,
+        judge_version_id=judge_version_id,
+    )
+
+
+def _item_input(item: Any) -> JudgeBatchExecutionItemInput:
+    fields = item.model_dump() if isinstance(item, BaseModel) else item if isinstance(item, Mapping) else {}
+    return JudgeBatchExecutionItemInput.model_construct(
+        **{name: value for name, value in fields.items() if name in JudgeBatchExecutionItemInput.model_fields}
+    )
+
+
+def _failed_item(index: int, item: JudgeBatchInput, error_message: str) -> JudgeBatchExecutionItem:
+    """Return a failed item standing for an input without a result."""
+    return JudgeBatchExecutionItem.model_construct(
+        index=index,
+        status=JudgeBatchExecutionItemStatusEnum.FAILED,
+        input=_item_input(item),
+        evaluator_results=None,
+        error_message=error_message,
+        execution_log_id=None,
+        started_at=None,
+        completed_at=None,
+    )
+
+
+def _reindexed(
+    detail: JudgeBatchExecutionDetail, chunk: List[JudgeBatchInput], offset: int
+) -> List[JudgeBatchExecutionItem]:
+    """Return one item per input of a server batch, in order, indexed by their position in all the inputs.
+
+    The inputs missing from the items of the batch get a failed item, so
+    that the items stay aligned with the inputs.
+    """
+    items = {item.index: item for item in detail.items}
+    missing = f"Missing from the items of batch execution {detail.batch_execution_id}"
+    return [
+        items[index].model_copy(update={"index": offset + index})
+        if index in items
+        else _failed_item(offset + index, item, missing)
+        for index, item in enumerate(chunk)
+    ]
+
+
+def _failed_items(chunk: List[JudgeBatchInput], offset: int, error: Exception) -> List[JudgeBatchExecutionItem]:
+    """Return failed items standing for the inputs of a batch that could not be run."""
+    return [_failed_item(offset + index, item, f"{type(error).__name__}: {error}") for index, item in enumerate(chunk)]
+
+
+def _batch_items(outcome: Outcome) -> List[JudgeBatchExecutionItem]:
+    """Return the items of a batch outcome of `bounded_map`, or failed ones if the batch could not be run."""
+    offset = outcome.position * JUDGE_BATCH_SIZE
+    if outcome.error is None:
+        return _reindexed(outcome.result, outcome.item, offset)
+    if isinstance(outcome.error, TimeoutError):
+        # The deadline is the one of all the batches
+        raise outcome.error
+    return _failed_items(outcome.item, offset, outcome.error)
 
 
 class Judge(OpenApiJudge):
@@ -87,6 +189,7 @@ class Judge(OpenApiJudge):
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: ApiClient,
     ) -> JudgeExecutionResponse:
         """
@@ -99,6 +202,7 @@ class Judge(OpenApiJudge):
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = JudgesApi(_client)
         execution_request = JudgeExecutionRequest(
@@ -112,10 +216,52 @@ class Judge(OpenApiJudge):
             judge_id=self.id,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
+        )
+
+    def run_batch(
+        self,
+        inputs: Iterable[JudgeBatchInput],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> Iterator[JudgeBatchExecutionItem]:
+        """
+        Run the judge on many inputs, in server-side batch executions.
+
+        See :meth:`Judges.run_batch`.
+
+        Args:
+          inputs: The inputs, as `JudgeBatchExecutionInputRequest` or dicts with the
+            `request`, `response`, `contexts` and `expected_output` of :meth:`run`.
+            `arun_batch` also accepts an async iterable.
+          judge_version_id: Version ID of the judge to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the judge executions
+          concurrency: Number of batches in progress at once
+          poll_interval: Delay before the first poll of a batch, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls of a batch, in seconds
+          timeout: Optional time for all the batches to finish, in seconds, after which TimeoutError is raised
+          _request_timeout: Optional timeout for each request
+        """
+        return Judges(self.client_context).run_batch(
+            self.id,
+            inputs,
+            judge_version_id=judge_version_id,
+            tags=tags,
+            concurrency=concurrency,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+            _request_timeout=_request_timeout,
         )
 
 
-class AJudge(AOpenApiJudge):
+class AJudge(OpenApiJudge):
     """
     Async wrapper for a single Judge.
 
@@ -126,8 +272,8 @@ class AJudge(AOpenApiJudge):
     client_context: ClientContextCallable
 
     @classmethod
-    async def _awrap(cls, apiobj: Union[AOpenApiJudge, AJudgeList], client_context: ClientContextCallable) -> AJudge:
-        if not isinstance(apiobj, (AOpenApiJudge, AJudgeList)):
+    async def _awrap(cls, apiobj: Union[OpenApiJudge, JudgeList], client_context: ClientContextCallable) -> AJudge:
+        if not isinstance(apiobj, (OpenApiJudge, JudgeList)):
             raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
         obj = cast(AJudge, apiobj)
         obj.__class__ = cls
@@ -144,8 +290,9 @@ class AJudge(AOpenApiJudge):
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
+    ) -> JudgeExecutionResponse:
         """
         Asynchronously run the judge.
 
@@ -156,9 +303,10 @@ class AJudge(AOpenApiJudge):
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
+        execution_request = JudgeExecutionRequest(
             contexts=contexts,
             expected_output=expected_output,
             request=request,
@@ -169,6 +317,48 @@ class AJudge(AOpenApiJudge):
             judge_id=self.id,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
+        )
+
+    def arun_batch(
+        self,
+        inputs: Union[Iterable[JudgeBatchInput], AsyncIterable[JudgeBatchInput]],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[JudgeBatchExecutionItem]:
+        """
+        Asynchronously run the judge on many inputs, in server-side batch executions.
+
+        See :meth:`Judges.run_batch`.
+
+        Args:
+          inputs: The inputs, as `JudgeBatchExecutionInputRequest` or dicts with the
+            `request`, `response`, `contexts` and `expected_output` of :meth:`run`.
+            `arun_batch` also accepts an async iterable.
+          judge_version_id: Version ID of the judge to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the judge executions
+          concurrency: Number of batches in progress at once
+          poll_interval: Delay before the first poll of a batch, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls of a batch, in seconds
+          timeout: Optional time for all the batches to finish, in seconds, after which TimeoutError is raised
+          _request_timeout: Optional timeout for each request
+        """
+        return Judges(self.client_context).arun_batch(
+            self.id,
+            inputs,
+            judge_version_id=judge_version_id,
+            tags=tags,
+            concurrency=concurrency,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+            _request_timeout=_request_timeout,
         )
 
 
@@ -238,7 +428,7 @@ class Judges:
         strict: bool = False,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AJudgeGeneratorResponse:
+    ) -> JudgeGeneratorResponse:
         """
         Asynchronously generate a judge.
 
@@ -257,14 +447,14 @@ class Judges:
           Wrapper for the judge id and optionally an error code if the generation failed.
         """
         api_instance = AJudgesApi(_client)
-        judge_request = AJudgeGeneratorRequest(
+        judge_request = JudgeGeneratorRequest(
             intent=intent,
             stage=stage,
             extra_contexts=extra_contexts,
             strict=strict,
-            visibility=AJudgeGeneratorVisibilityEnum.GLOBAL
+            visibility=JudgeGeneratorVisibilityEnum.GLOBAL
             if visibility == "public"
-            else AJudgeGeneratorVisibilityEnum.UNLISTED,
+            else JudgeGeneratorVisibilityEnum.UNLISTED,
         )
         return await api_instance.judges_generate_create(
             judge_generator_request=judge_request, _request_timeout=_request_timeout
@@ -312,7 +502,7 @@ class Judges:
         *,
         name: str,
         intent: str,
-        evaluator_references: Optional[List[AEvaluatorReferenceRequest]] = None,
+        evaluator_references: Optional[List[EvaluatorReferenceRequest]] = None,
         stage: Optional[str] = None,
         status: Literal["unlisted", "listed", "public", "public_unlisted"] = "unlisted",
         _request_timeout: Optional[int] = None,
@@ -330,12 +520,12 @@ class Judges:
           _request_timeout: Optional timeout for the request
         """
         api_instance = AJudgesApi(_client)
-        request = AJudgeRequest(
+        request = JudgeRequest(
             name=name,
             intent=intent,
             evaluator_references=evaluator_references,
             stage=stage,
-            status=AStatusEnum(status),
+            status=StatusEnum(status),
         )
         return await AJudge._awrap(
             await api_instance.judges_create(judge_request=request, _request_timeout=_request_timeout),
@@ -430,7 +620,7 @@ class Judges:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedJudgeListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedJudgeListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -480,7 +670,7 @@ class Judges:
         judge_id: str,
         *,
         name: Optional[str] = None,
-        evaluator_references: Optional[List[AEvaluatorReferenceRequest]] = None,
+        evaluator_references: Optional[List[EvaluatorReferenceRequest]] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
     ) -> AJudge:
@@ -493,7 +683,7 @@ class Judges:
           evaluator_references: New list of evaluator references
         """
         api_instance = AJudgesApi(_client)
-        request = APatchedJudgeRequest(
+        request = PatchedJudgeRequest(
             name=name,
             evaluator_references=evaluator_references,
         )
@@ -517,6 +707,7 @@ class Judges:
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: ApiClient,
     ) -> JudgeExecutionResponse:
         """
@@ -530,6 +721,7 @@ class Judges:
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = JudgesApi(_client)
         execution_request = JudgeExecutionRequest(
@@ -543,6 +735,7 @@ class Judges:
             judge_id=judge_id,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     @with_async_client
@@ -556,8 +749,9 @@ class Judges:
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
+    ) -> JudgeExecutionResponse:
         """
         Asynchronously run a judge directly by ID.
 
@@ -569,9 +763,10 @@ class Judges:
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
+        execution_request = JudgeExecutionRequest(
             contexts=contexts,
             expected_output=expected_output,
             request=request,
@@ -582,6 +777,7 @@ class Judges:
             judge_id=judge_id,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     @with_sync_client
@@ -595,6 +791,7 @@ class Judges:
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: ApiClient,
     ) -> JudgeExecutionResponse:
         """
@@ -608,6 +805,7 @@ class Judges:
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = JudgesApi(_client)
         execution_request = JudgeExecutionRequest(
@@ -621,6 +819,7 @@ class Judges:
             name=name,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     @with_async_client
@@ -634,8 +833,9 @@ class Judges:
         expected_output: Optional[str] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
+    ) -> JudgeExecutionResponse:
         """
         Asynchronously run a judge by name.
 
@@ -647,9 +847,10 @@ class Judges:
           expected_output: Optional expected output
           tags: Optional tags to add to the judge execution
           _request_timeout: Optional timeout for the request
+          _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
         api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
+        execution_request = JudgeExecutionRequest(
             contexts=contexts,
             expected_output=expected_output,
             request=request,
@@ -660,4 +861,166 @@ class Judges:
             name=name,
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
+        )
+
+    def run_batch(
+        self,
+        judge_id: str,
+        inputs: Iterable[JudgeBatchInput],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> Iterator[JudgeBatchExecutionItem]:
+        """
+        Run a judge on many inputs, in server-side batch executions.
+
+        The inputs are split into batches of at most 100 inputs, submitted in
+        parallel and polled until done. The items of the batches are yielded in
+        the order of the inputs, with their position in the inputs as `index`.
+        A failed execution does not stop the others: its item has the status
+        `failed` and an `error_message`. So do the items of a batch that could
+        not be submitted or polled (with the exception as `error_message`), and
+        those missing from the items of a finished batch: there is always one
+        item per input.
+
+        Args:
+          judge_id: ID of the judge to run
+          inputs: The inputs, as `JudgeBatchExecutionInputRequest` or dicts with the
+            `request`, `response`, `contexts` and `expected_output` of :meth:`run`.
+            `arun_batch` also accepts an async iterable.
+          judge_version_id: Version ID of the judge to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the judge executions
+          concurrency: Number of batches in progress at once
+          poll_interval: Delay before the first poll of a batch, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls of a batch, in seconds
+          timeout: Optional time for all the batches to finish, in seconds, after which TimeoutError is raised
+          _request_timeout: Optional timeout for each request
+        """
+        deadline = deadline_after(timeout)
+
+        def run(chunk: List[JudgeBatchInput]) -> JudgeBatchExecutionDetail:
+            return self._run_batch_chunk(
+                judge_id,
+                _batch_request(chunk, tags, judge_version_id),
+                poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
+                deadline=deadline,
+                _request_timeout=_request_timeout,
+            )
+
+        limiter = AdaptiveConcurrencyLimiter.fixed(concurrency)
+        for outcome in bounded_map(run, _chunks(inputs), limiter):
+            yield from _batch_items(outcome)
+
+    async def arun_batch(
+        self,
+        judge_id: str,
+        inputs: Union[Iterable[JudgeBatchInput], AsyncIterable[JudgeBatchInput]],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[JudgeBatchExecutionItem]:
+        """
+        Asynchronously run a judge on many inputs, in server-side batch executions.
+
+        The inputs are split into batches of at most 100 inputs, submitted in
+        parallel and polled until done. The items of the batches are yielded in
+        the order of the inputs, with their position in the inputs as `index`.
+        A failed execution does not stop the others: its item has the status
+        `failed` and an `error_message`. So do the items of a batch that could
+        not be submitted or polled (with the exception as `error_message`), and
+        those missing from the items of a finished batch: there is always one
+        item per input.
+
+        Args:
+          judge_id: ID of the judge to run
+          inputs: The inputs, as `JudgeBatchExecutionInputRequest` or dicts with the
+            `request`, `response`, `contexts` and `expected_output` of :meth:`run`.
+            `arun_batch` also accepts an async iterable.
+          judge_version_id: Version ID of the judge to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the judge executions
+          concurrency: Number of batches in progress at once
+          poll_interval: Delay before the first poll of a batch, in seconds, doubled after each poll
+          max_poll_interval: Longest delay between two polls of a batch, in seconds
+          timeout: Optional time for all the batches to finish, in seconds, after which TimeoutError is raised
+          _request_timeout: Optional timeout for each request
+        """
+        deadline = deadline_after(timeout)
+
+        async def run(chunk: List[JudgeBatchInput]) -> JudgeBatchExecutionDetail:
+            return await self._arun_batch_chunk(
+                judge_id,
+                _batch_request(chunk, tags, judge_version_id),
+                poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
+                deadline=deadline,
+                _request_timeout=_request_timeout,
+            )
+
+        limiter = AdaptiveConcurrencyLimiter.fixed(concurrency)
+        async for outcome in abounded_map(run, _achunks(inputs), limiter):
+            for item in _batch_items(outcome):
+                yield item
+
+    @with_sync_client
+    def _run_batch_chunk(
+        self,
+        judge_id: str,
+        batch_request: JudgeBatchExecutionRequest,
+        *,
+        poll_interval: float,
+        max_poll_interval: float,
+        deadline: Optional[float],
+        _request_timeout: Optional[int],
+        _client: ApiClient,
+    ) -> JudgeBatchExecutionDetail:
+        """Submit a batch execution and poll it until done."""
+        api_instance = JudgesApi(_client)
+        batch = api_instance.judges_batch_execute_create(
+            judge_id=judge_id, judge_batch_execution_request=batch_request, _request_timeout=_request_timeout
+        )
+        poller = Poller(f"Judge batch execution {batch.batch_execution_id}", poll_interval, max_poll_interval, deadline)
+        while True:
+            time.sleep(poller.delay())
+            detail = api_instance.judges_batch_executions_retrieve(
+                id=batch.batch_execution_id, _request_timeout=_request_timeout
+            )
+            if detail.status in _FINISHED_BATCH_STATUSES:
+                return detail
+
+    @with_async_client
+    async def _arun_batch_chunk(
+        self,
+        judge_id: str,
+        batch_request: JudgeBatchExecutionRequest,
+        *,
+        poll_interval: float,
+        max_poll_interval: float,
+        deadline: Optional[float],
+        _request_timeout: Optional[int],
+        _client: AApiClient,
+    ) -> JudgeBatchExecutionDetail:
+        """Asynchronously submit a batch execution and poll it until done."""
+        api_instance = AJudgesApi(_client)
+        batch = await api_instance.judges_batch_execute_create(
+            judge_id=judge_id, judge_batch_execution_request=batch_request, _request_timeout=_request_timeout
         )
+        poller = Poller(f"Judge batch execution {batch.batch_execution_id}", poll_interval, max_poll_interval, deadline)
+        while True:
+            await asyncio.sleep(poller.delay())
+            detail = await api_instance.judges_batch_executions_retrieve(
+                id=batch.batch_execution_id, _request_timeout=_request_timeout
+            )
+            if detail.status in _FINISHED_BATCH_STATUSES:
+                return detail
@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 from contextlib import AbstractAsyncContextManager
 from functools import partial
 from typing import (
+    TYPE_CHECKING,
     AsyncIterator,
     Iterator,
     List,
@@ -9,26 +12,29 @@ from typing import (
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.models_api import ModelsApi as AModelsApi
-from .generated.openapi_aclient.models.model_list import ModelList as AModelItem
-from .generated.openapi_aclient.models.model_request import (
-    ModelRequest as AModelRequest,
-)
-from .generated.openapi_aclient.models.paginated_model_list_list import (
-    PaginatedModelListList as APaginatedModelListList,
-)
 from .generated.openapi_client import ApiClient
-from .generated.openapi_client.api.models_api import ModelsApi as ModelsApi
 from .generated.openapi_client.models.model_list import ModelList as ModelItem
 from .generated.openapi_client.models.model_request import ModelRequest
+from .generated.openapi_client.models.paginated_model_list_list import (
+    PaginatedModelListList,
+)
 from .utils import (
     ClientContextCallable,
     iterate_cursor_list,
+    lazy_import,
     with_async_client,
     with_sync_client,
 )
 
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.models_api import ModelsApi as AModelsApi
+    from .generated.openapi_client.api.models_api import ModelsApi
+else:
+    # Imported on first use
+    AModelsApi = lazy_import("scorable.generated.openapi_aclient.api.models_api", "ModelsApi")
+    ModelsApi = lazy_import("scorable.generated.openapi_client.api.models_api", "ModelsApi")
+
 
 class Models:
     """Models (sub) API
@@ -68,7 +74,7 @@ class Models:
         *,
         capable_of: Optional[List[str]] = None,
         limit: int = 100,
-    ) -> AsyncIterator[AModelItem]:
+    ) -> AsyncIterator[ModelItem]:
         """Asynchronously iterate through the models.
 
         Args:
@@ -84,7 +90,7 @@ class Models:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedModelListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedModelListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -154,7 +160,7 @@ class Models:
           url: Optional URL pointing to the model's endpoint.
         """
 
-        request = AModelRequest(
+        request = ModelRequest(
             name=name,
             model=model,
             default_key=default_key,
@@ -0,0 +1,408 @@
+"""Client-side rate limiting.
+
+A :class:`RateLimiter` passed to the client is shared by all its sub-APIs,
+threads and event loops::
+
+  client = Scorable(rate_limit=RateLimiter(10, policy="queue"))
+
+Every request then takes a token from a token bucket, refilled at `rate`
+tokens per second up to `burst` tokens. When the bucket is empty, the
+request is handled according to the policy:
+
+- ``"queue"``: wait for a token (the thread sleeps, or the task awaits),
+- ``"raise"``: raise :class:`RateLimitError`, asking the caller to back off
+  and send the request again after its `retry_after`,
+- ``"drop"``: shed the request: it is not sent, and :class:`RequestDroppedError`
+  is raised. It is not a RateLimitError, so that the code retrying rate
+  limited requests does not resend the dropped ones.
+
+Rate limit errors are not retried (see :mod:`scorable.retry`), nor counted
+as failures by the circuit breaker: the request never reached the API.
+
+The limiter also adapts to the rate limit headers of the responses
+(`Retry-After` of throttled responses, and the `RateLimit-Remaining` and
+`RateLimit-Reset` headers, or their `X-` prefixed variants): the refill
+rate is lowered to what the API still allows, and the bucket is paused
+until the API accepts requests again.
+
+The bucket is in-process by default. Processes sharing an API key on a
+host (e.g. the workers of a web server) can share one budget with a
+:class:`FileTokenBucket`::
+
+  bucket = FileTokenBucket("/tmp/scorable-rate-limit", rate=10, capacity=10)
+  client = Scorable(rate_limit=RateLimiter(10, bucket=bucket))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import os
+import struct
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Generator, List, Literal, Optional, Protocol, Tuple, Union
+
+from .transport import AsyncTransport, AsyncTransportResponse, RequestTimeout, Transport, TransportResponse
+
+Policy = Literal["queue", "drop", "raise"]
+
+_POLICIES = ("queue", "drop", "raise")
+
+# X-RateLimit-Reset values above this are epoch timestamps, not delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Tokens, update time, end of the pause and refill rate of a FileTokenBucket
+_FILE_STATE = struct.Struct("<4d")
+
+
+class RateLimitError(Exception):
+    """The request is over the client-side rate limit, and can be sent again after `retry_after`.
+
+    Attributes:
+        retry_after: Seconds until a token is available.
+    """
+
+    def __init__(self, retry_after: float, message: str = "Rate limit exceeded") -> None:
+        super().__init__(f"{message}, retry after {retry_after:.3f}s")
+        self.retry_after = retry_after
+
+
+class RequestDroppedError(Exception):
+    """The request was dropped by the ``"drop"`` policy, without being sent.
+
+    Unlike :class:`RateLimitError`, it is meant to be skipped rather than
+    sent again.
+
+    Attributes:
+        retry_after: Seconds until a token is available.
+    """
+
+    def __init__(self, retry_after: float, message: str = "Request dropped by the rate limiter") -> None:
+        super().__init__(f"{message}, retry after {retry_after:.3f}s")
+        self.retry_after = retry_after
+
+
+class Bucket(Protocol):
+    """Token bucket storage of a :class:`RateLimiter`."""
+
+    def take(self, tokens: float = 1.0) -> float:
+        """Take `tokens` if available, returning 0; otherwise take nothing and
+        return the seconds until they are available."""
+        ...
+
+    def adjust(self, *, rate: Optional[float] = None, pause: Optional[float] = None) -> None:
+        """Set the refill rate, and/or empty the bucket and stop refilling it for `pause` seconds."""
+        ...
+
+
+class TokenBucket:
+    """Thread-safe in-process token bucket.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens; the bucket starts full.
+        clock: Monotonic clock, in seconds.
+    """
+
+    def __init__(self, rate: float, capacity: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    @contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        with self._lock:
+            yield
+
+    def take(self, tokens: float = 1.0) -> float:
+        with self._locked():
+            now = self._clock()
+            self._refill(now)
+            if now >= self._paused_until and self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return max(self._paused_until - now, 0.0) + (tokens - self._tokens) / self.rate
+
+    def adjust(self, *, rate: Optional[float] = None, pause: Optional[float] = None) -> None:
+        with self._locked():
+            now = self._clock()
+            self._refill(now)
+            if rate is not None:
+                self.rate = rate
+            if pause is not None:
+                self._tokens = 0.0
+                self._paused_until = max(self._paused_until, now + pause)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket shared by the processes of a host through a file.
+
+    The bucket (tokens, timestamps and refill rate) is stored in `path`,
+    and updated under an exclusive `flock`, so that all the processes
+    using the same path (e.g. the workers of a gunicorn server sharing one
+    API key) draw from one budget, without an external service. The rate
+    adjustments made by the rate limit headers are shared too.
+
+    POSIX only. The clock is the wall clock, which is the one shared by
+    the processes.
+
+    Args:
+        path: File storing the bucket; created if missing, and otherwise
+          used as is (`rate` and `capacity` only initialize a new file).
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], rate: float, capacity: float) -> None:
+        if sys.platform == "win32":
+            raise RuntimeError("FileTokenBucket requires a POSIX system")
+        super().__init__(rate, capacity, clock=time.time)
+        self.path = os.fspath(path)
+        self._fd = -1
+        self._pid = -1
+
+    def _open(self) -> int:
+        # flock locks belong to the open file, which is shared with forked
+        # processes: each process opens the file itself
+        if self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    @contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        import fcntl
+
+        # The process lock serializes the threads, which share the open file
+        with self._lock:
+            fd = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(fd, _FILE_STATE.size, 0)
+                if len(data) == _FILE_STATE.size:
+                    self._tokens, self._updated, self._paused_until, self.rate = _FILE_STATE.unpack(data)
+                yield
+                os.pwrite(fd, _FILE_STATE.pack(self._tokens, self._updated, self._paused_until, self.rate), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Token bucket rate limiter of a client.
+
+    Args:
+        rate: Requests per second.
+        burst: Maximum number of requests sent at once after an idle period
+          (the bucket capacity); defaults to `rate`, and at least 1.
+        policy: What to do with requests over the limit: ``"queue"``,
+          ``"drop"`` or ``"raise"`` (see :mod:`scorable.rate_limit`).
+        max_queue: Maximum number of requests waiting for a token with the
+          ``"queue"`` policy; further ones raise :class:`RateLimitError`.
+        adaptive: Whether to adapt to the rate limit headers of the responses.
+        bucket: Token bucket storage; an in-process :class:`TokenBucket` by default,
+          or a :class:`FileTokenBucket` to share the budget between processes.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        policy: Policy = "queue",
+        max_queue: Optional[int] = None,
+        adaptive: bool = True,
+        bucket: Optional[Bucket] = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if policy not in _POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(_POLICIES)}")
+        self.rate = rate
+        self.policy = policy
+        self.max_queue = max_queue
+        self.adaptive = adaptive
+        self.bucket: Bucket = bucket if bucket is not None else TokenBucket(rate, max(burst or rate, 1.0))
+        # Only the in-process bucket is known not to block (a FileTokenBucket
+        # waits for its file lock), so the others are used from a thread in
+        # the event loop
+        self._blocking = type(self.bucket) is not TokenBucket
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    def _over_limit(self, delay: float) -> None:
+        if self.policy == "drop":
+            raise RequestDroppedError(delay)
+        if self.policy == "raise":
+            raise RateLimitError(delay)
+
+    @contextmanager
+    def _queued(self, delay: float) -> Generator[None, None, None]:
+        with self._lock:
+            if self.max_queue is not None and self._waiting >= self.max_queue:
+                raise RateLimitError(delay, "Rate limiter queue is full")
+            self._waiting += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def acquire(self) -> None:
+        """Take a token for a request, waiting for it with the ``"queue"`` policy.
+
+        Raises:
+            RateLimitError: If there is no token (``"raise"`` policy), or too many requests are queued.
+            RequestDroppedError: If there is no token (``"drop"`` policy).
+        """
+        delay = self.bucket.take()
+        if not delay:
+            return
+        self._over_limit(delay)
+        with self._queued(delay):
+            while delay:
+                time.sleep(delay)
+                delay = self.bucket.take()
+
+    async def _atake(self) -> float:
+        if self._blocking:
+            return await asyncio.to_thread(self.bucket.take)
+        return self.bucket.take()
+
+    async def aacquire(self) -> None:
+        """Asynchronous :meth:`acquire`, which awaits instead of blocking the thread."""
+        delay = await self._atake()
+        if not delay:
+            return
+        self._over_limit(delay)
+        with self._queued(delay):
+            while delay:
+                await asyncio.sleep(delay)
+                delay = await self._atake()
+
+    def _adjustment(self, status: int, getheader: Callable[[str], Optional[str]]) -> Optional[Dict[str, float]]:
+        """Return the bucket adjustment called for by the rate limit headers of a response."""
+        if not self.adaptive:
+            return None
+        if status in (429, 503):
+            retry_after = parse_retry_after(getheader("Retry-After"))
+            if retry_after is not None:
+                return {"pause": retry_after}
+        remaining = _parse_float(getheader("RateLimit-Remaining") or getheader("X-RateLimit-Remaining"))
+        reset = _parse_reset(getheader("RateLimit-Reset") or getheader("X-RateLimit-Reset"))
+        if remaining is None or reset is None:
+            return None
+        if remaining < 1:
+            return {"pause": reset}
+        if reset > 0:
+            return {"rate": min(self.rate, remaining / reset)}
+        return {"rate": self.rate}
+
+    def update(self, status: int, getheader: Callable[[str], Optional[str]]) -> None:
+        """Adapt to the rate limit headers of a response."""
+        adjustment = self._adjustment(status, getheader)
+        if adjustment is not None:
+            self.bucket.adjust(**adjustment)
+
+    async def aupdate(self, status: int, getheader: Callable[[str], Optional[str]]) -> None:
+        """Asynchronous :meth:`update`, which does not block the event loop."""
+        adjustment = self._adjustment(status, getheader)
+        if adjustment is None:
+            return
+        if self._blocking:
+            await asyncio.to_thread(partial(self.bucket.adjust, **adjustment))
+        else:
+            self.bucket.adjust(**adjustment)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header (seconds, or HTTP date) to seconds from now."""
+    if not value:
+        return None
+    delay = _parse_float(value)
+    if delay is None:
+        try:
+            delay = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(delay, 0.0)
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        # RateLimit-* header values may carry parameters (e.g. `10;w=60`)
+        return float(value.split(";", 1)[0].split(",", 1)[0])
+    except ValueError:
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    reset = _parse_float(value)
+    if reset is not None and reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0) if reset is not None else None
+
+
+class RateLimitedTransport:
+    """Synchronous transport sending the requests of `transport` through `limiter`."""
+
+    def __init__(self, transport: Transport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> TransportResponse:
+        self.limiter.acquire()
+        response = self.transport.request(method, url, headers, body, post_params, _request_timeout)
+        self.limiter.update(response.status, response.getheader)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport:
+    """Asynchronous transport sending the requests of `transport` through `limiter`."""
+
+    def __init__(self, transport: AsyncTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncTransportResponse:
+        await self.limiter.aacquire()
+        response = await self.transport.request(method, url, headers, body, post_params, _request_timeout)
+        await self.limiter.aupdate(response.status, response.getheader)
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
@@ -0,0 +1,272 @@
+"""Retrying of failed requests.
+
+A :class:`RetryPolicy` passed to the client retries the requests that
+failed transiently (connection errors, and throttled or unavailable
+responses) for every sub-API::
+
+  client = Scorable(retry=RetryPolicy(attempts=4))
+
+The retries wait with exponential backoff and full jitter (a random delay
+between 0 and ``backoff * 2**retry``), or as long as the `Retry-After`
+header of 429 and 503 responses asks. A retry budget caps the share of
+retries in the traffic, so that an outage or throttling is not made worse
+by every request being sent `attempts` times.
+
+Only idempotent requests are retried: the GET, HEAD, OPTIONS, PUT and
+DELETE ones, and any request with an `Idempotency-Key` header. The API
+clients attach one to every execution and batch job creation (see
+:data:`IDEMPOTENT_OPERATIONS`); it is generated once per call, and sent
+again with each retry, so that the API runs and bills the call once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple, Type
+
+import urllib3
+
+from .rate_limit import parse_retry_after
+from .transport import AsyncTransport, AsyncTransportResponse, RequestTimeout, Transport, TransportResponse
+
+if TYPE_CHECKING:
+    from .concurrency import AdaptiveConcurrencyLimiter
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# POST operations (resource path templates) sent with an idempotency key
+IDEMPOTENT_OPERATIONS = frozenset(
+    (
+        "/v1/evaluators/execute/{id}/",
+        "/v1/evaluators/execute/by-name/",
+        "/v1/judges/{judge_id}/execute/",
+        "/v1/judges/execute/by-name/",
+        "/v1/judges/{judge_id}/batch-execute/",
+        "/v1/beta/evaluation-jobs/",
+    )
+)
+
+
+def idempotency_headers(key: Optional[str]) -> Optional[Dict[str, str]]:
+    """Return the `_headers` of a generated API call sending `key` as its idempotency key."""
+    return {IDEMPOTENCY_KEY_HEADER: key} if key else None
+
+
+def with_idempotency_key(
+    method: str, resource_path: str, headers: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Add a new idempotency key to the `headers` of an :data:`IDEMPOTENT_OPERATIONS` request without one."""
+    if method != "POST" or resource_path not in IDEMPOTENT_OPERATIONS:
+        return headers
+    if any(name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers or ()):
+        return headers
+    return {**(headers or {}), IDEMPOTENCY_KEY_HEADER: str(uuid.uuid4())}
+
+
+class RetryBudget:
+    """Retry tokens: every request deposits `ratio` tokens, and every retry takes one.
+
+    The balance starts at, and is capped to, `min_retries`; so retries
+    are at most `ratio` of the requests over time, beyond a burst of
+    `min_retries`. Thread-safe.
+    """
+
+    def __init__(self, ratio: float, min_retries: int) -> None:
+        self.ratio = ratio
+        self.capacity = max(min_retries, 1)
+        self._balance = float(self.capacity)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Retry policy of a client.
+
+    Args:
+        attempts: Maximum number of attempts of a request, including the first one.
+        backoff: Base delay in seconds: retry `n` (from 0) waits a random time between 0
+          and ``backoff * 2**n`` seconds, capped to `max_backoff`.
+        max_backoff: Maximum delay between attempts, in seconds.
+        statuses: Response statuses that are retried.
+        max_retry_after: Longest `Retry-After` delay honored, in seconds; responses
+          asking for a longer one are not retried.
+        budget: Maximum share of retries among the requests (see :class:`RetryBudget`).
+        min_retries: Retries allowed regardless of the budget, e.g. after an idle period.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        statuses: Collection[int] = (429, 502, 503, 504),
+        max_retry_after: float = 60.0,
+        budget: float = 0.2,
+        min_retries: int = 10,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+        self.budget = RetryBudget(budget, min_retries)
+
+    def is_retryable(self, method: str, headers: Optional[Dict[str, str]]) -> bool:
+        """Whether a request may be retried: it is idempotent, or has an idempotency key."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return any(name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers or ())
+
+    def delay(self, retry: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Return the delay before retry `retry` (from 0), or None if the request is not to be retried."""
+        if retry + 1 >= self.attempts:
+            return None
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if not self.budget.withdraw():
+            return None
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**retry))  # noqa: S311
+
+    def is_overload(self, response: Any) -> bool:
+        """Whether a retried response signals an overloaded API (throttled, or a server error)."""
+        return response.status == 429 or response.status >= 500
+
+    def response_delay(self, retry: int, response: Any) -> Optional[float]:
+        if response.status not in self.statuses:
+            return None
+        retry_after = None
+        if response.status in (429, 503):
+            retry_after = parse_retry_after(response.getheader("Retry-After"))
+        return self.delay(retry, retry_after)
+
+
+def _sync_errors() -> Tuple[Type[BaseException], ...]:
+    errors: Tuple[Type[BaseException], ...] = (OSError, urllib3.exceptions.HTTPError)
+    # httpx is only imported by its transports
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        errors += (httpx.TransportError,)
+    return errors
+
+
+def _async_errors() -> Tuple[Type[BaseException], ...]:
+    import aiohttp
+
+    return (*_sync_errors(), asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+
+class RetryTransport:
+    """Synchronous transport retrying the requests of `transport` according to `policy`.
+
+    The retried overload responses and connection errors are reported to
+    `limiter`, which would otherwise only see the outcome of the last attempt.
+    """
+
+    def __init__(
+        self, transport: Transport, policy: RetryPolicy, limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> None:
+        self.transport = transport
+        self.policy = policy
+        self.limiter = limiter
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> TransportResponse:
+        self.policy.budget.deposit()
+        retryable = self.policy.is_retryable(method, headers)
+        retry = 0
+        while True:
+            try:
+                response = self.transport.request(method, url, headers, body, post_params, _request_timeout)
+            except _sync_errors():
+                delay = self.policy.delay(retry) if retryable else None
+                if delay is None:
+                    raise
+                overloaded = True
+            else:
+                delay = self.policy.response_delay(retry, response) if retryable else None
+                if delay is None:
+                    return response
+                overloaded = self.policy.is_overload(response)
+                # Releases the connection
+                response.read()
+            if overloaded and self.limiter is not None:
+                self.limiter.overloaded()
+            time.sleep(delay)
+            retry += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport:
+    """Asynchronous :class:`RetryTransport`."""
+
+    def __init__(
+        self, transport: AsyncTransport, policy: RetryPolicy, limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> None:
+        self.transport = transport
+        self.policy = policy
+        self.limiter = limiter
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncTransportResponse:
+        self.policy.budget.deposit()
+        retryable = self.policy.is_retryable(method, headers)
+        retry = 0
+        while True:
+            try:
+                response = await self.transport.request(method, url, headers, body, post_params, _request_timeout)
+            except _async_errors():
+                delay = self.policy.delay(retry) if retryable else None
+                if delay is None:
+                    raise
+                overloaded = True
+            else:
+                delay = self.policy.response_delay(retry, response) if retryable else None
+                if delay is None:
+                    return response
+                overloaded = self.policy.is_overload(response)
+                await response.read()
+            if overloaded and self.limiter is not None:
+                self.limiter.overloaded()
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def close(self) -> None:
+        await self.transport.close()
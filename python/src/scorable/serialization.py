@@ -0,0 +1,358 @@
+"""Encoding and decoding of the API payloads.
+
+JSON is handled by the fastest available backend, selected at import
+time: orjson, then msgspec, then the standard library `json` module. The
+fast backends encode straight to `bytes` and decode straight from the
+response bytes, without going through an intermediate `str`; install one
+with the `speedups` extra (``pip install 'scorable[speedups]'``).
+
+Request bodies are encoded by :func:`encode_body` in one pass over the
+models, instead of the `to_dict`, `sanitize_for_serialization` and
+`json.dumps` passes of the generated code.
+
+Response models are normally built by the generated `from_dict`, which
+validates the data with pydantic. :func:`construct_model` builds them
+without validation instead, for clients that trust the API responses
+(``Scorable(trusted_responses=True)``).
+"""
+
+from __future__ import annotations
+
+import datetime
+import importlib
+import json
+import typing
+from enum import Enum
+from functools import lru_cache
+from types import ModuleType, NoneType, UnionType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+M = TypeVar("M", bound=BaseModel)
+
+# The slots of pydantic models, set directly (as model_construct does, but
+# without going through object.__setattr__)
+_new = object.__new__
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+#: Name of the selected backend: "orjson", "msgspec" or "json"
+JSON_BACKEND: str
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[Union[bytes, str]], Any]
+_decode_error: Any
+
+
+def _import_optional(name: str) -> Optional[ModuleType]:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+orjson = _import_optional("orjson")
+msgspec = _import_optional("msgspec")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _select_backend(name: Optional[str] = None) -> None:
+    """Select the JSON backend, the fastest installed one by default."""
+    global JSON_BACKEND, _dumps, _loads, _decode_error
+
+    if name is None:
+        name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+    if name == "orjson" and orjson is not None:
+        _dumps, _loads, _decode_error = orjson.dumps, orjson.loads, orjson.JSONDecodeError
+    elif name == "msgspec" and msgspec is not None:
+        _dumps, _loads, _decode_error = msgspec.json.encode, msgspec.json.decode, msgspec.DecodeError
+    elif name == "json":
+        _dumps, _loads, _decode_error = _json_dumps, json.loads, json.JSONDecodeError
+    else:
+        raise ValueError(f"JSON backend {name!r} is not available")
+    JSON_BACKEND = name
+
+
+_select_backend()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a JSON-compatible object to UTF-8 encoded JSON."""
+    return _dumps(obj)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from `bytes` (UTF-8) or `str`.
+
+    Raises:
+        ValueError: If `data` is not valid JSON.
+    """
+    try:
+        return _loads(data)
+    except _decode_error as e:
+        if isinstance(e, ValueError):
+            raise
+        raise ValueError(str(e)) from e
+
+
+Converter = Callable[[Any], Any]
+
+
+def construct_model(klass: Type[M], data: Dict[str, Any]) -> M:
+    """Build `klass` from the API response `data` without validating it.
+
+    The result is the same as with the generated `klass.from_dict(data)`
+    for valid data: nested models, enums and dates are converted to the
+    annotated types (recursively), and missing fields are set to their
+    defaults, or None. Invalid data is not detected, though.
+    """
+    return model_converter(klass)(data)
+
+
+def model_converter(klass: Type[BaseModel]) -> Converter:
+    """Return the (cached) function doing :func:`construct_model` for `klass`.
+
+    The function returns None for None.
+    """
+    return _model_converter(klass)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _converter(annotation: Any) -> Converter:
+    """Return the function converting JSON data to `annotation`."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _converter(args[0])
+    if origin is Union or origin is UnionType:
+        converters = [_converter(arg) for arg in args if arg is not NoneType]
+        # Unions of scalars (e.g. Union[StrictFloat, StrictInt]) need no conversion
+        if len(converters) == 1:
+            return converters[0]
+        return _identity
+    if origin is list or origin is dict:
+        return _container_converter(origin, args)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_converter(annotation)
+        if issubclass(annotation, Enum):
+            enum = annotation
+            return lambda value: enum(value) if value is not None else None
+        if issubclass(annotation, datetime.date):
+            return _date_converter(annotation)
+    return _identity
+
+
+def _container_converter(origin: type, args: Tuple[Any, ...]) -> Converter:
+    item = _converter(args[-1]) if args else _identity
+    if item is _identity:
+        return _identity
+    if origin is list:
+        return lambda value: [item(v) for v in value] if value is not None else None
+    return lambda value: {k: item(v) for k, v in value.items()} if value is not None else None
+
+
+def _date_converter(klass: Type[datetime.date]) -> Converter:
+    adapter: TypeAdapter[datetime.date] = TypeAdapter(klass)
+
+    def convert(value: Any) -> Any:
+        if value is None or not isinstance(value, str):
+            return value
+        try:
+            return klass.fromisoformat(value)
+        except ValueError:
+            # Formats accepted by pydantic that fromisoformat does not know
+            return adapter.validate_python(value)
+
+    return convert
+
+
+def _model_fields(klass: Type[BaseModel]) -> Tuple[Dict[str, Any], Dict[str, str], List[Tuple[str, Converter]]]:
+    """Return the defaults, aliases and converters of the fields of `klass`."""
+    defaults: Dict[str, Any] = {}
+    aliases: Dict[str, str] = {}
+    converters: List[Tuple[str, Converter]] = []
+    for name, field in klass.model_fields.items():
+        defaults[name] = field.default if field.default not in (PydanticUndefined, Ellipsis) else None
+        if field.alias and field.alias != name:
+            aliases[field.alias] = name
+        converter = _converter(field.annotation)
+        if converter is not _identity:
+            converters.append((name, converter))
+    return defaults, aliases, converters
+
+
+@lru_cache(maxsize=None)
+def _model_converter(klass: Type[BaseModel]) -> Converter:
+    # Like from_dict, every field is set: to the value in the data, or to its default
+    defaults, aliases, converters = _model_fields(klass)
+    non_null_defaults = [(name, default) for name, default in defaults.items() if default is not None]
+    names = set(defaults)
+    keys = names | set(aliases)
+    construct = _model_constructor(klass, names)
+
+    def convert(data: Any) -> Any:
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            return klass.model_validate(data)
+        if not data.keys() <= names:
+            # Aliased or unknown keys
+            data = {aliases.get(key, key): value for key, value in data.items() if key in keys}
+        values = {**defaults, **data}
+        for name, default in non_null_defaults:
+            if values[name] is None:
+                values[name] = default
+        for name, converter in converters:
+            value = values[name]
+            if value is not None:
+                values[name] = converter(value)
+        return construct(values)
+
+    return convert
+
+
+def _model_constructor(klass: Type[BaseModel], fields_set: Set[str]) -> Callable[[Dict[str, Any]], Any]:
+    if klass.__pydantic_post_init__ or klass.__private_attributes__ or klass.model_config.get("extra") == "allow":
+        return lambda values: klass.model_construct(set(fields_set), **values)
+
+    # What model_construct does, minus the per-field bookkeeping
+    def construct(values: Dict[str, Any]) -> Any:
+        model = _new(klass)
+        _set_dict(model, values)
+        _set_fields_set(model, set(fields_set))
+        _set_extra(model, None)
+        _set_private(model, None)
+        return model
+
+    return construct
+
+
+def encode_body(body: Any) -> bytes:
+    """Encode a request body (model, or JSON-compatible data containing models) to JSON.
+
+    The result is the same as with the generated clients, which convert
+    the models with their `to_dict` and encode the result with
+    `json.dumps`; but there is just one pass over the models, with
+    serializers compiled once per model class.
+    """
+    return json_dumps(_sanitize(body))
+
+
+_PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+
+
+def _sanitize(obj: Any) -> Any:
+    """What `sanitize_for_serialization` of the generated clients does."""
+    if obj is None or isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+    if isinstance(obj, BaseModel):
+        return _model_serializer(type(obj))(obj)
+    if isinstance(obj, list):
+        return [_sanitize(item) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(_sanitize(item) for item in obj)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if not isinstance(obj, dict):
+        obj = obj.to_dict()
+    return {key: _sanitize(value) for key, value in obj.items()}
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if value is not None else None
+
+
+@lru_cache(maxsize=None)
+def _serializer(annotation: Any) -> Optional[Converter]:
+    """Return the function converting `annotation` values to JSON data, or None if they are as is."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _serializer(args[0])
+    if origin is Union or origin is UnionType:
+        types = [arg for arg in args if arg is not NoneType]
+        if len(types) == 1:
+            return _serializer(types[0])
+        # Unions of scalars (e.g. Union[StrictFloat, StrictInt]) need no conversion
+        return None if all(_serializer(arg) is None for arg in types) else _sanitize
+    if origin is list or origin is dict:
+        return _container_serializer(origin, args)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_serializer(annotation)
+        if issubclass(annotation, datetime.date):
+            return _isoformat
+        # str based enums are encoded as their values
+        if issubclass(annotation, (str, int, float, bool)):
+            return None
+    return _sanitize
+
+
+def _is_model(annotation: Any) -> bool:
+    if typing.get_origin(annotation) is typing.Annotated:
+        return _is_model(typing.get_args(annotation)[0])
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _container_serializer(origin: type, args: Tuple[Any, ...]) -> Optional[Converter]:
+    item = _serializer(args[-1]) if args else _sanitize
+    if item is None:
+        return None
+    if args and _is_model(args[-1]):
+        # Like to_dict, which skips the falsy items of lists and dicts of models
+        if origin is list:
+            return lambda value: [item(v) for v in value if v]
+        return lambda value: {k: item(v) for k, v in value.items() if v}
+    if origin is list:
+        return lambda value: [item(v) for v in value]
+    return lambda value: {k: item(v) for k, v in value.items()}
+
+
+def _nullable_fields(klass: Type[BaseModel]) -> Set[str]:
+    """Return the nullable fields of a generated model class.
+
+    The annotations do not tell them apart (optional fields are
+    `Optional[...]` too), but to_dict does: it keeps the nullable fields
+    set to None, and drops the other ones.
+    """
+    data = klass.model_construct(**dict.fromkeys(klass.model_fields)).to_dict()  # type: ignore[attr-defined]
+    return {name for name, field in klass.model_fields.items() if (field.alias or name) in data}
+
+
+@lru_cache(maxsize=None)
+def _model_serializer(klass: Type[BaseModel]) -> Converter:
+    # readOnly fields, which to_dict leaves out, only exist in response models
+    nullable = _nullable_fields(klass)
+    fields = [
+        (name, field.alias or name, _serializer(field.annotation), name in nullable)
+        for name, field in klass.model_fields.items()
+    ]
+
+    def serialize(model: Any) -> Any:
+        values = model.__dict__
+        fields_set = model.__pydantic_fields_set__
+        data: Dict[str, Any] = {}
+        for name, alias, serializer, is_nullable in fields:
+            value = values[name]
+            if value is None:
+                if is_nullable and name in fields_set:
+                    data[alias] = None
+            elif serializer is None:
+                data[alias] = value
+            else:
+                data[alias] = serializer(value)
+        return data
+
+    return serialize
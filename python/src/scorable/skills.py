@@ -2,60 +2,42 @@ from __future__ import annotations
 
 import asyncio
 import math
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from enum import Enum
 from functools import partial
-from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-from pydantic import BaseModel, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictStr
+from typing_extensions import TypedDict
 
-from scorable.generated.openapi_aclient.models.evaluator_request import EvaluatorRequest as AEvaluatorRequest
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list import (
-    PaginatedEvaluatorList as APaginatedEvaluatorList,
-)
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list_output_list import (
-    PaginatedEvaluatorListOutputList as APaginatedEvaluatorListOutputList,
-)
 from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
 from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
-
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
-from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
-from .generated.openapi_aclient.models import (
-    EvaluatorDemonstrationsRequest as AEvaluatorDemonstrationsRequest,
-)
-from .generated.openapi_aclient.models import (
-    EvaluatorExecutionRequest as AEvaluatorExecutionRequest,
-)
-from .generated.openapi_aclient.models import (
-    EvaluatorExecutionResult as AEvaluatorExecutionResult,
-)
-from .generated.openapi_aclient.models import (
-    ModelParamsRequest as AModelParamsRequest,
+from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
+    PaginatedEvaluatorListOutputList,
 )
-from .generated.openapi_aclient.models.evaluator import Evaluator as AOpenAPIEvaluator
-from .generated.openapi_aclient.models.evaluator_calibration_output import (
-    EvaluatorCalibrationOutput as AEvaluatorCalibrationOutput,
-)
-from .generated.openapi_aclient.models.evaluator_list_output import EvaluatorListOutput as AEvaluatorListOutput
-from .generated.openapi_aclient.models.input_variable_request import InputVariableRequest as AInputVariableRequest
-from .generated.openapi_aclient.models.objective_request import ObjectiveRequest as AObjectiveRequest
-from .generated.openapi_aclient.models.patched_evaluator_request import (
-    PatchedEvaluatorRequest as APatchedEvaluatorRequest,
-)
-from .generated.openapi_aclient.models.reference_variable_request import (
-    ReferenceVariableRequest as AReferenceVariableRequest,
-)
-from .generated.openapi_aclient.models.skill_test_data_request import SkillTestDataRequest as ASkillTestDataRequest
-from .generated.openapi_aclient.models.skill_test_input_request import (
-    SkillTestInputRequest as ASkillTestInputRequest,
-)
-from .generated.openapi_client import ApiClient as ApiClient
-from .generated.openapi_client.api.evaluators_api import EvaluatorsApi as EvaluatorsApi
-from .generated.openapi_client.api.objectives_api import ObjectivesApi as ObjectivesApi
+
+from ._bulk import Outcome, abounded_map, acall_in_slot, bounded_map, call_in_slot
+from .concurrency import AdaptiveConcurrencyLimiter
+from .generated.openapi_client import ApiClient
+from .generated.openapi_client.models.evaluator import Evaluator as OpenAPIEvaluator
 from .generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
 from .generated.openapi_client.models.evaluator_demonstrations_request import (
     EvaluatorDemonstrationsRequest,
@@ -70,12 +52,28 @@ from .generated.openapi_client.models.patched_evaluator_request import PatchedEv
 from .generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
 from .generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
 from .generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
-from .utils import ClientContextCallable, aiterate_cursor_list, iterate_cursor_list, with_async_client, with_sync_client
+from .retry import idempotency_headers
+from .utils import (
+    ClientContextCallable,
+    aiterate_cursor_list,
+    iterate_cursor_list,
+    lazy_import,
+    with_async_client,
+    with_sync_client,
+)
 
 if TYPE_CHECKING:
-    from .generated.openapi_aclient.models.evaluator import Evaluator as GeneratedEvaluator
-    from .generated.openapi_client.models.evaluator import Evaluator as SyncGeneratedEvaluator
-
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
+    from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
+    from .generated.openapi_client.api.evaluators_api import EvaluatorsApi
+    from .generated.openapi_client.api.objectives_api import ObjectivesApi
+else:
+    # Imported on first use
+    AEvaluatorsApi = lazy_import("scorable.generated.openapi_aclient.api.evaluators_api", "EvaluatorsApi")
+    AObjectivesApi = lazy_import("scorable.generated.openapi_aclient.api.objectives_api", "ObjectivesApi")
+    EvaluatorsApi = lazy_import("scorable.generated.openapi_client.api.evaluators_api", "EvaluatorsApi")
+    ObjectivesApi = lazy_import("scorable.generated.openapi_client.api.objectives_api", "ObjectivesApi")
 
 ModelName = Union[
     str,
@@ -136,8 +134,8 @@ class ACalibrateBatchParameters:
         prompt: str,
         model: "ModelName",
         pii_filter: bool = False,
-        reference_variables: Optional[Union[List["ReferenceVariable"], List["AReferenceVariableRequest"]]] = None,
-        input_variables: Optional[Union[List["InputVariable"], List["AInputVariableRequest"]]] = None,
+        reference_variables: Optional[Union[List["ReferenceVariable"], List["ReferenceVariableRequest"]]] = None,
+        input_variables: Optional[Union[List["InputVariable"], List["InputVariableRequest"]]] = None,
     ):
         self.name = name
         self.prompt = prompt
@@ -148,7 +146,7 @@ class ACalibrateBatchParameters:
 
 
 class ACalibrateBatchResult(BaseModel):
-    results: List[AEvaluatorCalibrationOutput]
+    results: List[EvaluatorCalibrationOutput]
     rms_errors_model: Dict[str, float]
     mae_errors_model: Dict[str, float]
     rms_errors_prompt: Dict[str, float]
@@ -181,6 +179,62 @@ class CalibrateBatchResult(BaseModel):
     mae_errors_prompt: Dict[str, float]
 
 
+class EvaluatorRunInput(TypedDict, total=False):
+    """Input of one evaluator execution of :meth:`Evaluators.run_many`."""
+
+    request: str
+    response: str
+    contexts: List[str]
+    expected_output: str
+    variables: Dict[str, str]
+    tags: List[str]
+
+
+class EvaluatorRunResult(BaseModel):
+    """Outcome of one evaluator execution of :meth:`Evaluators.run_many`.
+
+    Exactly one of `result` and `error` is set.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    position: int
+    input: Any
+    """The input, as given (not validated, so that a malformed input only fails its own result)."""
+    result: Optional[EvaluatorExecutionResult] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class EvaluatorSuiteResult(Dict[str, EvaluatorExecutionResult]):
+    """Results of :meth:`Evaluators.run_suite`, by evaluator name.
+
+    The evaluators that failed, or did not finish before the deadline,
+    are missing; their exceptions (TimeoutError for the latter) are in
+    `errors` instead.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: Dict[str, Exception] = {}
+
+    @property
+    def complete(self) -> bool:
+        """Whether all the evaluators of the suite have a result."""
+        return not self.errors
+
+    def _add(self, name: str, future: Union[Future[Outcome], asyncio.Future[Outcome]]) -> None:
+        if not future.done():
+            self.errors[name] = TimeoutError(f"Evaluator {name} did not finish before the deadline")
+        elif (error := future.result().error) is not None:
+            self.errors[name] = error
+        else:
+            self[name] = future.result().result
+
+
 class Versions:
     """
     Version listing (sub)API
@@ -200,7 +254,7 @@ class Versions:
         api_instance = EvaluatorsApi(_client)
         return api_instance.evaluators_versions_list(id=evaluator_id)
 
-    async def alist(self, evaluator_id: str) -> APaginatedEvaluatorList:
+    async def alist(self, evaluator_id: str) -> PaginatedEvaluatorList:
         """
         Asynchronously list all versions of a evaluator.
         """
@@ -212,7 +266,7 @@ class Versions:
             return await api_instance.evaluators_versions_list(id=evaluator_id)
 
 
-class Evaluator(AOpenAPIEvaluator):
+class Evaluator(OpenAPIEvaluator):
     """
     Wrapper for a single Evaluator.
 
@@ -223,9 +277,7 @@ class Evaluator(AOpenAPIEvaluator):
     client_context: ClientContextCallable
 
     @classmethod
-    def _wrap(
-        cls, apiobj: Union[AOpenAPIEvaluator, "SyncGeneratedEvaluator"], client_context: ClientContextCallable
-    ) -> "Evaluator":  # noqa: E501
+    def _wrap(cls, apiobj: OpenAPIEvaluator, client_context: ClientContextCallable) -> "Evaluator":  # noqa: E501
         obj = cast(Evaluator, apiobj)
         obj.__class__ = cls
         obj.client_context = client_context
@@ -243,6 +295,7 @@ class Evaluator(AOpenAPIEvaluator):
         *,
         _client: ApiClient,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
     ) -> EvaluatorExecutionResult:
         """
         Run the evaluator.
@@ -275,10 +328,11 @@ class Evaluator(AOpenAPIEvaluator):
             id=self.id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
 
-class AEvaluator(AOpenAPIEvaluator):
+class AEvaluator(OpenAPIEvaluator):
     """
     Wrapper for a single Evaluator.
 
@@ -289,9 +343,7 @@ class AEvaluator(AOpenAPIEvaluator):
     client_context: ClientContextCallable
 
     @classmethod
-    async def _awrap(
-        cls, apiobj: Union[AOpenAPIEvaluator, "GeneratedEvaluator"], client_context: ClientContextCallable
-    ) -> "AEvaluator":  # noqa: E501
+    async def _awrap(cls, apiobj: OpenAPIEvaluator, client_context: ClientContextCallable) -> "AEvaluator":  # noqa: E501
         obj = cast(AEvaluator, apiobj)
         obj.__class__ = cls
         obj.client_context = client_context
@@ -309,7 +361,8 @@ class AEvaluator(AOpenAPIEvaluator):
         *,
         _client: AApiClient,
         _request_timeout: Optional[int] = None,
-    ) -> AEvaluatorExecutionResult:
+        _idempotency_key: Optional[str] = None,
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run the evaluator.
 
@@ -328,7 +381,7 @@ class AEvaluator(AOpenAPIEvaluator):
 
         api_instance = AEvaluatorsApi(_client)
 
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=self.version_id,
             request=request,
             response=response,
@@ -341,6 +394,7 @@ class AEvaluator(AOpenAPIEvaluator):
             id=self.id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
 
@@ -393,43 +447,43 @@ def _to_evaluator_demonstrations(
 
 
 def _ato_input_variables(
-    input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]],
-) -> List[AInputVariableRequest]:
-    def _convert_to_generated_model(entry: Union[InputVariable, AInputVariableRequest]) -> AInputVariableRequest:
-        if not isinstance(entry, AInputVariableRequest):
-            return AInputVariableRequest(name=entry.name)
+    input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]],
+) -> List[InputVariableRequest]:
+    def _convert_to_generated_model(entry: Union[InputVariable, InputVariableRequest]) -> InputVariableRequest:
+        if not isinstance(entry, InputVariableRequest):
+            return InputVariableRequest(name=entry.name)
         return entry
 
     return [_convert_to_generated_model(entry) for entry in input_variables or {}]
 
 
-def _ato_model_params(model_params: Optional[Union[ModelParams, AModelParamsRequest]]) -> Optional[AModelParamsRequest]:
+def _ato_model_params(model_params: Optional[Union[ModelParams, ModelParamsRequest]]) -> Optional[ModelParamsRequest]:
     if isinstance(model_params, ModelParams):
-        return AModelParamsRequest(**model_params.model_dump())
+        return ModelParamsRequest(**model_params.model_dump())
     return model_params
 
 
 def _ato_reference_variables(
-    reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]],
-) -> List[AReferenceVariableRequest]:
+    reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]],
+) -> List[ReferenceVariableRequest]:
     def _convert_to_generated_model(
-        entry: Union[ReferenceVariable, AReferenceVariableRequest],
-    ) -> AReferenceVariableRequest:
-        if not isinstance(entry, AReferenceVariableRequest):
-            return AReferenceVariableRequest(name=entry.name, dataset=entry.dataset_id)
+        entry: Union[ReferenceVariable, ReferenceVariableRequest],
+    ) -> ReferenceVariableRequest:
+        if not isinstance(entry, ReferenceVariableRequest):
+            return ReferenceVariableRequest(name=entry.name, dataset=entry.dataset_id)
         return entry
 
     return [_convert_to_generated_model(entry) for entry in reference_variables or {}]
 
 
 def _ato_evaluator_demonstrations(
-    input_variables: Optional[Union[List[EvaluatorDemonstration], List[AEvaluatorDemonstrationsRequest]]],
-) -> List[AEvaluatorDemonstrationsRequest]:
+    input_variables: Optional[Union[List[EvaluatorDemonstration], List[EvaluatorDemonstrationsRequest]]],
+) -> List[EvaluatorDemonstrationsRequest]:
     def _aconvert_dict(
-        entry: Union[EvaluatorDemonstration, AEvaluatorDemonstrationsRequest],
-    ) -> AEvaluatorDemonstrationsRequest:
-        if not isinstance(entry, AEvaluatorDemonstrationsRequest):
-            return AEvaluatorDemonstrationsRequest(
+        entry: Union[EvaluatorDemonstration, EvaluatorDemonstrationsRequest],
+    ) -> EvaluatorDemonstrationsRequest:
+        if not isinstance(entry, EvaluatorDemonstrationsRequest):
+            return EvaluatorDemonstrationsRequest(
                 score=entry.score,
                 request=entry.request,
                 response=entry.response,
@@ -467,6 +521,7 @@ class PresetEvaluatorRunner:
         *,
         _client: ApiClient,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
     ) -> EvaluatorExecutionResult:
         """
         Run the evaluator.
@@ -499,6 +554,7 @@ class PresetEvaluatorRunner:
             id=self.evaluator_id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
 
@@ -529,7 +585,8 @@ class APresetEvaluatorRunner:
         *,
         _client: AApiClient,
         _request_timeout: Optional[int] = None,
-    ) -> AEvaluatorExecutionResult:
+        _idempotency_key: Optional[str] = None,
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run the evaluator.
 
@@ -548,7 +605,7 @@ class APresetEvaluatorRunner:
 
         api_instance = AEvaluatorsApi(_client)
 
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=self.evaluator_version_id,
             request=request,
             response=response,
@@ -561,9 +618,14 @@ class APresetEvaluatorRunner:
             id=self.evaluator_id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
 
+# An evaluator, or its ID
+EvaluatorRef = Union[str, OpenAPIEvaluator, PresetEvaluatorRunner, APresetEvaluatorRunner]
+
+
 class Evaluators:
     """Evaluators (sub) API
 
@@ -583,17 +645,32 @@ class Evaluators:
             name = "<unnamed>"
         return name
 
-    def __init__(self, client_context: ClientContextCallable):
+    def __init__(
+        self,
+        client_context: ClientContextCallable,
+        *,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
         self.client_context = client_context
         self.versions = Versions(client_context)
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter()
+        # Process ID, number of workers and pool of the suites, and number of their evaluators in progress
+        self._suite_executor: Optional[Tuple[int, int, ThreadPoolExecutor]] = None
+        self._suite_busy = 0
+        self._suite_executor_lock = threading.Lock()
+
+    def _concurrency_limiter(self, parallel_requests: Optional[int]) -> AdaptiveConcurrencyLimiter:
+        if parallel_requests is None:
+            return self.concurrency
+        return AdaptiveConcurrencyLimiter.fixed(parallel_requests)
 
     def _to_objective_request(self, *, intent: Optional[str] = None) -> ObjectiveRequest:
         return ObjectiveRequest(
             intent=intent,
         )
 
-    async def _ato_objective_request(self, *, intent: Optional[str] = None) -> AObjectiveRequest:
-        return AObjectiveRequest(
+    async def _ato_objective_request(self, *, intent: Optional[str] = None) -> ObjectiveRequest:
+        return ObjectiveRequest(
             intent=intent,
         )
 
@@ -610,6 +687,7 @@ class Evaluators:
         variables: Optional[dict[str, str]] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: ApiClient,
     ) -> EvaluatorExecutionResult:
         """
@@ -626,6 +704,7 @@ class Evaluators:
                 predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
             tags: Optional tags to add to the evaluator execution
             _request_timeout: Optional timeout for the request.
+            _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
 
         if not response and not request:
@@ -646,6 +725,7 @@ class Evaluators:
             id=evaluator_id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     @with_async_client
@@ -661,8 +741,9 @@ class Evaluators:
         variables: Optional[dict[str, str]] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: AApiClient,
-    ) -> AEvaluatorExecutionResult:
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run the evaluator.
 
@@ -677,13 +758,14 @@ class Evaluators:
                 predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
             tags: Optional tags to add to the evaluator execution
             _request_timeout: Optional timeout for the request.
+            _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
 
         if not response and not request:
             raise ValueError("Either response or request must be provided")
 
         api_instance = AEvaluatorsApi(_client)
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=evaluator_version_id,
             request=request,
             response=response,
@@ -696,8 +778,276 @@ class Evaluators:
             id=evaluator_id,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
+    def _evaluator_ids(self, evaluator: EvaluatorRef, evaluator_version_id: Optional[str]) -> Tuple[str, Optional[str]]:
+        if isinstance(evaluator, str):
+            return evaluator, evaluator_version_id
+        if isinstance(evaluator, (PresetEvaluatorRunner, APresetEvaluatorRunner)):
+            return evaluator.evaluator_id, evaluator_version_id or evaluator.evaluator_version_id
+        return evaluator.id, evaluator_version_id or evaluator.version_id
+
+    def run_many(
+        self,
+        evaluator: EvaluatorRef,
+        inputs: Iterable[EvaluatorRunInput],
+        *,
+        evaluator_version_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        _request_timeout: Optional[int] = None,
+    ) -> Iterator[EvaluatorRunResult]:
+        """
+        Run an evaluator on many inputs, in parallel.
+
+        The inputs are consumed as the results are yielded, so they can be
+        a generator over a large dataset. A failed execution does not stop
+        the others: its result has the exception as `error`.
+
+        Args:
+            evaluator: The evaluator, or its ID.
+            inputs: The inputs, with the `request`, `response`, `contexts`, `expected_output`,
+                `variables` and `tags` arguments of :meth:`run`. `arun_many` also accepts an async iterable.
+            evaluator_version_id: Version ID of the evaluator to run. If omitted, the latest version is used.
+            concurrency: Number of parallel executions. By default, the number adapts to the
+                load of the API (see :attr:`scorable.client.Scorable.concurrency`).
+            ordered: Whether to yield the results in the order of the inputs, or as they complete.
+            _request_timeout: Optional timeout for each request.
+        """
+        evaluator_id, version_id = self._evaluator_ids(evaluator, evaluator_version_id)
+
+        def run(item: EvaluatorRunInput) -> EvaluatorExecutionResult:
+            return self.run(evaluator_id, evaluator_version_id=version_id, _request_timeout=_request_timeout, **item)
+
+        limiter = self._concurrency_limiter(concurrency)
+        for outcome in bounded_map(run, inputs, limiter, ordered=ordered):
+            yield EvaluatorRunResult(
+                position=outcome.position, input=outcome.item, result=outcome.result, error=outcome.error
+            )
+
+    async def arun_many(
+        self,
+        evaluator: EvaluatorRef,
+        inputs: Union[Iterable[EvaluatorRunInput], AsyncIterable[EvaluatorRunInput]],
+        *,
+        evaluator_version_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[EvaluatorRunResult]:
+        """
+        Asynchronously run an evaluator on many inputs, in parallel.
+
+        The inputs are consumed as the results are yielded, so they can be
+        a generator over a large dataset. A failed execution does not stop
+        the others: its result has the exception as `error`.
+
+        Args:
+            evaluator: The evaluator, or its ID.
+            inputs: The inputs, with the `request`, `response`, `contexts`, `expected_output`,
+                `variables` and `tags` arguments of :meth:`run`. `arun_many` also accepts an async iterable.
+            evaluator_version_id: Version ID of the evaluator to run. If omitted, the latest version is used.
+            concurrency: Number of parallel executions. By default, the number adapts to the
+                load of the API (see :attr:`scorable.client.Scorable.concurrency`).
+            ordered: Whether to yield the results in the order of the inputs, or as they complete.
+            _request_timeout: Optional timeout for each request.
+        """
+        evaluator_id, version_id = self._evaluator_ids(evaluator, evaluator_version_id)
+
+        async def run(item: EvaluatorRunInput) -> EvaluatorExecutionResult:
+            return await self.arun(
+                evaluator_id, evaluator_version_id=version_id, _request_timeout=_request_timeout, **item
+            )
+
+        limiter = self._concurrency_limiter(concurrency)
+        async for outcome in abounded_map(run, inputs, limiter, ordered=ordered):
+            yield EvaluatorRunResult(
+                position=outcome.position, input=outcome.item, result=outcome.result, error=outcome.error
+            )
+
+    def _suite_members(self, evaluators: Iterable[EvaluatorRef]) -> List[Tuple[str, str, Optional[str]]]:
+        """Return the name, ID and version ID of the evaluators of a suite, whose names must be unique."""
+        members = [self._suite_member(evaluator) for evaluator in evaluators]
+        duplicates = [name for name, count in Counter(name for name, _, _ in members).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"The evaluators of a suite must have unique names, got several {', '.join(duplicates)}")
+        return members
+
+    def _suite_pool(self, members: int) -> ThreadPoolExecutor:
+        """Return the thread pool of the suites, with a thread for each of `members` evaluators.
+
+        The pool is shared by all the calls and rebuilt in forked child
+        processes. It grows so that the evaluators of concurrent suites never
+        wait for a thread; :meth:`_suite_release` gives their threads back.
+        """
+        with self._suite_executor_lock:
+            if self._suite_executor is None or self._suite_executor[0] != os.getpid():
+                self._suite_executor = None
+                self._suite_busy = 0
+            self._suite_busy += members
+            if self._suite_executor is None or self._suite_executor[1] < self._suite_busy:
+                if self._suite_executor is not None:
+                    # Its threads exit once their evaluators are done
+                    self._suite_executor[2].shutdown(wait=False)
+                # Its threads are spawned on demand
+                workers = max(self.concurrency.max_limit, self._suite_busy)
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scorable-suite")
+                self._suite_executor = (os.getpid(), workers, executor)
+            return self._suite_executor[2]
+
+    def _suite_release(self, future: Future[Outcome]) -> None:
+        with self._suite_executor_lock:
+            self._suite_busy -= 1
+
+    def _suite_member(self, evaluator: EvaluatorRef) -> Tuple[str, str, Optional[str]]:
+        """Return the name, ID and version ID of an evaluator of a suite."""
+        if isinstance(evaluator, str) and evaluator in self.Eval.__members__:
+            return evaluator, self.Eval.__members__[evaluator].value, None
+        evaluator_id, version_id = self._evaluator_ids(evaluator, None)
+        if isinstance(evaluator, str):
+            return evaluator, evaluator_id, version_id
+        if isinstance(evaluator, (PresetEvaluatorRunner, APresetEvaluatorRunner)):
+            return evaluator.__name__, evaluator_id, version_id
+        return evaluator.name, evaluator_id, version_id
+
+    def run_suite(
+        self,
+        evaluators: Iterable[EvaluatorRef],
+        *,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        variables: Optional[dict[str, str]] = None,
+        tags: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> EvaluatorSuiteResult:
+        """
+        Run several evaluators on one response, in parallel.
+
+        All the evaluators are sent at once, whatever the concurrency limit of
+        the client, so that the suite takes as long as its slowest evaluator.
+        The results are returned by evaluator name once all the evaluators
+        are done, or at the deadline: the evaluators that failed or did not
+        finish in time are in `errors` of the results. The names of the
+        evaluators must be unique, or ValueError is raised.
+
+        Args:
+            evaluators: The evaluators, their IDs, or the names of preset evaluators (e.g. "Politeness").
+            response: LLM output.
+            request: The prompt sent to the LLM.
+            contexts: Optional documents passed to RAG evaluators.
+            expected_output: Optional expected output for the evaluators.
+            variables: Optional additional variable mappings for the evaluators.
+            tags: Optional tags to add to the evaluator executions
+            timeout: Optional time for the suite, in seconds, from when its requests are sent, after which the
+                unfinished evaluators are abandoned.
+            _request_timeout: Optional timeout for each request. Defaults to `timeout`.
+        """
+        members = self._suite_members(evaluators)
+        results = EvaluatorSuiteResult()
+        if not members:
+            return results
+
+        def run(member: Tuple[str, str, Optional[str]]) -> EvaluatorExecutionResult:
+            _, evaluator_id, version_id = member
+            return self.run(
+                evaluator_id,
+                evaluator_version_id=version_id,
+                response=response,
+                request=request,
+                contexts=contexts,
+                expected_output=expected_output,
+                variables=variables,
+                tags=tags,
+                _request_timeout=_request_timeout or timeout,
+            )
+
+        # Neither the pool nor the limiter queue an evaluator, so that the deadline starts as they are sent
+        executor = self._suite_pool(len(members))
+        limiter = AdaptiveConcurrencyLimiter.fixed(len(members))
+        futures = [
+            executor.submit(call_in_slot, run, position, member, limiter) for position, member in enumerate(members)
+        ]
+        for future in futures:
+            future.add_done_callback(self._suite_release)
+        wait(futures, timeout=timeout)
+        # The requests still in flight are bounded by the request timeout, and their results are discarded
+        for future in futures:
+            future.cancel()
+        for (name, _, _), future in zip(members, futures, strict=True):
+            results._add(name, future)
+        return results
+
+    async def arun_suite(
+        self,
+        evaluators: Iterable[EvaluatorRef],
+        *,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        variables: Optional[dict[str, str]] = None,
+        tags: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> EvaluatorSuiteResult:
+        """
+        Asynchronously run several evaluators on one response, in parallel.
+
+        All the evaluators are sent at once, whatever the concurrency limit of
+        the client, so that the suite takes as long as its slowest evaluator.
+        The results are returned by evaluator name once all the evaluators
+        are done, or at the deadline: the evaluators that failed or did not
+        finish in time are in `errors` of the results. The names of the
+        evaluators must be unique, or ValueError is raised.
+
+        Args:
+            evaluators: The evaluators, their IDs, or the names of preset evaluators (e.g. "Politeness").
+            response: LLM output.
+            request: The prompt sent to the LLM.
+            contexts: Optional documents passed to RAG evaluators.
+            expected_output: Optional expected output for the evaluators.
+            variables: Optional additional variable mappings for the evaluators.
+            tags: Optional tags to add to the evaluator executions
+            timeout: Optional time for the suite, in seconds, from when its requests are sent, after which the
+                unfinished evaluators are abandoned.
+            _request_timeout: Optional timeout for each request. Defaults to `timeout`.
+        """
+        members = self._suite_members(evaluators)
+        results = EvaluatorSuiteResult()
+        if not members:
+            return results
+
+        async def run(member: Tuple[str, str, Optional[str]]) -> EvaluatorExecutionResult:
+            _, evaluator_id, version_id = member
+            return await self.arun(
+                evaluator_id,
+                evaluator_version_id=version_id,
+                response=response,
+                request=request,
+                contexts=contexts,
+                expected_output=expected_output,
+                variables=variables,
+                tags=tags,
+                _request_timeout=_request_timeout or timeout,
+            )
+
+        # The limiter does not queue an evaluator, so that the deadline starts as they are sent
+        limiter = AdaptiveConcurrencyLimiter.fixed(len(members))
+        tasks = [
+            asyncio.ensure_future(acall_in_slot(run, position, member, limiter))
+            for position, member in enumerate(members)
+        ]
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        for (name, _, _), task in zip(members, tasks, strict=True):
+            results._add(name, task)
+        return results
+
     @with_sync_client
     def calibrate_existing(
         self,
@@ -734,7 +1084,7 @@ class Evaluators:
         test_data: Optional[List[List[str]]] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> List[AEvaluatorCalibrationOutput]:
+    ) -> List[EvaluatorCalibrationOutput]:
         """
         Asynchronously run calibration set on an existing evaluator.
         """
@@ -744,7 +1094,7 @@ class Evaluators:
         if test_dataset_id and test_data:
             raise ValueError("Only one of test_dataset_id or test_data must be provided")
         api_instance = AEvaluatorsApi(_client)
-        evaluator_test_request = ASkillTestDataRequest(
+        evaluator_test_request = SkillTestDataRequest(
             test_dataset_id=test_dataset_id,
             test_data=test_data,
         )
@@ -801,11 +1151,11 @@ class Evaluators:
         prompt: str,
         model: ModelName,
         pii_filter: bool = False,
-        reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> List[AEvaluatorCalibrationOutput]:
+    ) -> List[EvaluatorCalibrationOutput]:
         """
         Asynchronously run calibration set for an evaluator definition.
         See the create evaluator method for more details on the parameters.
@@ -816,7 +1166,7 @@ class Evaluators:
         if test_dataset_id and test_data:
             raise ValueError("Only one of test_dataset_id or test_data must be provided")
         api_instance = AEvaluatorsApi(_client)
-        evaluator_test_request = ASkillTestInputRequest(
+        evaluator_test_request = SkillTestInputRequest(
             name=name,
             test_dataset_id=test_dataset_id,
             test_data=test_data,
@@ -824,7 +1174,7 @@ class Evaluators:
             models=[model],
             is_evaluator=True,
             pii_filter=pii_filter,
-            objective=AObjectiveRequest(intent="Calibration"),
+            objective=ObjectiveRequest(intent="Calibration"),
             reference_variables=_ato_reference_variables(reference_variables),
             input_variables=_ato_input_variables(input_variables),
         )
@@ -836,7 +1186,7 @@ class Evaluators:
         evaluator_definitions: List[CalibrateBatchParameters],
         test_dataset_id: Optional[str] = None,
         test_data: Optional[List[List[str]]] = None,
-        parallel_requests: int = 1,
+        parallel_requests: Optional[int] = None,
         _request_timeout: Optional[int] = None,
     ) -> CalibrateBatchResult:
         """
@@ -846,7 +1196,8 @@ class Evaluators:
              evaluator_definitions: List of evaluator definitions.
              test_dataset_id: ID of the dataset to be used to test the evaluator.
              test_data: Snapshot of data to be used to test the evaluator.
-             parallel_requests: Number of parallel requests.
+             parallel_requests: Number of parallel requests. By default, the number adapts to the
+               load of the API (see :attr:`scorable.client.Scorable.concurrency`).
 
         Returns a model with the results and errors for each model and prompt.
         """
@@ -863,8 +1214,6 @@ class Evaluators:
 
         all_results = []
 
-        use_thread_pool = parallel_requests > 1
-
         def process_results(results: List[EvaluatorCalibrationOutput], param: CalibrateBatchParameters) -> None:
             for result in results:
                 score = result.result.score or 0
@@ -883,45 +1232,31 @@ class Evaluators:
 
                 all_results.append(result)
 
-        if use_thread_pool:
-            with ThreadPoolExecutor(max_workers=parallel_requests) as executor:
-                futures = {
-                    executor.submit(
-                        self.calibrate,
-                        name=param.name,
-                        test_dataset_id=test_dataset_id,
-                        test_data=test_data,
-                        prompt=param.prompt,
-                        model=param.model,
-                        pii_filter=param.pii_filter,
-                        reference_variables=param.reference_variables,
-                        input_variables=param.input_variables,
-                        _request_timeout=_request_timeout,
-                    ): param
-                    for param in evaluator_definitions
-                }
-
-                for future in as_completed(futures):
-                    param = futures[future]
-                    try:
-                        results = future.result()
-                        process_results(results, param)
-                    except Exception as exc:
-                        raise ValueError(f"Calibration failed for {param.prompt} with model {param.model}") from exc
-        else:
-            for param in evaluator_definitions:
+        limiter = self._concurrency_limiter(parallel_requests)
+
+        def calibrate(param: CalibrateBatchParameters) -> List[EvaluatorCalibrationOutput]:
+            with limiter.slot():
+                return self.calibrate(
+                    name=param.name,
+                    test_dataset_id=test_dataset_id,
+                    test_data=test_data,
+                    prompt=param.prompt,
+                    model=param.model,
+                    pii_filter=param.pii_filter,
+                    reference_variables=param.reference_variables,
+                    input_variables=param.input_variables,
+                    _request_timeout=_request_timeout,
+                )
+
+        # The limiter, not the pool, bounds the requests in flight
+        workers = max(1, min(len(evaluator_definitions), limiter.max_limit))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(calibrate, param): param for param in evaluator_definitions}
+
+            for future in as_completed(futures):
+                param = futures[future]
                 try:
-                    results = self.calibrate(
-                        name=param.name,
-                        test_dataset_id=test_dataset_id,
-                        test_data=test_data,
-                        prompt=param.prompt,
-                        model=param.model,
-                        pii_filter=param.pii_filter,
-                        reference_variables=param.reference_variables,
-                        input_variables=param.input_variables,
-                        _request_timeout=_request_timeout,
-                    )
+                    results = future.result()
                     process_results(results, param)
                 except Exception as exc:
                     raise ValueError(f"Calibration failed for {param.prompt} with model {param.model}") from exc
@@ -960,7 +1295,7 @@ class Evaluators:
         evaluator_definitions: List[ACalibrateBatchParameters],
         test_dataset_id: Optional[str] = None,
         test_data: Optional[List[List[str]]] = None,
-        parallel_requests: int = 1,
+        parallel_requests: Optional[int] = None,
         _request_timeout: Optional[int] = None,
     ) -> ACalibrateBatchResult:
         """
@@ -970,7 +1305,8 @@ class Evaluators:
              evaluator_definitions: List of evaluator definitions.
              test_dataset_id: ID of the dataset to be used to test the evaluator.
              test_data: Snapshot of data to be used to test the evaluator.
-             parallel_requests: Number of parallel requests.
+             parallel_requests: Number of parallel requests. By default, the number adapts to the
+               load of the API (see :attr:`scorable.client.Scorable.concurrency`).
 
         Returns a model with the results and errors for each model and prompt.
         """
@@ -987,7 +1323,7 @@ class Evaluators:
 
         all_results = []
 
-        async def process_results(results: List[AEvaluatorCalibrationOutput], param: ACalibrateBatchParameters) -> None:
+        async def process_results(results: List[EvaluatorCalibrationOutput], param: ACalibrateBatchParameters) -> None:
             for result in results:
                 score = result.result.score or 0
                 expected_score = result.result.expected_score or 0
@@ -1004,10 +1340,10 @@ class Evaluators:
 
                 all_results.append(result)
 
-        sem = asyncio.Semaphore(parallel_requests)
+        limiter = self._concurrency_limiter(parallel_requests)
 
         async def bounded_calibrate(param: ACalibrateBatchParameters) -> None:
-            async with sem:
+            async with limiter.aslot():
                 try:
                     results = await self.acalibrate(
                         name=param.name,
@@ -1089,7 +1425,7 @@ class Evaluators:
         self,
         name: str,
         *,
-        _client: ApiClient,
+        _client: AApiClient,
     ) -> AEvaluator:
         """Asynchronously get an evaluator instance by name.
 
@@ -1097,27 +1433,22 @@ class Evaluators:
         name: The evaluator to be fetched. Note this only works for uniquely named evaluators.
         """
 
-        context = self.client_context()
-
-        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
-
-        async with context as client:
-            api_instance = AEvaluatorsApi(client)
+        api_instance = AEvaluatorsApi(_client)
 
-            evaluator_list: List[AEvaluatorListOutput] = []
-            async for evaluator in aiterate_cursor_list(  # type: ignore[var-annotated]
-                partial(api_instance.evaluators_list, name=name),
-                limit=1,
-            ):
-                evaluator_list.extend(evaluator)
+        evaluator_list: List[EvaluatorListOutput] = []
+        async for evaluator in aiterate_cursor_list(  # type: ignore[var-annotated]
+            partial(api_instance.evaluators_list, name=name),
+            limit=1,
+        ):
+            evaluator_list.extend(evaluator)
 
-            if not evaluator_list:
-                raise ValueError(f"No evaluator found with name '{name}'")
+        if not evaluator_list:
+            raise ValueError(f"No evaluator found with name '{name}'")
 
-            evaluator = evaluator_list[0]
-            api_response = await api_instance.evaluators_retrieve(id=evaluator.id)
+        evaluator = evaluator_list[0]
+        api_response = await api_instance.evaluators_retrieve(id=evaluator.id)
 
-            return await AEvaluator._awrap(api_response, self.client_context)
+        return await AEvaluator._awrap(api_response, self.client_context)
 
     @with_sync_client
     def create(
@@ -1207,9 +1538,9 @@ class Evaluators:
         intent: Optional[str] = None,
         model: Optional[ModelName] = None,
         fallback_models: Optional[List[ModelName]] = None,
-        reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
-        model_params: Optional[Union[ModelParams, AModelParamsRequest]] = None,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
+        model_params: Optional[Union[ModelParams, ModelParamsRequest]] = None,
         evaluator_demonstrations: Optional[List[EvaluatorDemonstration]] = None,
         objective_id: Optional[str] = None,
         overwrite: bool = False,
@@ -1250,7 +1581,7 @@ class Evaluators:
 
         name = self._validate_create_params_sanitize_name(name, intent, objective_id)
         api_instance = AEvaluatorsApi(_client)
-        objective: Optional[AObjectiveRequest] = None
+        objective: Optional[ObjectiveRequest] = None
         if objective_id is None:
             if intent is None:
                 intent = name
@@ -1259,7 +1590,7 @@ class Evaluators:
             new_objective = await objectives_api_instance.objectives_create(objective_request=objective)
             objective_id = new_objective.id
 
-        evaluator_request = AEvaluatorRequest(
+        evaluator_request = EvaluatorRequest(
             name=name,
             objective_id=objective_id,
             prompt=predicate,
@@ -1332,12 +1663,12 @@ class Evaluators:
         *,
         change_note: Optional[str] = None,
         fallback_models: Optional[List[ModelName]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
         model: Optional[ModelName] = None,
         name: Optional[str] = None,
         predicate: Optional[str] = None,
-        reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]] = None,
-        model_params: Optional[Union[ModelParams, AModelParamsRequest]] = None,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        model_params: Optional[Union[ModelParams, ModelParamsRequest]] = None,
         evaluator_demonstrations: Optional[List[EvaluatorDemonstration]] = None,
         objective_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
@@ -1350,7 +1681,7 @@ class Evaluators:
         """
         api_instance = AEvaluatorsApi(_client)
 
-        request = APatchedEvaluatorRequest(
+        request = PatchedEvaluatorRequest(
             change_note=change_note or "",
             input_variables=_ato_input_variables(input_variables) if input_variables else None,
             models=[model for model in [model] + (fallback_models or []) if model is not None]
@@ -1442,7 +1773,7 @@ class Evaluators:
         limit: int = 100,
         name: Optional[str] = None,
         only_root_evaluators: bool = False,
-    ) -> AsyncIterator[AEvaluatorListOutput]:
+    ) -> AsyncIterator[EvaluatorListOutput]:
         """
         Asynchronously iterate through the evaluators.
 
@@ -1466,7 +1797,7 @@ class Evaluators:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedEvaluatorListOutputList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedEvaluatorListOutputList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -1491,6 +1822,7 @@ class Evaluators:
         variables: Optional[dict[str, str]] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: ApiClient,
     ) -> EvaluatorExecutionResult:
         """
@@ -1507,6 +1839,7 @@ class Evaluators:
                 predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
             tags: Optional tags to add to the evaluator execution
             _request_timeout: Optional timeout for the request.
+            _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
 
         if not response and not request:
@@ -1527,6 +1860,7 @@ class Evaluators:
             name=name,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     @with_sync_client
@@ -1560,8 +1894,9 @@ class Evaluators:
         variables: Optional[dict[str, str]] = None,
         tags: Optional[List[str]] = None,
         _request_timeout: Optional[int] = None,
+        _idempotency_key: Optional[str] = None,
         _client: AApiClient,
-    ) -> AEvaluatorExecutionResult:
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run an evaluator by name.
 
@@ -1576,13 +1911,14 @@ class Evaluators:
                 predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
             tags: Optional tags to add to the evaluator execution
             _request_timeout: Optional timeout for the request.
+            _idempotency_key: Key sent as the Idempotency-Key header, generated if omitted.
         """
 
         if not response and not request:
             raise ValueError("Either response or request must be provided")
 
         api_instance = AEvaluatorsApi(_client)
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=evaluator_version_id,
             request=request,
             response=response,
@@ -1595,6 +1931,7 @@ class Evaluators:
             name=name,
             evaluator_execution_request=evaluator_execution_request,
             _request_timeout=_request_timeout,
+            _headers=idempotency_headers(_idempotency_key),
         )
 
     EvaluatorName = Literal[
@@ -0,0 +1,494 @@
+"""HTTP transports used by the Scorable client.
+
+A transport takes care of the HTTP exchange itself: it receives the
+fully built request (method, URL, headers and a JSON-compatible body, or
+form parameters) and returns the response status, headers and body
+bytes. Custom transports implement :class:`Transport` (synchronous
+client) or :class:`AsyncTransport` (asynchronous client), and are plugged
+in by passing a factory to the client::
+
+  client = Scorable(transport=MyTransport)
+
+The factory is called with the configuration of the generated client
+whenever the client needs a new transport (e.g. once per event loop in
+asynchronous mode), and the client closes the transports it created.
+
+Besides the default urllib3 (sync) and aiohttp (async) based transports,
+HTTP/2 transports based on httpx are available with the `http2` extra
+(``pip install 'scorable[http2]'``). HTTP/2 multiplexes concurrent
+requests over a few connections, instead of one connection per request
+in flight.
+
+The aiohttp (and httpx) based transports are only imported when used.
+
+The generated REST clients are regenerated from the OpenAPI schema, so
+the behavior we want to differ from the generated defaults lives here.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import ssl
+from functools import lru_cache
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
+
+import urllib3
+
+from .generated.openapi_client import exceptions, rest
+from .serialization import json_dumps
+
+if TYPE_CHECKING:
+    import httpx
+
+
+RequestTimeout = Union[None, float, Tuple[float, float]]
+
+_BODY_METHODS = ("POST", "PUT", "PATCH", "OPTIONS", "DELETE")
+
+
+class TransportResponse(Protocol):
+    """Response returned by :meth:`Transport.request`.
+
+    `data` is None until the body has been read with `read`.
+    """
+
+    @property
+    def status(self) -> int: ...
+
+    @property
+    def reason(self) -> Optional[str]: ...
+
+    @property
+    def data(self) -> Optional[bytes]: ...
+
+    def read(self) -> bytes:
+        """Read (and store in `data`) the response body."""
+        ...
+
+    def getheaders(self) -> Mapping[str, str]:
+        """Returns the response headers."""
+        ...
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a given response header."""
+        ...
+
+
+class AsyncTransportResponse(Protocol):
+    """Response returned by :meth:`AsyncTransport.request`.
+
+    `data` is None until the body has been read with `read`.
+    """
+
+    @property
+    def status(self) -> int: ...
+
+    @property
+    def reason(self) -> Optional[str]: ...
+
+    @property
+    def data(self) -> Optional[bytes]: ...
+
+    async def read(self) -> bytes:
+        """Read (and store in `data`) the response body."""
+        ...
+
+    def getheaders(self) -> Mapping[str, str]:
+        """Returns the response headers."""
+        ...
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a given response header."""
+        ...
+
+
+class Transport(Protocol):
+    """Transport of the synchronous client."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> TransportResponse:
+        """Perform the request.
+
+        Args:
+          method: HTTP method.
+          url: Full URL, including the query string.
+          headers: Request headers.
+          body: JSON-compatible request body for JSON content types (`bytes` being already encoded JSON),
+            or `str`/`bytes` to send as is for other content types.
+          post_params: Form parameters (for `application/x-www-form-urlencoded` and
+            `multipart/form-data`); files are given as (filename, data, mimetype) tuples.
+          _request_timeout: Total timeout, or (connect, read) timeout pair, in seconds.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the resources (e.g. pooled connections) of the transport."""
+        ...
+
+
+class AsyncTransport(Protocol):
+    """Transport of the asynchronous client."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncTransportResponse:
+        """Perform the request.
+
+        See :meth:`Transport.request` for the arguments.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release the resources (e.g. pooled connections) of the transport."""
+        ...
+
+
+TransportFactory = Callable[[Any], Union[Transport, AsyncTransport]]
+
+
+def iter_body(response: TransportResponse, chunk_size: int) -> Iterator[bytes]:
+    """Iterate through the body of an unread response, in chunks of at most `chunk_size` bytes.
+
+    The body of the urllib3 transport is streamed from the connection;
+    the bodies of other transports are read at once.
+    """
+    raw = getattr(response, "response", None)
+    if response.data is not None or not isinstance(raw, urllib3.HTTPResponse):
+        yield response.read()
+        return
+    try:
+        yield from raw.stream(chunk_size)
+    finally:
+        raw.release_conn()
+
+
+async def aiter_body(response: AsyncTransportResponse, chunk_size: int) -> AsyncIterator[bytes]:
+    """Asynchronously iterate through the body of an unread response, in chunks of at most `chunk_size` bytes.
+
+    The body of the aiohttp transport is streamed from the connection;
+    the bodies of other transports are read at once.
+    """
+    # aiohttp.ClientResponse, not imported here
+    raw: Any = getattr(response, "response", None)
+    content = getattr(raw, "content", None)
+    if response.data is not None or not hasattr(content, "iter_chunked"):
+        yield await response.read()
+        return
+    try:
+        async for chunk in raw.content.iter_chunked(chunk_size):
+            yield chunk
+    finally:
+        raw.release()
+
+
+def discard(response: Union[TransportResponse, AsyncTransportResponse]) -> None:
+    """Close an unwanted response without reading its body.
+
+    Its connection is closed rather than drained and reused, which is
+    cheaper for the large bodies.
+    """
+    # The response of the HTTP library, wrapped by the transport response
+    raw: Any = getattr(response, "response", response)
+    close = getattr(raw, "close", None)
+    if callable(close):
+        close()
+
+
+def get_ssl_context(
+    cafile: Optional[str] = None,
+    certfile: Optional[str] = None,
+    keyfile: Optional[str] = None,
+    verify: bool = True,
+) -> ssl.SSLContext:
+    """Return a process-wide shared SSL context for the given settings.
+
+    Loading the CA bundle takes milliseconds of CPU, so the contexts are
+    built once and reused by every connection that needs one.
+    """
+    # Positional call, so that the cache key does not depend on how the
+    # caller spelled the arguments
+    return _create_ssl_context(cafile, certfile, keyfile, verify)
+
+
+@lru_cache(maxsize=None)
+def _create_ssl_context(
+    cafile: Optional[str], certfile: Optional[str], keyfile: Optional[str], verify: bool
+) -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=cafile)
+    if certfile:
+        context.load_cert_chain(certfile, keyfile=keyfile)
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+class URLLib3Transport(rest.RESTClientObject):
+    """urllib3 based transport of the synchronous client.
+
+    Identical to the generated REST client, except that JSON request
+    bodies are encoded with :func:`scorable.serialization.json_dumps`.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> rest.RESTResponse:
+        headers = headers or {}
+        if not _is_json_body(method, headers.get("Content-Type"), body):
+            return super().request(method, url, headers, body, post_params, _request_timeout)
+
+        timeout = None
+        if isinstance(_request_timeout, (int, float)) and _request_timeout:
+            timeout = urllib3.Timeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = urllib3.Timeout(connect=_request_timeout[0], read=_request_timeout[1])
+        try:
+            r = self.pool_manager.request(
+                method.upper(),
+                url,
+                body=_encode_json_body(body),
+                timeout=timeout,
+                headers=headers,
+                preload_content=False,
+            )
+        except urllib3.exceptions.SSLError as e:
+            raise exceptions.ApiException(status=0, reason="\n".join([type(e).__name__, str(e)])) from e
+        return rest.RESTResponse(r)
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    return not content_type or re.search("json", content_type, re.IGNORECASE) is not None
+
+
+def _is_json_body(method: str, content_type: Optional[str], body: Any) -> bool:
+    """Whether the generated REST clients would send `body` JSON encoded."""
+    return body is not None and method.upper() in _BODY_METHODS and _is_json_content_type(content_type)
+
+
+def _encode_json_body(body: Any) -> bytes:
+    # Bodies encoded by ApiClient.param_serialize are sent as is
+    return body if isinstance(body, bytes) else json_dumps(body)
+
+
+def _import_httpx() -> ModuleType:
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError("HTTP/2 transport requires the http2 extra: pip install 'scorable[http2]'") from e
+    return httpx
+
+
+def _httpx_client_kwargs(configuration: Any) -> Dict[str, Any]:
+    httpx = _import_httpx()
+    return {
+        "http2": True,
+        "verify": get_ssl_context(
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            configuration.verify_ssl,
+        ),
+        "limits": httpx.Limits(max_connections=configuration.connection_pool_maxsize),
+        "proxy": configuration.proxy,
+        "trust_env": True,
+    }
+
+
+def _httpx_timeout(request_timeout: RequestTimeout, default_timeout: Optional[float]) -> Any:
+    if isinstance(request_timeout, (int, float)):
+        return request_timeout
+    if isinstance(request_timeout, tuple) and len(request_timeout) == 2:
+        httpx = _import_httpx()
+        return httpx.Timeout(request_timeout[1], connect=request_timeout[0])
+    return default_timeout
+
+
+def _httpx_request_kwargs(
+    exceptions_module: ModuleType,
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    body: Any,
+    post_params: Optional[List[Tuple[str, Any]]],
+    request_timeout: RequestTimeout,
+    default_timeout: Optional[float],
+) -> Dict[str, Any]:
+    """Translate the arguments of the generated REST clients to httpx ones."""
+    method = method.upper()
+    assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
+
+    if post_params and body:
+        raise exceptions_module.ApiValueError("body parameter cannot be used with post_params parameter.")
+
+    post_params = post_params or []
+    headers = dict(headers or {})
+
+    kwargs: Dict[str, Any] = {
+        "method": method,
+        "url": url,
+        "headers": headers,
+        "timeout": _httpx_timeout(request_timeout, default_timeout),
+    }
+    if method not in _BODY_METHODS:
+        return kwargs
+
+    content_type = headers.get("Content-Type")
+    if not content_type or re.search("json", content_type, re.IGNORECASE):
+        if body is not None:
+            kwargs["content"] = _encode_json_body(body)
+    elif content_type == "application/x-www-form-urlencoded":
+        kwargs["data"] = dict(post_params)
+    elif content_type == "multipart/form-data":
+        # httpx generates the Content-Type with the multipart boundary
+        del headers["Content-Type"]
+        kwargs["data"] = {k: v for k, v in post_params if not isinstance(v, tuple)}
+        kwargs["files"] = [(k, v) for k, v in post_params if isinstance(v, tuple)]
+    elif isinstance(body, (str, bytes)):
+        kwargs["content"] = body
+    elif content_type == "text/plain" and isinstance(body, bool):
+        kwargs["content"] = "true" if body else "false"
+    else:
+        raise exceptions_module.ApiException(
+            status=0,
+            reason="Cannot prepare a request message for provided arguments. "
+            "Please check that your arguments match declared content type.",
+        )
+    return kwargs
+
+
+class _HTTPXResponseBase(io.IOBase):
+    def __init__(self, resp: httpx.Response) -> None:
+        self.response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data: Optional[bytes] = None
+
+    def getheaders(self) -> httpx.Headers:
+        """Returns the response headers."""
+        return self.response.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class HTTPXResponse(_HTTPXResponseBase):
+    def read(self) -> bytes:
+        if self.data is None:
+            self.data = self.response.read()
+        return self.data
+
+
+class AsyncHTTPXResponse(_HTTPXResponseBase):
+    async def read(self) -> bytes:
+        if self.data is None:
+            self.data = await self.response.aread()
+        return self.data
+
+
+class HTTPXTransport:
+    """HTTP/2 capable transport of the synchronous client, based on httpx.
+
+    Args:
+        configuration: Configuration of the generated client.
+        **client_kwargs: Overrides of the `httpx.Client` arguments.
+    """
+
+    def __init__(self, configuration: Any, **client_kwargs: Any) -> None:
+        httpx = _import_httpx()
+        self.pool_manager = httpx.Client(**{**_httpx_client_kwargs(configuration), **client_kwargs})
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> HTTPXResponse:
+        kwargs = _httpx_request_kwargs(exceptions, method, url, headers, body, post_params, _request_timeout, None)
+        return HTTPXResponse(self.pool_manager.request(**kwargs))
+
+    def close(self) -> None:
+        self.pool_manager.close()
+
+
+class AsyncHTTPXTransport:
+    """HTTP/2 capable transport of the asynchronous client, based on httpx.
+
+    Args:
+        configuration: Configuration of the generated client.
+        **client_kwargs: Overrides of the `httpx.AsyncClient` arguments.
+    """
+
+    def __init__(self, configuration: Any, **client_kwargs: Any) -> None:
+        from .generated.openapi_aclient import exceptions as aexceptions
+
+        httpx = _import_httpx()
+        self.pool_manager = httpx.AsyncClient(**{**_httpx_client_kwargs(configuration), **client_kwargs})
+        self._exceptions = aexceptions
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Optional[List[Tuple[str, Any]]] = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncHTTPXResponse:
+        # Same default as in the generated aiohttp client
+        kwargs = _httpx_request_kwargs(
+            self._exceptions, method, url, headers, body, post_params, _request_timeout, 5 * 60
+        )
+        return AsyncHTTPXResponse(await self.pool_manager.request(**kwargs))
+
+    async def close(self) -> None:
+        await self.pool_manager.aclose()
+
+
+def __getattr__(name: str) -> Any:
+    # aiohttp takes long to import, and is not needed by synchronous clients
+    if name == "AiohttpTransport":
+        from ._aiohttp_transport import AiohttpTransport
+
+        return AiohttpTransport
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,9 @@
+import importlib
+import time
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from functools import lru_cache
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncContextManager,
     AsyncIterator,
@@ -16,16 +20,66 @@ from typing import (
 from pydantic import StrictStr
 from typing_extensions import TypeAlias
 
-from .generated import openapi_aclient, openapi_client
+from .generated import openapi_client
+
+if TYPE_CHECKING:
+    from .generated import openapi_aclient
 
 T = TypeVar("T")
 
 
 ClientContextCallable: TypeAlias = Union[
-    Callable[[], ContextManager[openapi_client.ApiClient]], Callable[[], AsyncContextManager[openapi_aclient.ApiClient]]
+    Callable[[], ContextManager[openapi_client.ApiClient]],
+    Callable[[], AsyncContextManager["openapi_aclient.ApiClient"]],
 ]
 
 
+def lazy_import(module: str, name: str) -> Callable[..., Any]:
+    """Return a stand-in for the class `name` of `module`, imported when first called.
+
+    The generated API classes take long to import (and the asynchronous
+    ones import aiohttp), so the sub-APIs only import the ones they use.
+    """
+
+    @lru_cache(maxsize=None)
+    def load() -> Callable[..., Any]:
+        return getattr(importlib.import_module(module), name)
+
+    def create(*args: Any, **kwargs: Any) -> Any:
+        return load()(*args, **kwargs)
+
+    return create
+
+
+def deadline_after(timeout: Optional[float]) -> Optional[float]:
+    """Return the `time.monotonic()` deadline `timeout` seconds from now, or None without a timeout."""
+    return None if timeout is None else time.monotonic() + timeout
+
+
+class Poller:
+    """Delays between the polls of a server-side job, doubling from `interval` up to `max_interval`.
+
+    Raises TimeoutError once the (`time.monotonic()`) `deadline` is passed.
+    """
+
+    def __init__(self, description: str, interval: float, max_interval: float, deadline: Optional[float]):
+        self.description = description
+        self.interval = interval
+        self.max_interval = max_interval
+        self.deadline = deadline
+
+    def delay(self) -> float:
+        """Return the delay before the next poll, or raise TimeoutError once the deadline is passed."""
+        delay = self.interval
+        self.interval = min(self.max_interval, 2 * self.interval)
+        if self.deadline is None:
+            return delay
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"{self.description} did not finish in time")
+        return min(delay, remaining)
+
+
 # This is internal generic class only to handle duck typing of the
 # local codes' correctness.
 #
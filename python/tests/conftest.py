@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+import time
+
+
+class RecordedResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.reason = "OK"
+        self.data = None
+        self._body = body
+        self._headers = headers or {"Content-Type": "application/json"}
+
+    def getheaders(self):
+        return self._headers
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+
+class SyncRecordedResponse(RecordedResponse):
+    def read(self):
+        self.data = self._body
+        return self.data
+
+
+class AsyncRecordedResponse(RecordedResponse):
+    async def read(self):
+        self.data = self._body
+        return self.data
+
+
+EXECUTION_RESPONSE = json.dumps(
+    {"evaluator_name": "Politeness", "score": 0.5, "cost": None, "execution_log_id": "log", "justification": "ok"}
+).encode()
+
+
+def _execution(method, url, body):
+    return 200, EXECUTION_RESPONSE
+
+
+class RecordingTransport:
+    """Records the requests, and answers them with `answer(method, url, body)` after `delay(method, url, body)` seconds.
+
+    `answer` returns the status, the body (bytes, or data encoded as JSON) and optionally the headers
+    of the response; every request is answered with an evaluator execution result by default.
+    """
+
+    def __init__(self, configuration=None, *, answer=_execution, delay=None):
+        self.configuration = configuration
+        self.answer = answer
+        self.delay = delay
+        self.requests = []
+        self.closed = False
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _start(self, method, url, body):
+        with self._lock:
+            self.requests.append((method, url, body))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        return self.delay(method, url, body) if self.delay else 0
+
+    def _end(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _response(self, response_class, method, url, body):
+        status, data, *headers = self.answer(method, url, body)
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode()
+        return response_class(status, data, *headers)
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        delay = self._start(method, url, body)
+        try:
+            time.sleep(delay)
+        finally:
+            self._end()
+        return self._response(SyncRecordedResponse, method, url, body)
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    async def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        delay = self._start(method, url, body)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._end()
+        return self._response(AsyncRecordedResponse, method, url, body)
+
+    async def close(self):
+        self.closed = True
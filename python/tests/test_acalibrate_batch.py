@@ -5,8 +5,8 @@ from unittest.mock import MagicMock
 import pytest
 
 from scorable.client import Scorable
-from scorable.generated.openapi_aclient.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from scorable.generated.openapi_aclient.models.evaluator_calibration_result import EvaluatorCalibrationResult
+from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+from scorable.generated.openapi_client.models.evaluator_calibration_result import EvaluatorCalibrationResult
 from scorable.skills import ACalibrateBatchParameters
 
 
@@ -50,8 +50,6 @@ async def test_acalibrate_evaluator_batch(mock_skills_calibrate_api: Asynchronou
         ),
     ]
 
-    client = Scorable(api_key="fake", run_async=True)
-
     params = [
         ACalibrateBatchParameters(
             name="With gpt-4",
@@ -71,9 +69,10 @@ async def test_acalibrate_evaluator_batch(mock_skills_calibrate_api: Asynchronou
         ),
     ]
 
-    result = await client.evaluators.acalibrate_batch(
-        evaluator_definitions=params, test_data=[["0.4", "LLM output"], ["0.6", "LLM output 2"]]
-    )
+    async with Scorable(api_key="fake", run_async=True) as client:
+        result = await client.evaluators.acalibrate_batch(
+            evaluator_definitions=params, test_data=[["0.4", "LLM output"], ["0.6", "LLM output 2"]]
+        )
 
     assert result.rms_errors_model == {
         "gpt-4": pytest.approx(0.2499, rel=1e-3),
@@ -0,0 +1,289 @@
+import json
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pyarrow as pa
+import pyarrow.parquet
+import pytest
+
+from scorable import batch_jobs
+from scorable.batch_jobs import BatchJobError, iter_parquet, read_parquet
+from scorable.client import Scorable
+from scorable.generated.openapi_aclient.exceptions import NotFoundException as ANotFoundException
+from scorable.generated.openapi_client.exceptions import ApiException, NotFoundException
+
+from .conftest import AsyncRecordingTransport, RecordingTransport
+
+
+class JobsServer:
+    """Serves batch evaluation jobs, whose results are available after `polls` polls.
+
+    Only `capacity` jobs can be created, with the `status` of their creation.
+    """
+
+    def __init__(self, polls=2, failures=False, capacity=None, status="pending"):
+        self.polls = polls
+        self.failures = failures
+        self.capacity = capacity
+        self.status = status
+        self.jobs = {}
+
+    def _create(self, body):
+        if len(self.jobs) == self.capacity:
+            return 503, b'{"detail": "Unavailable"}'
+        request = json.loads(body)
+        job_id = f"job-{len(self.jobs)}"
+        self.jobs[job_id] = {"request": request, "polls": 0}
+        return 200, json.dumps(
+            {"job_id": job_id, "status": self.status, "total_examples": len(request["samples"])}
+        ).encode()
+
+    def _results(self, job_id, file_type):
+        if job_id not in self.jobs:
+            return 404, b'{"detail": "Batch job not found or results not available"}'
+        job = self.jobs[job_id]
+        if file_type == "failures":
+            return (200, f"PAR1 {job_id} failures".encode()) if self.failures else (404, b"{}")
+        job["polls"] += 1
+        if job["polls"] < self.polls:
+            return 404, b'{"detail": "Not found"}'
+        return 200, f"PAR1 {job_id} results".encode()
+
+    def _list(self):
+        results = [{"job_id": job_id, "created_at": "2026-01-01T00:00:00Z"} for job_id in self.jobs]
+        return 200, json.dumps({"next": None, "previous": None, "results": results}).encode()
+
+    def _route(self, method, url, body):
+        parsed = urlparse(url)
+        if method == "POST":
+            return self._create(body)
+        if parsed.path.endswith("/results/"):
+            file_type = parse_qs(parsed.query).get("file_type", ["results"])[0]
+            return self._results(parsed.path.split("/")[-3], file_type)
+        return self._list()
+
+    def answer(self, method, url, body):
+        status, data = self._route(method, url, body)
+        return status, data, {"Content-Type": "application/octet-stream"}
+
+
+SAMPLES = [{"original_input": f"Question {n}", "original_response": f"Answer {n}"} for n in range(25)]
+
+
+def test_create_splits_samples_into_jobs():
+    server = JobsServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        jobs = client.beta.batch_jobs.create(iter(SAMPLES), job_name="Nightly", samples_per_job=10)
+
+    assert [job.total_examples for job in jobs] == [10, 10, 5]
+    requests = [job["request"] for job in server.jobs.values()]
+    assert [request["job_name"] for request in requests] == ["Nightly (1)", "Nightly (2)", "Nightly (3)"]
+    assert requests[0]["samples"][0] == {
+        "kind": "input_output_pair",
+        "original_input": "Question 0",
+        "original_response": "Answer 0",
+    }
+
+
+def test_create_reads_samples_file(tmp_path):
+    path = tmp_path / "samples.jsonl"
+    path.write_text("\n".join(json.dumps(sample) for sample in SAMPLES[:3]) + "\n")
+    server = JobsServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        (job,) = client.beta.batch_jobs.create(path, job_name="Nightly", dataset_name="nightly")
+
+    assert job.total_examples == 3
+    assert server.jobs["job-0"]["request"]["job_name"] == "Nightly"
+    assert server.jobs["job-0"]["request"]["dataset_name"] == "nightly"
+
+
+def test_create_requires_samples():
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=JobsServer().answer)) as client:
+        with pytest.raises(ValueError):
+            client.beta.batch_jobs.create([])
+
+
+def test_results_waits_for_job():
+    server = JobsServer(polls=3)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        (job,) = client.beta.batch_jobs.create(SAMPLES)
+        with pytest.raises(NotFoundException):
+            client.beta.batch_jobs.results(job.job_id, wait=False)
+        with pytest.raises(TimeoutError):
+            client.beta.batch_jobs.results(job.job_id, poll_interval=0.01, timeout=0)
+
+        assert client.beta.batch_jobs.results(job.job_id, poll_interval=0) == b"PAR1 job-0 results"
+
+
+def test_results_of_unknown_job_are_not_waited_for():
+    server = JobsServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        client.beta.batch_jobs.create(SAMPLES)
+        with pytest.raises(NotFoundException):
+            client.beta.batch_jobs.results("job-mistyped", poll_interval=60)
+
+
+def test_create_reports_jobs_submitted_before_failing():
+    server = JobsServer(capacity=1)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        with pytest.raises(BatchJobError) as e:
+            client.beta.batch_jobs.create(SAMPLES, samples_per_job=10)
+
+    assert [job.job_id for job in e.value.jobs] == ["job-0"]
+    assert isinstance(e.value.__cause__, ApiException)
+
+
+def test_run_raises_for_failed_jobs(tmp_path):
+    server = JobsServer(status="failed")
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        with pytest.raises(BatchJobError) as e:
+            list(client.beta.batch_jobs.run(SAMPLES, tmp_path, poll_interval=0))
+
+    assert [job.job_id for job in e.value.jobs] == ["job-0"]
+
+
+@pytest.mark.asyncio
+async def test_aresults_of_unknown_job_are_not_waited_for():
+    server = JobsServer()
+    async with Scorable(
+        api_key="fake", run_async=True, transport=partial(AsyncRecordingTransport, answer=server.answer)
+    ) as client:
+        with pytest.raises(ANotFoundException):
+            await client.beta.batch_jobs.aresults("job-mistyped", poll_interval=60)
+
+
+def test_run_downloads_files_of_each_job(tmp_path):
+    server = JobsServer(failures=True)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        jobs = list(client.beta.batch_jobs.run(SAMPLES, tmp_path / "results", samples_per_job=20, poll_interval=0))
+        listed = [job.job_id for job in client.beta.batch_jobs.list()]
+
+    assert [job.results for job in jobs] == [
+        tmp_path / "results" / "job-0.parquet",
+        tmp_path / "results" / "job-1.parquet",
+    ]
+    assert [job.results.read_bytes() for job in jobs] == [b"PAR1 job-0 results", b"PAR1 job-1 results"]
+    assert jobs[1].failures == tmp_path / "results" / "job-1-failures.parquet"
+    assert jobs[1].failures.read_bytes() == b"PAR1 job-1 failures"
+    assert listed == ["job-0", "job-1"]
+
+
+@pytest.mark.asyncio
+async def test_arun_downloads_files_of_each_job(tmp_path):
+    server = JobsServer()
+    async with Scorable(
+        api_key="fake", run_async=True, transport=partial(AsyncRecordingTransport, answer=server.answer)
+    ) as client:
+        jobs = [
+            job async for job in client.beta.batch_jobs.arun(SAMPLES, tmp_path, samples_per_job=20, poll_interval=0)
+        ]
+        listed = [job.job_id async for job in client.beta.batch_jobs.alist()]
+
+    assert [job.job.job_id for job in jobs] == ["job-0", "job-1"]
+    assert jobs[1].results.read_bytes() == b"PAR1 job-1 results"
+    assert jobs[0].failures is None
+    assert not (tmp_path / "job-0-failures.parquet").exists()
+    assert listed == ["job-0", "job-1"]
+
+
+RESULTS = bytes(range(256)) * 12_000
+
+
+class ResultsHandler(BaseHTTPRequestHandler):
+    """Answers 404 to the first request for the results of a job, then the results.
+
+    Every job is listed.
+    """
+
+    polled = set()
+
+    def do_GET(self):
+        if "/results/" not in self.path:
+            listing = json.dumps(
+                {
+                    "next": None,
+                    "results": [{"job_id": f"job-{n}", "created_at": "2026-01-01T00:00:00Z"} for n in range(2)],
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(listing)))
+            self.end_headers()
+            self.wfile.write(listing)
+        elif self.path in self.polled:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(RESULTS)))
+            self.end_headers()
+            self.wfile.write(RESULTS)
+        else:
+            self.polled.add(self.path)
+            self.send_response(404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def results_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ResultsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_streams_file(results_server, tmp_path, monkeypatch):
+    chunks = []
+    stream = batch_jobs.iter_body
+
+    def iter_body(response, chunk_size):
+        for chunk in stream(response, chunk_size):
+            chunks.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(batch_jobs, "iter_body", iter_body)
+    path = tmp_path / "results.parquet"
+    with Scorable(api_key="fake", base_url=results_server) as client:
+        downloaded = client.beta.batch_jobs.download("job-0", path, poll_interval=0, chunk_size=4096)
+
+    assert downloaded == path
+    assert path.read_bytes() == RESULTS
+    assert max(chunks) == 4096
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.asyncio
+async def test_adownload_streams_file(results_server, tmp_path):
+    path = tmp_path / "results.parquet"
+    async with Scorable(api_key="fake", base_url=results_server, run_async=True) as client:
+        await client.beta.batch_jobs.adownload("job-1", path, poll_interval=0, chunk_size=4096)
+
+    assert path.read_bytes() == RESULTS
+
+
+def test_download_through_custom_transport(tmp_path):
+    server = JobsServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        (job,) = client.beta.batch_jobs.create(SAMPLES)
+        with pytest.raises(NotFoundException):
+            client.beta.batch_jobs.download(job.job_id, tmp_path / "failures.parquet", file_type="failures", wait=False)
+        client.beta.batch_jobs.download(job.job_id, tmp_path / "results.parquet", poll_interval=0)
+
+    assert (tmp_path / "results.parquet").read_bytes() == b"PAR1 job-0 results"
+    assert not (tmp_path / "failures.parquet").exists()
+
+
+def test_read_parquet(tmp_path):
+    path = tmp_path / "results.parquet"
+    pyarrow.parquet.write_table(pa.table({"score": [n / 10 for n in range(10)]}), path)
+
+    assert read_parquet(path).num_rows == 10
+    assert [batch.num_rows for batch in iter_parquet(path, batch_size=4)] == [4, 4, 2]
@@ -0,0 +1,146 @@
+import socket
+import time
+
+import pytest
+import urllib3
+
+from scorable.circuit_breaker import CircuitBreaker, CircuitBreakerTransport, CircuitOpenError, endpoint_of
+from scorable.client import Scorable
+from scorable.generated.openapi_aclient.exceptions import ApiException as AApiException
+from scorable.retry import RetryPolicy
+
+from .test_rate_limit import FakeClock
+from .test_retry import AsyncFlakyTransport, FlakyTransport
+
+EXECUTE_URL = "https://api.example.com/v1/evaluators/execute/evaluator-id/"
+JUDGES_URL = "https://api.example.com/v1/judges/"
+
+
+@pytest.mark.parametrize(
+    "method, path, endpoint",
+    [
+        ("POST", "/v1/evaluators/execute/4f1c2b7e-9d3a-4e8f-a6b5-0c1d2e3f4a5b/", "execute"),
+        ("POST", "/v1/judges/judge-id/batch-execute/", "execute"),
+        ("GET", "/v1/judges/", "list"),
+        ("GET", "/v1/evaluators/4f1c2b7e-9d3a-4e8f-a6b5-0c1d2e3f4a5b/", "retrieve"),
+        ("GET", "/v1/datasets/4f1c2b7e-9d3a-4e8f-a6b5-0c1d2e3f4a5b/", "datasets"),
+        ("POST", "/datasets/", "datasets"),
+        ("POST", "/v1/judges/", "other"),
+    ],
+)
+def test_endpoint_of(method, path, endpoint):
+    assert endpoint_of(method, f"https://api.example.com{path}?page_size=10") == endpoint
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(3)
+    transport = CircuitBreakerTransport(FlakyTransport(failures=[503, 500, 200, 503, 503, 503]), breaker)
+
+    statuses = [transport.request("POST", EXECUTE_URL).status for _ in range(6)]
+
+    assert statuses == [503, 500, 200, 503, 503, 503]
+    assert breaker.state("execute") == "open"
+    with pytest.raises(CircuitOpenError) as e:
+        transport.request("POST", EXECUTE_URL)
+    assert e.value.endpoint == "execute"
+    assert 0 < e.value.retry_after <= 30
+    # Other endpoints are not affected
+    assert transport.request("GET", JUDGES_URL).status == 200
+
+
+def test_connection_errors_are_failures():
+    breaker = CircuitBreaker(1)
+    inner = FlakyTransport(failures=[urllib3.exceptions.ReadTimeoutError(None, EXECUTE_URL, "Read timed out")])
+    transport = CircuitBreakerTransport(inner, breaker)
+
+    with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+        transport.request("POST", EXECUTE_URL)
+
+    assert breaker.state("execute") == "open"
+
+
+def test_half_open_circuit_probes_endpoint():
+    clock = FakeClock()
+    breaker = CircuitBreaker(1, recovery_time=10, clock=clock)
+    inner = FlakyTransport(failures=[503, 503])
+    transport = CircuitBreakerTransport(inner, breaker)
+    transport.request("POST", EXECUTE_URL)
+
+    clock.now += 10
+    assert breaker.state("execute") == "half_open"
+    assert transport.request("POST", EXECUTE_URL).status == 503
+    assert breaker.state("execute") == "open"
+
+    clock.now += 10
+    breaker.before_request("execute")
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("execute")
+    breaker.after_request("execute", False)
+    assert breaker.state("execute") == "closed"
+    assert len(inner.requests) == 2
+
+
+def test_thresholds_per_endpoint():
+    breaker = CircuitBreaker(5, thresholds={"execute": 1})
+    breaker.after_request("execute", True)
+    breaker.after_request("list", True)
+
+    assert breaker.state("execute") == "open"
+    assert breaker.state("list") == "closed"
+
+
+def test_client_fails_fast_without_retrying():
+    breaker = CircuitBreaker(2)
+    inner = FlakyTransport(failures=[503] * 5)
+    with Scorable(
+        api_key="fake",
+        transport=lambda configuration: inner,
+        circuit_breaker=breaker,
+        retry=RetryPolicy(attempts=5, backoff=0),
+    ) as client:
+        with pytest.raises(CircuitOpenError):
+            client.evaluators.run("evaluator-id", response="Hello")
+        with pytest.raises(CircuitOpenError):
+            client.evaluators.run("evaluator-id", response="Hello")
+
+    assert len(inner.requests) == 2
+
+
+def test_hanging_requests_time_out_and_open_the_circuit():
+    # Accepts connections, and never answers
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        url = f"http://127.0.0.1:{server.getsockname()[1]}"
+        breaker = CircuitBreaker(1, request_timeout=0.2)
+        with Scorable(api_key="fake", base_url=url, circuit_breaker=breaker) as client:
+            started = time.monotonic()
+            with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+                client.evaluators.run("evaluator-id", response="Hello")
+            with pytest.raises(CircuitOpenError):
+                client.evaluators.run("evaluator-id", response="Hello")
+
+    assert time.monotonic() - started < 1
+    assert breaker.state("execute") == "open"
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast():
+    breaker = CircuitBreaker(1)
+    inner = AsyncFlakyTransport(failures=[500])
+    async with Scorable(
+        api_key="fake", run_async=True, transport=lambda configuration: inner, circuit_breaker=breaker
+    ) as client:
+        with pytest.raises(AApiException):
+            await client.evaluators.arun("evaluator-id", response="Hello")
+        with pytest.raises(CircuitOpenError):
+            await client.evaluators.arun("evaluator-id", response="Hello")
+
+    assert len(inner.requests) == 1
+
+
+def test_dataset_uploads_go_through_breaker():
+    breaker = CircuitBreaker(1)
+    breaker.after_request("datasets", True)
+
+    with pytest.raises(CircuitOpenError):
+        Scorable(api_key="fake", circuit_breaker=breaker).datasets.create(name="Dataset")
@@ -1,5 +1,9 @@
+import asyncio
+import os
+
 import pytest
 
+from scorable import client as client_module
 from scorable.client import Scorable
 
 
@@ -10,3 +14,89 @@ async def test_throws_exception_when_sync_methods_used_with_async_client__fails(
 
         aclient.evaluators.get_by_name("Whoops, this is a sync method")
     assert str(e.value) == "This method is not available in asynchronous mode"
+
+
+def test_sync_client_reuses_connection_pool():
+    client = Scorable(api_key="fake")
+
+    with client.get_client_context() as first, client.get_client_context() as second:
+        assert first is second
+        pool_manager = first.rest_client.pool_manager
+
+    client.close()
+    with client.get_client_context() as third:
+        assert third is not first
+        assert third.rest_client.pool_manager is not pool_manager
+
+
+def test_sync_client_context_manager_closes_pool():
+    with Scorable(api_key="fake") as client:
+        with client.get_client_context() as api_client:
+            assert api_client.user_agent.startswith("rs-python-sdk/")
+    assert client._sync_client is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_session():
+    async with Scorable(api_key="fake", run_async=True) as client:
+        async with client.get_client_context() as first, client.get_client_context() as second:
+            assert first is second
+            session = first.rest_client.pool_manager
+            assert not session.closed
+    assert session.closed
+
+    async with client.get_client_context() as reopened:
+        assert reopened is not first
+    await client.aclose()
+
+
+def test_async_client_has_one_session_per_event_loop():
+    client = Scorable(api_key="fake", run_async=True)
+
+    async def get_api_client():
+        async with client.get_client_context() as first, client.get_client_context() as second:
+            assert first is second
+            return first
+
+    first = asyncio.run(get_api_client())
+    second = asyncio.run(get_api_client())
+    assert first is not second
+    # Sessions are closed when asyncio.run shuts the loop down
+    assert first.rest_client.pool_manager.closed
+    assert second.rest_client.pool_manager.closed
+    # ...and forgotten, so that short-lived loops do not accumulate
+    assert not client._async_clients._clients
+
+
+def test_pools_are_rebuilt_after_fork():
+    client = Scorable(api_key="fake")
+    with client.get_client_context() as parent_client:
+        pass
+
+    client_module._after_fork_in_child()
+
+    with client.get_client_context() as child_client:
+        assert child_client is not parent_client
+    with client.get_client_context() as again:
+        assert again is child_client
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_share_pool():
+    client = Scorable(api_key="fake")
+    with client.get_client_context() as parent_client:
+        parent_pool_id = id(parent_client.rest_client.pool_manager)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        with client.get_client_context() as child_client:
+            shared = child_client is parent_client
+        os.write(write_fd, b"shared" if shared else b"fresh")
+        os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 16) == b"fresh"
+    os.close(read_fd)
+    with client.get_client_context() as still_parent:
+        assert id(still_parent.rest_client.pool_manager) == parent_pool_id
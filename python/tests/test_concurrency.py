@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+from scorable.generated.openapi_client.exceptions import ApiException
+from scorable.rate_limit import RateLimitError, RequestDroppedError
+
+from .test_rate_limit import FakeClock
+
+
+def test_limit_grows_by_one_per_round():
+    limiter = AdaptiveConcurrencyLimiter(4, max_limit=6)
+
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(1.0)
+    # 1/4 + 1/4.25 + ...
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.limit == 5
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(1.0)
+    assert limiter.limit == 6
+
+
+def test_limit_shrinks_once_per_round_on_overload():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(16, clock=clock)
+    limiter.acquire()
+    limiter.release(1.0)
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+    assert limiter.limit == 8
+
+    clock.now += 1
+    limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 4
+
+
+def test_limit_shrinks_on_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(8)
+    limiter.acquire()
+    limiter.release(1.0)
+
+    limiter.acquire()
+    limiter.release(5.0)
+
+    assert limiter.limit == 4
+    assert limiter.latency == pytest.approx(1.8)
+
+
+def test_limit_bounds():
+    limiter = AdaptiveConcurrencyLimiter(2, min_limit=2, max_limit=2)
+    limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(1, min_limit=2)
+
+
+def test_slot_classifies_errors():
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    with pytest.raises(ValueError), limiter.slot():
+        raise ValueError("Invalid")
+    assert limiter.limit == 8
+
+    with pytest.raises(ApiException), limiter.slot():
+        raise ApiException(status=429)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_is_overload_error():
+    assert is_overload_error(ApiException(status=503))
+    assert is_overload_error(RateLimitError(1))
+    assert is_overload_error(RequestDroppedError(1))
+    assert is_overload_error(ConnectionResetError())
+    assert not is_overload_error(ApiException(status=404))
+    assert not is_overload_error(KeyError("score"))
+
+
+def test_threads_are_bounded_by_limit():
+    limiter = AdaptiveConcurrencyLimiter.fixed(2)
+    peak = []
+
+    def work():
+        with limiter.slot():
+            peak.append(limiter.in_flight)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_tasks_are_bounded_by_limit():
+    limiter = AdaptiveConcurrencyLimiter.fixed(2)
+    peak = []
+
+    async def work():
+        async with limiter.aslot():
+            peak.append(limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert max(peak) == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_passes_wakeup_on():
+    limiter = AdaptiveConcurrencyLimiter.fixed(1)
+    await limiter.aacquire()
+    cancelled = asyncio.ensure_future(limiter.aacquire())
+    waiting = asyncio.ensure_future(limiter.aacquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    cancelled.cancel()
+    await asyncio.wait_for(waiting, 1)
+
+    assert limiter.in_flight == 1
+
+
+def test_client_shares_limiter_with_evaluators():
+    limiter = AdaptiveConcurrencyLimiter(2)
+    client = Scorable(api_key="fake", concurrency=limiter)
+
+    assert client.evaluators.concurrency is limiter
+    assert Scorable(api_key="fake").concurrency.limit == 4
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.hedging import AsyncHedgedTransport, HedgedTransport, HedgingPolicy
+
+from .conftest import EXECUTION_RESPONSE, AsyncRecordedResponse, SyncRecordedResponse
+
+URL = "https://api.example.com/v1/judges/"
+
+
+class SlowTransport:
+    """Answers the requests after the given delays, in order; later requests are immediate."""
+
+    def __init__(self, configuration=None, delays=(1.0,)):
+        self.delays = list(delays)
+        self.requests = []
+        self.threads = []
+        self.reads = 0
+        self.discarded = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def _delay(self, method):
+        with self._lock:
+            self.requests.append(method)
+            self.threads.append(threading.current_thread())
+            return (len(self.requests), self.delays.pop(0) if self.delays else 0)
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        number, delay = self._delay(method)
+        time.sleep(delay)
+        return self._response(number)
+
+    def _response(self, number):
+        transport = self
+
+        class Response(SyncRecordedResponse):
+            def read(self):
+                transport.reads += 1
+                return super().read()
+
+            def close(self):
+                transport.discarded += 1
+
+        return Response(200, EXECUTION_RESPONSE, {"X-Request": str(number)})
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncSlowTransport(SlowTransport):
+    async def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        number, delay = self._delay(method)
+        await asyncio.sleep(delay)
+        return AsyncRecordedResponse(200, EXECUTION_RESPONSE, {"X-Request": str(number)})
+
+    async def close(self):
+        self.closed = True
+
+
+def test_slow_request_is_hedged():
+    inner = SlowTransport(delays=[0.5])
+    transport = HedgedTransport(inner, HedgingPolicy(0.01))
+    started = time.monotonic()
+
+    response = transport.request("GET", URL)
+
+    assert time.monotonic() - started < 0.4
+    assert response.getheader("X-Request") == "2"
+    assert len(inner.requests) == 2
+    # The answer of the first request is closed unread
+    time.sleep(0.6)
+    assert inner.reads == 0
+    assert inner.discarded == 1
+    transport.close()
+    assert inner.closed
+
+
+def test_fast_request_is_not_hedged():
+    inner = SlowTransport(delays=[0])
+    transport = HedgedTransport(inner, HedgingPolicy(0.5))
+
+    assert transport.request("GET", URL).getheader("X-Request") == "1"
+    assert len(inner.requests) == 1
+
+
+def test_writes_and_downloads_are_not_hedged():
+    inner = SlowTransport(delays=[0.1, 0.1])
+    transport = HedgedTransport(inner, HedgingPolicy(0.01))
+
+    transport.request("POST", URL)
+    transport.request("GET", URL, {"Accept": "application/parquet"})
+
+    assert len(inner.requests) == 2
+    assert inner.threads == [threading.current_thread()] * 2
+
+
+def test_requests_are_sent_inline_until_hedged():
+    inner = SlowTransport(delays=[0] * 3)
+    policy = HedgingPolicy(min_samples=2)
+    transport = HedgedTransport(inner, policy)
+
+    for _ in range(3):
+        transport.request("GET", URL)
+
+    # Until the delay is known, without going through the pool
+    assert inner.threads[:2] == [threading.current_thread()] * 2
+    assert inner.threads[2] is not threading.current_thread()
+    assert policy.delay() is not None
+
+
+def test_requests_are_sent_inline_when_pool_is_busy():
+    inner = SlowTransport(delays=[0.3, 0])
+    transport = HedgedTransport(inner, HedgingPolicy(1, max_workers=1))
+    busy = threading.Thread(target=transport.request, args=("GET", URL))
+    busy.start()
+    time.sleep(0.1)
+
+    transport.request("GET", URL)
+    busy.join()
+
+    assert inner.threads[1] is threading.current_thread()
+
+
+def test_hedges_are_capped_by_budget():
+    inner = SlowTransport(delays=[0.1] * 10)
+    transport = HedgedTransport(inner, HedgingPolicy(0.01, min_delay=0, budget=0, min_hedges=2))
+
+    for _ in range(4):
+        transport.request("GET", URL)
+
+    # 2 of the 4 requests are hedged
+    assert len(inner.requests) == 6
+
+
+def test_delay_is_percentile_of_latencies():
+    policy = HedgingPolicy(min_samples=10, min_delay=0)
+    assert policy.delay() is None
+
+    for latency in range(1, 101):
+        policy.record(latency / 100)
+
+    assert policy.delay() == pytest.approx(0.95)
+    assert HedgingPolicy(0.001).delay() == 0.05
+
+
+@pytest.mark.asyncio
+async def test_async_slow_request_is_hedged():
+    inner = AsyncSlowTransport(delays=[5])
+    transport = AsyncHedgedTransport(inner, HedgingPolicy(0.01))
+
+    response = await asyncio.wait_for(transport.request("GET", URL), 1)
+
+    assert response.getheader("X-Request") == "2"
+    assert len(inner.requests) == 2
+
+
+def test_client_hedges_reads():
+    inner = SlowTransport(delays=[0.5])
+    with Scorable(api_key="fake", transport=lambda configuration: inner, hedging=HedgingPolicy(0.01)) as client:
+        with client.get_client_context() as api_client:
+            assert isinstance(api_client.rest_client, HedgedTransport)
+            started = time.monotonic()
+            api_client.rest_client.request("GET", URL)
+
+    assert time.monotonic() - started < 0.4
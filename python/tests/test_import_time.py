@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous, so that slow CI machines do not fail; eager imports of the
+# generated code and HTTP stacks take hundreds of milliseconds
+IMPORT_BUDGET_US = 100_000
+
+HEAVY_MODULES = ["aiohttp", "requests", "scorable.generated"]
+
+
+def _importtime(code: str) -> dict:
+    """Run `code` with -X importtime, returning the cumulative import time (us) of each module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_scorable_is_cheap():
+    times = _importtime("import scorable")
+
+    assert times["scorable"] < IMPORT_BUDGET_US
+    assert not [module for module in times if module.startswith(tuple(HEAVY_MODULES))]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "from scorable import Scorable; Scorable(api_key='fake')",
+        "from scorable import Scorable; Scorable(api_key='fake').evaluators",
+        "import scorable.skills, scorable.judges, scorable.datasets, scorable.objectives",
+    ],
+)
+def test_sync_usage_does_not_import_aiohttp(code):
+    times = _importtime(code)
+
+    assert "aiohttp" not in times
+    assert "scorable.generated.openapi_aclient" not in times
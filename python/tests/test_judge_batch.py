@@ -0,0 +1,169 @@
+import json
+import threading
+from functools import partial
+
+import pytest
+
+from scorable.client import Scorable
+
+from .conftest import AsyncRecordingTransport, RecordingTransport
+
+JUDGE = {"id": "judge-id", "name": "Helpfulness", "version_id": "version-id"}
+
+
+class BatchServer:
+    """Serves judge batch executions, finished after `polls` polls."""
+
+    def __init__(self, polls=2):
+        self.polls = polls
+        self.batches = {}
+        self.in_progress = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _submit(self, body):
+        with self._lock:
+            batch_id = f"batch-{len(self.batches)}"
+            self.batches[batch_id] = {"inputs": json.loads(body)["inputs"], "polls": 0}
+            self.in_progress += 1
+            self.peak = max(self.peak, self.in_progress)
+        return 202, {"batch_execution_id": batch_id, "status_url": f"/v1/judges/batch-executions/{batch_id}/"}
+
+    def _item(self, index, item):
+        failed = item["response"] == "fail"
+        return {
+            "index": index,
+            "status": "failed" if failed else "completed",
+            "input": item,
+            "evaluator_results": None if failed else [{"score": 0.5}],
+            "error_message": "Evaluation failed" if failed else "",
+            "execution_log_id": None,
+            "started_at": None,
+            "completed_at": None,
+        }
+
+    def _detail(self, batch_id):
+        with self._lock:
+            batch = self.batches[batch_id]
+            batch["polls"] += 1
+            done = batch["polls"] >= self.polls
+            if done and batch["polls"] == self.polls:
+                self.in_progress -= 1
+        inputs = batch["inputs"]
+        return 200, {
+            "batch_execution_id": batch_id,
+            "status": "completed" if done else "processing",
+            "total_count": len(inputs),
+            "completed_count": len(inputs) if done else 0,
+            "failed_count": 0,
+            "created_at": None,
+            "started_at": None,
+            "completed_at": None,
+            "judge": JUDGE,
+            # The server does not promise any order
+            "items": [self._item(index, item) for index, item in reversed(list(enumerate(inputs)))] if done else [],
+        }
+
+    def answer(self, method, url, body):
+        if method == "POST":
+            return self._submit(body)
+        return self._detail(url.rstrip("/").rsplit("/", 1)[-1])
+
+
+INPUTS = [{"request": "Hi", "response": str(n)} for n in range(250)]
+
+
+def test_run_batch_splits_inputs_into_server_batches():
+    server = BatchServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        items = list(client.judges.run_batch("judge-id", iter(INPUTS), tags=["nightly"], poll_interval=0.01))
+
+    assert sorted(len(batch["inputs"]) for batch in server.batches.values()) == [50, 100, 100]
+    assert [item.index for item in items] == list(range(250))
+    assert [item.input.response for item in items] == [str(n) for n in range(250)]
+    assert server.peak == 3
+
+
+def test_run_batch_reports_failed_items():
+    server = BatchServer(polls=1)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        items = list(client.judges.run_batch("judge-id", [{"response": "fine"}, {"response": "fail"}], poll_interval=0))
+
+    assert [item.status for item in items] == ["completed", "failed"]
+    assert items[1].error_message == "Evaluation failed"
+
+
+class FlakyBatchServer(BatchServer):
+    """Fails the submission of the second batch."""
+
+    def answer(self, method, url, body):
+        if method == "POST" and json.loads(body)["inputs"][0]["response"] == "100":
+            return 503, {"detail": "Service unavailable"}
+        return super().answer(method, url, body)
+
+
+def test_run_batch_reports_failed_batches():
+    server = FlakyBatchServer(polls=1)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        items = list(client.judges.run_batch("judge-id", INPUTS, poll_interval=0))
+
+    assert [item.index for item in items] == list(range(250))
+    statuses = [item.status for item in items]
+    assert statuses == ["completed"] * 100 + ["failed"] * 100 + ["completed"] * 50
+    assert items[100].input.response == "100"
+    assert items[100].error_message.startswith("ServiceException")
+
+
+class PartialBatchServer(BatchServer):
+    """Omits the items of the "lost" inputs from the partial batches."""
+
+    def _detail(self, batch_id):
+        status, detail = super()._detail(batch_id)
+        if detail["status"] == "completed":
+            detail["status"] = "partial"
+            detail["items"] = [item for item in detail["items"] if item["input"]["response"] != "lost"]
+        return status, detail
+
+
+def test_run_batch_reports_items_missing_from_batches():
+    inputs = [{"response": "lost" if n in (3, 150) else str(n)} for n in range(200)]
+    server = PartialBatchServer(polls=1)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        items = list(client.judges.run_batch("judge-id", inputs, poll_interval=0))
+
+    assert [item.index for item in items] == list(range(200))
+    assert [item.input.response for item in items] == [item["response"] for item in inputs]
+    assert [item.index for item in items if item.status == "failed"] == [3, 150]
+    assert items[3].error_message.startswith("Missing from the items of batch execution batch-")
+
+
+def test_run_batch_limits_batches_in_progress():
+    server = BatchServer()
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        items = list(client.judges.run_batch("judge-id", INPUTS, concurrency=1, poll_interval=0))
+
+    assert len(items) == 250
+    assert server.peak == 1
+
+
+def test_run_batch_times_out():
+    server = BatchServer(polls=1000)
+    with Scorable(api_key="fake", transport=partial(RecordingTransport, answer=server.answer)) as client:
+        with pytest.raises(TimeoutError):
+            list(client.judges.run_batch("judge-id", INPUTS[:1], poll_interval=0.01, timeout=0.05))
+
+
+@pytest.mark.asyncio
+async def test_judge_arun_batch_accepts_async_iterables():
+    async def inputs():
+        for item in INPUTS:
+            yield item
+
+    server = BatchServer()
+    async with Scorable(
+        api_key="fake", run_async=True, transport=partial(AsyncRecordingTransport, answer=server.answer)
+    ) as client:
+        items = [item async for item in client.judges.arun_batch("judge-id", inputs(), poll_interval=0.01)]
+
+    assert [item.index for item in items] == list(range(250))
+    assert server.peak == 3
@@ -25,11 +25,11 @@ async def test_run_judge_by_name(mock_judges_api):
 @pytest.mark.asyncio
 @patch("scorable.judges.AJudgesApi")
 async def test_arun_judge_by_name(mock_ajudges_api):
-    client = Scorable(api_key="fake", run_async=True)
     instance = mock_ajudges_api.return_value
     instance.judges_execute_by_name_create = AsyncMock(return_value="mock_success")
 
-    result = await client.judges.arun_by_name("test_judge", response="test_response")
+    async with Scorable(api_key="fake", run_async=True) as client:
+        result = await client.judges.arun_by_name("test_judge", response="test_response")
 
     assert result == "mock_success"
     mock_ajudges_api.assert_called_once()
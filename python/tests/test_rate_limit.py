@@ -0,0 +1,278 @@
+import asyncio
+import multiprocessing
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.rate_limit import (
+    FileTokenBucket,
+    RateLimiter,
+    RateLimitError,
+    RequestDroppedError,
+    TokenBucket,
+    parse_retry_after,
+)
+from scorable.retry import RetryPolicy
+
+from .conftest import (
+    EXECUTION_RESPONSE,
+    AsyncRecordingTransport,
+    RecordingTransport,
+    SyncRecordedResponse,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(2, 2, clock=clock)
+
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.take() == 0
+    clock.now += 10
+    assert [bucket.take() for _ in range(3)] == [0, 0, pytest.approx(0.5)]
+
+
+def test_token_bucket_adjust():
+    clock = FakeClock()
+    bucket = TokenBucket(10, 10, clock=clock)
+
+    bucket.adjust(pause=3)
+    assert bucket.take() == pytest.approx(3.1)
+    clock.now += 3
+    assert bucket.take() == pytest.approx(0.1)
+
+    bucket.adjust(rate=1)
+    assert bucket.take() == pytest.approx(1)
+
+
+def test_raise_policy():
+    limiter = RateLimiter(1, policy="raise")
+    limiter.acquire()
+
+    with pytest.raises(RateLimitError) as e:
+        limiter.acquire()
+    assert 0 < e.value.retry_after <= 1
+    assert not isinstance(e.value, RequestDroppedError)
+
+
+def test_queue_policy_is_shared_between_threads():
+    limiter = RateLimiter(50, burst=1)
+    started = time.monotonic()
+
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The first token is there, the four others take 20ms each
+    assert time.monotonic() - started >= 0.07
+
+
+@pytest.mark.asyncio
+async def test_async_queue_policy():
+    limiter = RateLimiter(50, burst=1)
+    started = time.monotonic()
+
+    await asyncio.gather(*(limiter.aacquire() for _ in range(5)))
+
+    assert time.monotonic() - started >= 0.07
+
+
+def test_queue_limit():
+    limiter = RateLimiter(1, max_queue=0)
+    limiter.acquire()
+
+    with pytest.raises(RateLimitError, match="queue is full"):
+        limiter.acquire()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, policy="wait")
+
+
+def test_client_requests_go_through_limiter():
+    transports = []
+
+    def factory(configuration):
+        transports.append(RecordingTransport(configuration))
+        return transports[-1]
+
+    limiter = RateLimiter(1, policy="raise")
+    with Scorable(api_key="fake", transport=factory, rate_limit=limiter) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+        with pytest.raises(RateLimitError):
+            client.judges.run("judge-id", response="Hello")
+
+    assert len(transports[0].requests) == 1
+    assert transports[0].closed
+
+
+def test_drop_policy_fails_request_without_retrying_it():
+    transports = []
+
+    def factory(configuration):
+        transports.append(RecordingTransport(configuration))
+        return transports[-1]
+
+    limiter = RateLimiter(1, policy="drop")
+    with Scorable(api_key="fake", transport=factory, rate_limit=limiter, retry=RetryPolicy(attempts=3)) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+        with pytest.raises(RequestDroppedError) as e:
+            client.evaluators.run("evaluator-id", response="Hello")
+
+    assert e.value.retry_after == pytest.approx(1, abs=0.05)
+    assert not isinstance(e.value, RateLimitError)
+    assert len(transports[0].requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_requests_go_through_limiter():
+    limiter = RateLimiter(1, policy="raise")
+    async with Scorable(
+        api_key="fake", run_async=True, transport=AsyncRecordingTransport, rate_limit=limiter
+    ) as client:
+        await client.evaluators.arun("evaluator-id", response="Hello")
+        with pytest.raises(RateLimitError):
+            await client.evaluators.arun("evaluator-id", response="Hello")
+
+
+class HeaderTransport(RecordingTransport):
+    headers = {"Content-Type": "application/json", "RateLimit-Remaining": "0", "RateLimit-Reset": "30"}
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        super().request(method, url, headers, body, post_params, _request_timeout)
+        return SyncRecordedResponse(200, EXECUTION_RESPONSE, self.headers)
+
+
+@pytest.mark.parametrize("adaptive", [True, False])
+def test_limiter_adapts_to_rate_limit_headers(adaptive):
+    limiter = RateLimiter(100, adaptive=adaptive)
+    with Scorable(api_key="fake", transport=HeaderTransport, rate_limit=limiter) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+
+    if adaptive:
+        assert limiter.bucket.take() == pytest.approx(30, abs=0.1)
+    else:
+        assert limiter.bucket.take() == 0
+
+
+def test_dataset_uploads_adapt_to_rate_limit_headers():
+    limiter = RateLimiter(100)
+    response = mock.Mock(status_code=429, ok=False, headers={"Retry-After": "30"}, text="Too many requests")
+    with mock.patch("requests.post", return_value=response):
+        with pytest.raises(Exception, match="429"):
+            Scorable(api_key="fake", rate_limit=limiter).datasets.create(name="Dataset")
+
+    assert limiter.bucket.take() == pytest.approx(30, abs=0.1)
+
+
+def test_limiter_lowers_rate_to_remaining_budget():
+    limiter = RateLimiter(100, burst=1)
+    limiter.update(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"}.get)
+    limiter.acquire()
+
+    assert limiter.bucket.take() == pytest.approx(0.5, abs=0.05)
+
+
+def test_limiter_pauses_on_retry_after():
+    limiter = RateLimiter(100)
+    limiter.update(429, {"Retry-After": "2"}.get)
+
+    assert limiter.bucket.take() == pytest.approx(2, abs=0.05)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="FileTokenBucket requires a POSIX system")
+
+
+def _take_all(bucket, results):
+    results.put(sum(bucket.take() == 0 for _ in range(20)))
+
+
+@posix_only
+def test_file_token_bucket_is_shared_between_processes(tmp_path):
+    # Created before forking, as with gunicorn preload_app
+    bucket = FileTokenBucket(tmp_path / "bucket", rate=0.001, capacity=30)
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+
+    processes = [context.Process(target=_take_all, args=(bucket, results)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert sum(results.get() for _ in processes) == 30
+    assert bucket.take() > 0
+
+
+@posix_only
+def test_file_token_bucket_is_shared_between_instances(tmp_path):
+    first = FileTokenBucket(tmp_path / "bucket", rate=10, capacity=1)
+    second = FileTokenBucket(tmp_path / "bucket", rate=10, capacity=1)
+
+    assert first.take() == 0
+    assert second.take() == pytest.approx(0.1, abs=0.01)
+
+    second.adjust(pause=5)
+    assert first.take() == pytest.approx(5.1, abs=0.05)
+
+
+@posix_only
+def test_client_with_file_token_bucket(tmp_path):
+    bucket = FileTokenBucket(tmp_path / "bucket", rate=1, capacity=1)
+    limiter = RateLimiter(1, policy="raise", bucket=bucket)
+    with Scorable(api_key="fake", transport=RecordingTransport, rate_limit=limiter) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+    other_limiter = RateLimiter(1, policy="raise", bucket=FileTokenBucket(tmp_path / "bucket", rate=1, capacity=1))
+
+    with pytest.raises(RateLimitError):
+        other_limiter.acquire()
+
+
+@posix_only
+@pytest.mark.asyncio
+async def test_file_token_bucket_does_not_block_event_loop(tmp_path):
+    import fcntl
+    import os
+
+    limiter = RateLimiter(1, bucket=FileTokenBucket(tmp_path / "bucket", rate=1, capacity=1))
+    fd = os.open(tmp_path / "bucket", os.O_RDWR | os.O_CREAT)
+    # Another process holding the file lock
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        acquire = asyncio.create_task(limiter.aacquire())
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.5
+        assert not acquire.done()
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+    await asyncio.wait_for(acquire, 1)
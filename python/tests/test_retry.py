@@ -0,0 +1,232 @@
+import uuid
+
+import pytest
+import urllib3
+
+from scorable.client import Scorable
+from scorable.concurrency import AdaptiveConcurrencyLimiter
+from scorable.generated.openapi_client.exceptions import ApiException
+from scorable.rate_limit import RateLimiter
+from scorable.retry import AsyncRetryTransport, RetryBudget, RetryPolicy, RetryTransport, with_idempotency_key
+
+from .conftest import EXECUTION_RESPONSE, AsyncRecordedResponse, SyncRecordedResponse
+
+
+class FlakyTransport:
+    """Fails with the given statuses (or exceptions), then succeeds."""
+
+    def __init__(self, configuration=None, failures=(503,), headers=None):
+        self.failures = list(failures)
+        self.headers = headers or {}
+        self.requests = []
+        self.reads = 0
+
+    def _next(self, method, url, headers):
+        self.requests.append((method, url, dict(headers or {})))
+        failure = self.failures.pop(0) if self.failures else 200
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        status = self._next(method, url, headers)
+        return self._response(SyncRecordedResponse, status)
+
+    def _response(self, cls, status):
+        transport = self
+
+        class Response(cls):
+            def read(self):
+                transport.reads += 1
+                return super().read()
+
+        return Response(status, EXECUTION_RESPONSE, {"Content-Type": "application/json", **self.headers})
+
+    def close(self):
+        pass
+
+
+class AsyncFlakyTransport(FlakyTransport):
+    async def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        status = self._next(method, url, headers)
+        return AsyncRecordedResponse(status, EXECUTION_RESPONSE, {"Content-Type": "application/json"})
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr("scorable.retry.time.sleep", delays.append)
+    return delays
+
+
+def test_retries_with_backoff(sleeps):
+    inner = FlakyTransport(failures=[503, 502, 504])
+    transport = RetryTransport(inner, RetryPolicy(attempts=4, backoff=0.5))
+
+    response = transport.request("GET", "https://api.example.com/v1/judges/")
+
+    assert response.status == 200
+    assert len(inner.requests) == 4
+    assert inner.reads == 3
+    for retry, delay in enumerate(sleeps):
+        assert 0 <= delay <= 0.5 * 2**retry
+
+
+def test_gives_up_after_attempts(sleeps):
+    inner = FlakyTransport(failures=[503] * 5)
+    transport = RetryTransport(inner, RetryPolicy(attempts=3))
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 503
+    assert len(inner.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_honors_retry_after(sleeps):
+    inner = FlakyTransport(failures=[429], headers={"Retry-After": "7"})
+    transport = RetryTransport(inner, RetryPolicy())
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 200
+    assert sleeps == [7]
+
+
+def test_does_not_wait_for_too_long_retry_after(sleeps):
+    inner = FlakyTransport(failures=[429], headers={"Retry-After": "3600"})
+    transport = RetryTransport(inner, RetryPolicy())
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 429
+    assert sleeps == []
+
+
+def test_does_not_retry_other_statuses(sleeps):
+    inner = FlakyTransport(failures=[500])
+    transport = RetryTransport(inner, RetryPolicy())
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 500
+    assert len(inner.requests) == 1
+
+
+def test_retries_connection_errors(sleeps):
+    inner = FlakyTransport(failures=[urllib3.exceptions.ProtocolError("Connection aborted")])
+    transport = RetryTransport(inner, RetryPolicy())
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 200
+    assert len(inner.requests) == 2
+
+
+def test_post_is_only_retried_with_idempotency_key(sleeps):
+    url = "https://api.example.com/v1/evaluators/execute/evaluator-id/"
+    inner = FlakyTransport(failures=[503, 503])
+    transport = RetryTransport(inner, RetryPolicy())
+
+    assert transport.request("POST", url, {}).status == 503
+    assert transport.request("POST", url, {"Idempotency-Key": "key"}).status == 200
+    assert len(inner.requests) == 3
+
+
+def test_retry_budget():
+    budget = RetryBudget(0.5, 1)
+
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_budget_caps_retries(sleeps):
+    inner = FlakyTransport(failures=[503] * 10)
+    transport = RetryTransport(inner, RetryPolicy(attempts=10, budget=0.1, min_retries=2))
+
+    assert transport.request("GET", "https://api.example.com/v1/judges/").status == 503
+    assert len(inner.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_retries(monkeypatch):
+    import aiohttp
+
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("scorable.retry.asyncio.sleep", sleep)
+    inner = AsyncFlakyTransport(failures=[aiohttp.ServerDisconnectedError(), 503])
+    transport = AsyncRetryTransport(inner, RetryPolicy())
+
+    response = await transport.request("GET", "https://api.example.com/v1/judges/")
+
+    assert response.status == 200
+    assert len(delays) == 2
+
+
+def test_client_retries_through_rate_limiter(sleeps):
+    limiter = RateLimiter(1000)
+    transports = []
+
+    def factory(configuration):
+        transports.append(FlakyTransport(configuration, failures=[503, 503]))
+        return transports[-1]
+
+    with Scorable(api_key="fake", transport=factory, rate_limit=limiter, retry=RetryPolicy()) as client:
+        with client.get_client_context() as api_client:
+            assert isinstance(api_client.rest_client, RetryTransport)
+        # Not idempotent
+        with pytest.raises(ApiException) as e:
+            client.judges.create(name="Judge", intent="Intent")
+        assert e.value.status == 503
+
+    assert len(transports[0].requests) == 1
+
+
+def test_executions_are_retried_with_one_idempotency_key(sleeps):
+    inner = FlakyTransport(failures=[503, 503])
+    with Scorable(api_key="fake", transport=lambda configuration: inner, retry=RetryPolicy()) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+
+    keys = {headers["Idempotency-Key"] for _, _, headers in inner.requests}
+    assert len(inner.requests) == 3
+    assert len(keys) == 1
+    assert uuid.UUID(keys.pop())
+
+
+def test_idempotency_key_per_call_and_overridable():
+    inner = FlakyTransport(failures=[])
+    with Scorable(api_key="fake", transport=lambda configuration: inner) as client:
+        client.evaluators.run("evaluator-id", response="Hello")
+        client.evaluators.run("evaluator-id", response="Hello")
+        client.evaluators.run("evaluator-id", response="Hello", _idempotency_key="my-key")
+
+    keys = [headers["Idempotency-Key"] for _, _, headers in inner.requests]
+    assert keys[0] != keys[1]
+    assert keys[2] == "my-key"
+
+
+def test_with_idempotency_key():
+    assert with_idempotency_key("GET", "/v1/beta/evaluation-jobs/", None) is None
+    assert with_idempotency_key("POST", "/v1/judges/", {}) == {}
+    assert with_idempotency_key("POST", "/v1/beta/evaluation-jobs/", {"idempotency-key": "k"}) == {
+        "idempotency-key": "k"
+    }
+    headers = with_idempotency_key("POST", "/v1/judges/{judge_id}/batch-execute/", {"Accept": "*/*"})
+    assert headers is not None and set(headers) == {"Accept", "Idempotency-Key"}
+
+
+def test_retried_overloads_lower_concurrency_limit(sleeps):
+    limiter = AdaptiveConcurrencyLimiter(16)
+    transports = []
+
+    def factory(configuration):
+        transports.append(FlakyTransport(configuration, failures=[429]))
+        return transports[-1]
+
+    with Scorable(api_key="fake", transport=factory, retry=RetryPolicy(), concurrency=limiter) as client:
+        with limiter.slot():
+            client.evaluators.run("evaluator-id", response="Hello")
+
+    assert len(transports[0].requests) == 2
+    assert limiter.limit == 8
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.concurrency import AdaptiveConcurrencyLimiter
+
+from .conftest import AsyncRecordingTransport, RecordingTransport
+
+
+def _answer(method, url, body):
+    """Score the response of the request body, failing the "fail" ones."""
+    response = json.loads(body)["response"]
+    if response == "fail":
+        return 500, {"detail": "Internal error"}
+    return 200, {
+        "evaluator_name": "Politeness",
+        "score": int(response) / 10,
+        "cost": None,
+        "execution_log_id": response,
+    }
+
+
+def _delay(method, url, body):
+    """Answer the later responses faster."""
+    response = json.loads(body)["response"]
+    return 0 if response == "fail" else (10 - int(response)) / 40
+
+
+def scoring_transport(configuration=None):
+    return RecordingTransport(configuration, answer=_answer, delay=_delay)
+
+
+INPUTS = [{"response": str(n), "tags": ["nightly"]} for n in range(1, 9)] + [{"response": "fail"}]
+
+
+def test_run_many_yields_results_in_order():
+    transport = scoring_transport()
+    with Scorable(api_key="fake", transport=lambda configuration: transport) as client:
+        results = list(client.evaluators.run_many("evaluator-id", iter(INPUTS), concurrency=3))
+
+    assert [result.position for result in results] == list(range(9))
+    assert [result.result.score for result in results[:8]] == [n / 10 for n in range(1, 9)]
+    assert results[0].input == INPUTS[0]
+    assert not results[8].ok
+    assert results[8].error.status == 500
+    assert transport.peak == 3
+
+
+def test_run_many_reports_malformed_inputs():
+    with Scorable(api_key="fake", transport=scoring_transport) as client:
+        results = list(client.evaluators.run_many("evaluator-id", ["Hello", {"response": "1"}, None]))
+
+    assert [result.ok for result in results] == [False, True, False]
+    assert results[0].input == "Hello"
+    assert isinstance(results[0].error, TypeError)
+
+
+def test_run_many_yields_results_as_completed():
+    transport = scoring_transport()
+    with Scorable(api_key="fake", transport=lambda configuration: transport) as client:
+        results = list(client.evaluators.run_many("evaluator-id", INPUTS[:8], concurrency=8, ordered=False))
+
+    # The later inputs are answered faster
+    assert [result.position for result in results] == list(range(7, -1, -1))
+
+
+def test_run_many_uses_client_concurrency():
+    transport = scoring_transport()
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=2)
+    with Scorable(api_key="fake", transport=lambda configuration: transport, concurrency=limiter) as client:
+        evaluator = client.evaluators.Politeness
+        results = list(client.evaluators.run_many(evaluator, INPUTS))
+
+    assert len(results) == 9
+    assert transport.peak == 2
+
+
+def test_run_many_consumes_inputs_lazily():
+    consumed = []
+
+    def inputs():
+        for n in range(1, 100):
+            consumed.append(n)
+            yield {"response": str(n % 10)}
+
+    with Scorable(api_key="fake", transport=scoring_transport) as client:
+        results = client.evaluators.run_many("evaluator-id", inputs(), concurrency=2)
+        next(results)
+        results.close()
+
+    assert len(consumed) <= 5
+
+
+@pytest.mark.asyncio
+async def test_arun_many_accepts_async_iterables():
+    async def inputs():
+        for item in INPUTS:
+            yield item
+
+    transport = AsyncRecordingTransport(answer=_answer, delay=_delay)
+    async with Scorable(api_key="fake", run_async=True, transport=lambda configuration: transport) as client:
+        results = [result async for result in client.evaluators.arun_many("evaluator-id", inputs(), concurrency=4)]
+
+    assert [result.position for result in results] == list(range(9))
+    assert [result.ok for result in results] == [True] * 8 + [False]
+    assert transport.peak == 4
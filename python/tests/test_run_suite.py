@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.concurrency import AdaptiveConcurrencyLimiter
+from scorable.skills import Evaluators
+
+from .conftest import AsyncRecordingTransport, RecordingTransport
+
+POLITENESS_ID = Evaluators.Eval.Politeness.value
+
+
+def _evaluator_id(url):
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _answer(method, url, body):
+    evaluator_id = _evaluator_id(url)
+    if evaluator_id == "broken":
+        return 500, {"detail": "Internal error"}
+    return 200, {"evaluator_name": evaluator_id, "score": 0.5, "cost": None, "execution_log_id": evaluator_id}
+
+
+def _delay(method, url, body):
+    """Answer after 0.1 seconds, or 2 seconds for the "slow" evaluator."""
+    return 2 if _evaluator_id(url) == "slow" else 0.1
+
+
+def suite_transport(configuration=None):
+    return RecordingTransport(configuration, answer=_answer, delay=_delay)
+
+
+def test_run_suite_runs_evaluators_in_parallel():
+    transport = suite_transport()
+    with Scorable(api_key="fake", transport=lambda configuration: transport) as client:
+        started = time.monotonic()
+        results = client.evaluators.run_suite(
+            ["Politeness", client.evaluators.Clarity, "evaluator-id", "broken"], response="Hello", request="Hi"
+        )
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.3
+    assert transport.peak == 4
+    assert sorted(results) == ["Clarity", "Politeness", "evaluator-id"]
+    assert results["Politeness"].execution_log_id == POLITENESS_ID
+    assert not results.complete
+    assert results.errors["broken"].status == 500
+
+
+def test_run_suite_sends_all_evaluators_at_once():
+    transport = suite_transport()
+    evaluators = [f"evaluator-{n}" for n in range(8)]
+    # The pool of the suites starts at max_limit threads, and the limiter at 2 requests in flight
+    concurrency = AdaptiveConcurrencyLimiter(2, max_limit=4)
+    with Scorable(api_key="fake", transport=lambda configuration: transport, concurrency=concurrency) as client:
+        started = time.monotonic()
+        results = client.evaluators.run_suite(evaluators, response="Hello", timeout=0.5)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.3
+    assert transport.peak == 8
+    assert results.complete
+    assert sorted(results) == evaluators
+
+
+def test_run_suite_returns_partial_results_at_deadline():
+    transport = suite_transport()
+    with Scorable(api_key="fake", transport=lambda configuration: transport) as client:
+        started = time.monotonic()
+        results = client.evaluators.run_suite(["Politeness", "slow"], response="Hello", timeout=0.5)
+
+    assert time.monotonic() - started < 1
+    assert list(results) == ["Politeness"]
+    assert isinstance(results.errors["slow"], TimeoutError)
+
+
+def _suite_threads():
+    return {thread for thread in threading.enumerate() if thread.name.startswith("scorable-suite")}
+
+
+def test_run_suite_reuses_its_threads():
+    with Scorable(api_key="fake", transport=suite_transport) as client:
+        client.evaluators.run_suite(["Politeness", "Clarity"], response="Hello")
+        threads = _suite_threads()
+        for _ in range(5):
+            client.evaluators.run_suite(["Politeness", "Clarity"], response="Hello")
+
+        assert _suite_threads() <= threads
+
+
+def test_run_suite_rejects_duplicate_names():
+    with Scorable(api_key="fake", transport=suite_transport) as client:
+        with pytest.raises(ValueError, match="Politeness"):
+            client.evaluators.run_suite(["Politeness", client.evaluators.Politeness], response="Hello")
+
+
+@pytest.mark.asyncio
+async def test_arun_suite_cancels_unfinished_evaluators():
+    transport = AsyncRecordingTransport(answer=_answer, delay=_delay)
+    async with Scorable(api_key="fake", run_async=True, transport=lambda configuration: transport) as client:
+        results = await client.evaluators.arun_suite(["Politeness", "Clarity", "slow"], response="Hello", timeout=0.5)
+        await asyncio.sleep(0)
+
+    assert sorted(results) == ["Clarity", "Politeness"]
+    assert isinstance(results.errors["slow"], TimeoutError)
+    assert transport.peak == 3
+    assert transport.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_arun_suite_sends_all_evaluators_at_once():
+    transport = AsyncRecordingTransport(answer=_answer, delay=_delay)
+    evaluators = [f"evaluator-{n}" for n in range(8)]
+    async with Scorable(api_key="fake", run_async=True, transport=lambda configuration: transport) as client:
+        started = time.monotonic()
+        results = await client.evaluators.arun_suite(evaluators, response="Hello", timeout=0.5)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.3
+    assert transport.peak == 8
+    assert results.complete
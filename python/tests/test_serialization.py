@@ -0,0 +1,172 @@
+import datetime
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from scorable.aapi_client import AApiClient
+from scorable.api_client import ApiClient, _compile_deserializer
+from scorable.client import Scorable
+from scorable.generated import openapi_client
+from scorable.generated.openapi_aclient.configuration import Configuration as AConfiguration
+from scorable.generated.openapi_client import models
+from scorable.generated.openapi_client.configuration import Configuration
+from scorable.generated.openapi_client.models import EvaluatorExecutionResult, ExecutionLogList, Objective, StatusEnum
+from scorable.serialization import construct_model, encode_body
+
+from .conftest import AsyncRecordingTransport, RecordingTransport
+
+OBJECTIVE = {
+    "id": "objective-id",
+    "intent": "Be polite",
+    "status": "listed",
+    "test_set": [["a", "b"]],
+    "validators": [
+        {"evaluator": {"id": "evaluator-id", "name": "Politeness", "requires_contexts": False}, "threshold": 0.5},
+    ],
+    "created_at": "2024-01-02T03:04:05.123456Z",
+    "owner": {"email": "owner@example.com", "full_name": "Owner"},
+    "version_id": "version-id",
+    "_meta": {"key": "value"},
+}
+
+EXECUTION_LOG = {
+    "cost": 0.1,
+    "created_at": "2024-01-02T03:04:05+02:00",
+    "evaluation_context": None,
+    "executed_item_id": "evaluator-id",
+    "executed_item_name": "Politeness",
+    "executed_item_version_id": None,
+    "execution_type": "skill",
+    "id": "log-id",
+    "llm_output": "output",
+    "owner": {"email": "owner@example.com", "full_name": "Owner"},
+    "score": 0.5,
+    "tags": ["a"],
+    "variables": {"a": "b"},
+}
+
+
+@pytest.mark.parametrize("klass, data", [(Objective, OBJECTIVE), (ExecutionLogList, EXECUTION_LOG)])
+def test_construct_model_matches_from_dict(klass, data):
+    validated = klass.from_dict(data)
+    constructed = construct_model(klass, data)
+
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.to_dict() == validated.to_dict()
+
+
+def test_construct_model_converts_nested_types():
+    objective = construct_model(Objective, OBJECTIVE)
+
+    assert objective.status is StatusEnum.LISTED
+    assert objective.created_at == datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc)
+    assert objective.validators[0].evaluator.name == "Politeness"
+    assert objective.owner.full_name == "Owner"
+    assert objective.meta == {"key": "value"}
+
+
+def test_construct_model_does_not_validate():
+    invalid = {**EXECUTION_LOG, "score": "high"}
+
+    with pytest.raises(ValidationError):
+        ExecutionLogList.from_dict(invalid)
+    assert construct_model(ExecutionLogList, invalid).score == "high"
+
+
+@pytest.mark.parametrize("trusted_responses", [False, True])
+def test_trusted_responses(trusted_responses, monkeypatch):
+    if trusted_responses:
+        monkeypatch.setattr(EvaluatorExecutionResult, "from_dict", None)
+
+    with Scorable(api_key="fake", transport=RecordingTransport, trusted_responses=trusted_responses) as client:
+        result = client.evaluators.run("evaluator-id", response="Hello")
+        with client.get_client_context() as api_client:
+            assert api_client.trusted_responses is trusted_responses
+
+    assert result.score == 0.5
+    assert result.execution_log_id == "log"
+
+
+@pytest.mark.parametrize(
+    "response_type, data",
+    [
+        ("Objective", OBJECTIVE),
+        ("List[Objective]", [OBJECTIVE, OBJECTIVE]),
+        ("Dict[str, ExecutionLogList]", {"a": EXECUTION_LOG, "b": None}),
+        ("List[Dict[str, int]]", [{"a": 1}, {"b": "2"}]),
+        ("StatusEnum", "public"),
+        ("datetime", "2024-01-02T03:04:05Z"),
+        ("date", "2024-01-02"),
+        ("object", {"any": ["thing"]}),
+        ("str", None),
+    ],
+)
+@pytest.mark.parametrize("trusted_responses", [False, True])
+def test_deserialize_matches_generated_client(response_type, data, trusted_responses):
+    generated = openapi_client.ApiClient(Configuration())
+    client = ApiClient(Configuration(), trusted_responses=trusted_responses)
+    body = json.dumps(data)
+
+    assert client.deserialize(body.encode(), response_type) == generated.deserialize(body, response_type)
+
+
+def test_deserializers_are_compiled_once():
+    client = ApiClient(Configuration())
+    client.deserialize(b"[]", "List[Objective]")
+    misses = _compile_deserializer.cache_info().misses
+
+    result = client.deserialize(json.dumps([OBJECTIVE] * 3).encode(), "List[Objective]")
+
+    assert [objective.id for objective in result] == ["objective-id"] * 3
+    assert _compile_deserializer.cache_info().misses == misses
+
+
+def test_clients_share_models():
+    client = AApiClient(AConfiguration(), transport=AsyncRecordingTransport(None))
+
+    assert client.deserialize(json.dumps(OBJECTIVE).encode(), "Objective").__class__ is Objective
+
+
+@pytest.mark.parametrize(
+    "client",
+    [ApiClient(Configuration()), AApiClient(AConfiguration(), transport=AsyncRecordingTransport(None))],
+)
+def test_deserialize_errors(client):
+    with pytest.raises(client._exceptions.ApiException):
+        client.deserialize(b'"unknown"', "StatusEnum")
+    with pytest.raises(client._exceptions.ApiException):
+        client.deserialize(b'"not a date"', "datetime")
+
+
+REQUEST_BODIES = [
+    models.EvaluatorExecutionRequest(response="Hello", contexts=["a", "b"]),
+    models.EvaluatorExecutionRequest(response="Hello", expected_output=None, evaluator_version_id="version-id"),
+    models.EvaluatorRequest(
+        name="Politeness",
+        objective_id="objective-id",
+        prompt="Is {{response}} polite?",
+        status=models.StatusEnum.LISTED,
+        evaluator_demonstrations=[models.EvaluatorDemonstrationsRequest(response="Hi", score=0.5)],
+        input_variables=[models.InputVariableRequest(name="response")],
+        model_params=models.ModelParamsRequest(temperature=0),
+        models=["gpt-4o"],
+        reference_variables=None,
+    ),
+    models.JudgeBatchExecutionRequest(
+        inputs=[models.JudgeBatchExecutionInputRequest(response=str(i), contexts=["context"] * i) for i in range(3)],
+        tags=["tag"],
+    ),
+    models.JudgeRequest(name="Judge", intent="Be polite", status=models.StatusEnum.PUBLIC),
+    # Falsy values of untyped containers are kept, unlike falsy models
+    models.ModelTestResponse(success=True, model="gpt-4o", usage={"tokens": 0, "note": "", "cached": False}),
+    {"objective": models.ObjectiveRequest(intent="Be polite"), "at": datetime.date(2024, 1, 2), "ids": ("a", "b")},
+]
+
+
+@pytest.mark.parametrize("body", REQUEST_BODIES)
+def test_encode_body_matches_generated_client(body):
+    generated = openapi_client.ApiClient(Configuration())
+
+    assert json.loads(encode_body(body)) == json.loads(json.dumps(generated.sanitize_for_serialization(body)))
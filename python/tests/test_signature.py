@@ -3,6 +3,7 @@ from functools import partial
 
 import pytest
 
+from scorable.batch_jobs import BatchJobs
 from scorable.execution_logs import ExecutionLogs
 from scorable.judges import AJudge, Judge, Judges
 from scorable.models import Models
@@ -36,7 +37,7 @@ def _get_method_info(method):
 
 @pytest.mark.parametrize(
     "class_type",
-    [Models, ExecutionLogs, Objectives, Evaluators, Judges],
+    [Models, ExecutionLogs, Objectives, Evaluators, Judges, BatchJobs],
 )
 def test_sync_async_methods_match(class_type):
     """Test that sync and async versions of methods have matching signatures and docs."""
@@ -88,7 +89,7 @@ def test_sync_async_methods_match(class_type):
 )
 def test_wrapper_classes_sync_async_methods_match(sync_class, async_class):
     """Test that sync and async versions of wrapper classes have matching signatures and docs."""
-    included_methods = {"run", "get", "versions", "evaluate"}  # List of methods we want to verify
+    included_methods = {"run", "run_batch", "get", "versions", "evaluate"}  # List of methods we want to verify
 
     sync_methods = {name for name in dir(sync_class) if name in included_methods}
 
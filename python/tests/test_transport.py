@@ -0,0 +1,208 @@
+import json
+import ssl
+
+import pytest
+import urllib3
+
+from scorable import serialization
+from scorable.client import Scorable
+from scorable.transport import AiohttpTransport, URLLib3Transport, get_ssl_context
+
+from .conftest import EXECUTION_RESPONSE, AsyncRecordingTransport, RecordingTransport
+
+
+def test_ssl_contexts_are_shared():
+    assert get_ssl_context() is get_ssl_context()
+
+    unverified = get_ssl_context(verify=False)
+    assert unverified is not get_ssl_context()
+    assert unverified.verify_mode == ssl.CERT_NONE
+    assert not unverified.check_hostname
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_ssl_context():
+    first = Scorable(api_key="fake", run_async=True)
+    second = Scorable(api_key="fake", run_async=True)
+    async with first, second:
+        async with first.get_client_context() as first_client, second.get_client_context() as second_client:
+            assert isinstance(first_client.rest_client, AiohttpTransport)
+            first_connector = first_client.rest_client.pool_manager.connector
+            second_connector = second_client.rest_client.pool_manager.connector
+            assert first_connector is not second_connector
+            assert first_connector._ssl is second_connector._ssl is get_ssl_context()
+
+
+def _mock_execution_handler(requests):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "evaluator_name": "Politeness",
+                "score": 0.5,
+                "cost": None,
+                "execution_log_id": "log",
+                "justification": "ok",
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_http2_transport_executes_evaluator():
+    from scorable.api_client import ApiClient
+    from scorable.generated.openapi_client.configuration import Configuration
+    from scorable.transport import HTTPXTransport
+
+    requests = []
+    config = Configuration(host="https://api.example.com")
+    transport = HTTPXTransport(config, transport=_mock_execution_handler(requests))
+    client = Scorable(api_key="fake", _api_client=ApiClient(config, transport=transport))
+
+    result = client.evaluators.run("evaluator-id", response="Hello")
+
+    assert result.score == 0.5
+    (request,) = requests
+    assert request.method == "POST"
+    assert request.url == "https://api.example.com/v1/evaluators/execute/evaluator-id/"
+    assert json.loads(request.content)["response"] == "Hello"
+    transport.close()
+
+
+@pytest.mark.asyncio
+async def test_async_http2_transport_executes_evaluator():
+    from scorable.aapi_client import AApiClient
+    from scorable.generated.openapi_aclient.configuration import Configuration
+    from scorable.transport import AsyncHTTPXTransport
+
+    requests = []
+    config = Configuration(host="https://api.example.com")
+    transport = AsyncHTTPXTransport(config, transport=_mock_execution_handler(requests))
+    client = Scorable(api_key="fake", run_async=True, _api_client=AApiClient(config, transport=transport))
+
+    result = await client.evaluators.arun("evaluator-id", response="Hello")
+
+    assert result.execution_log_id == "log"
+    assert requests[0].headers["Content-Type"] == "application/json"
+    await transport.close()
+
+
+def test_http2_flag_selects_httpx_transport():
+    pytest.importorskip("h2")
+    from scorable.transport import HTTPXTransport
+
+    with Scorable(api_key="fake", http2=True) as client:
+        with client.get_client_context() as api_client:
+            assert isinstance(api_client.rest_client, HTTPXTransport)
+
+
+def test_custom_transport():
+    transports = []
+
+    def factory(configuration):
+        transports.append(RecordingTransport(configuration))
+        return transports[-1]
+
+    with Scorable(api_key="fake", base_url="https://api.example.com", transport=factory) as client:
+        assert client.evaluators.run("evaluator-id", response="Hello").score == 0.5
+        assert client.evaluators.run("evaluator-id", response="Again").score == 0.5
+
+    (transport,) = transports
+    assert transport.configuration.host == "https://api.example.com"
+    assert [(method, url, json.loads(body)["response"]) for method, url, body in transport.requests] == [
+        ("POST", "https://api.example.com/v1/evaluators/execute/evaluator-id/", "Hello"),
+        ("POST", "https://api.example.com/v1/evaluators/execute/evaluator-id/", "Again"),
+    ]
+    assert transport.closed
+
+
+@pytest.mark.asyncio
+async def test_async_custom_transport():
+    transports = []
+
+    def factory(configuration):
+        transports.append(AsyncRecordingTransport(configuration))
+        return transports[-1]
+
+    async with Scorable(api_key="fake", run_async=True, transport=factory) as client:
+        result = await client.evaluators.arun("evaluator-id", response="Hello")
+
+    assert result.execution_log_id == "log"
+    (transport,) = transports
+    assert transport.requests[0][0] == "POST"
+    assert transport.closed
+
+
+def test_http2_and_transport_are_exclusive():
+    with pytest.raises(ValueError):
+        Scorable(api_key="fake", http2=True, transport=RecordingTransport)
+
+
+@pytest.fixture(params=["orjson", "msgspec", "json"])
+def json_backend(request):
+    try:
+        serialization._select_backend(request.param)
+    except ValueError:
+        pytest.skip(f"{request.param} is not installed")
+    yield request.param
+    serialization._select_backend()
+
+
+def test_json_backends(json_backend):
+    assert serialization.JSON_BACKEND == json_backend
+    encoded = serialization.json_dumps({"response": "Hyvää päivää", "score": 0.5})
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == {"response": "Hyvää päivää", "score": 0.5}
+    assert serialization.json_loads(encoded) == serialization.json_loads(encoded.decode()) == json.loads(encoded)
+    with pytest.raises(ValueError):
+        serialization.json_loads(b"not json")
+
+
+def test_urllib3_transport_encodes_json_to_bytes(json_backend, monkeypatch):
+    requests = []
+
+    def request(method, url, body=None, **kwargs):
+        requests.append((method, url, body))
+        return urllib3.HTTPResponse(
+            body=EXECUTION_RESPONSE, status=200, headers={"Content-Type": "application/json"}, preload_content=False
+        )
+
+    def factory(configuration):
+        transport = URLLib3Transport(configuration)
+        monkeypatch.setattr(transport.pool_manager, "request", request)
+        return transport
+
+    with Scorable(api_key="fake", transport=factory) as client:
+        result = client.evaluators.run("evaluator-id", response="Hello")
+
+    assert result.justification == "ok"
+    ((method, _, body),) = requests
+    assert method == "POST"
+    assert isinstance(body, bytes)
+    assert json.loads(body)["response"] == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_encodes_json_to_bytes(json_backend):
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    bodies = []
+
+    async def handler(request):
+        bodies.append((request.content_type, await request.read()))
+        return web.Response(body=EXECUTION_RESPONSE, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/v1/evaluators/execute/{id}/", handler)
+    async with TestServer(app) as server:
+        async with Scorable(api_key="fake", run_async=True, base_url=str(server.make_url(""))) as client:
+            result = await client.evaluators.arun("evaluator-id", response="Hello")
+
+    assert result.score == 0.5
+    ((content_type, body),) = bodies
+    assert content_type == "application/json"
+    assert json.loads(body)["response"] == "Hello"